@@ -0,0 +1,45 @@
+"""Benchmark instantiating a model many times.
+
+Compares walking the AST of the body of the model on each instantiation
+against running the closures compiled by `OneModelCompiler`. The code is
+parsed once, so only the evaluation is measured.
+
+Usage: python benchmarks/bench_compiler.py
+"""
+import time
+
+from bench_sbml_export import create_model
+
+N_INSTANCES = 10000
+
+
+def instantiate(m, n):
+    model = m["ProteinInduced"]
+
+    start = time.perf_counter()
+
+    for i in range(n):
+        m[f"p{i}"] = model.call(m, [])
+
+    return time.perf_counter() - start
+
+
+def main():
+    m = create_model(0)
+    walker = m["ProteinInduced"].walker
+
+    # Evaluate the bodies with the walker, as before they were compiled.
+    walker.execute = lambda node, scope: walker.walk(node)
+    walked = instantiate(m, N_INSTANCES)
+    del walker.execute
+
+    m = create_model(0)
+    compiled = instantiate(m, N_INSTANCES)
+
+    for name, elapsed in [("walker", walked), ("compiled", compiled)]:
+        print(f"{N_INSTANCES} x ProteinInduced() {name:<10} {elapsed * 1e3:8.1f} ms"
+              f" ({N_INSTANCES / elapsed:,.0f} instances/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark the "debug" and "release" SBML export modes.
+
+"debug" raises on the first libsbml error, while "release" collects the
+status codes and checks them once at the end of the export.
+
+Usage: python benchmarks/bench_export_mode.py
+"""
+import timeit
+
+from bench_sbml_export import create_model
+from onemodel.utils.check import check, deferred_checks
+
+
+def bench_check():
+    fullname = "p0__protein"
+
+    def fail_fast_fstring():
+        check(0, f"set species {fullname} id")
+
+    def fail_fast():
+        check(0, "set species {} id", fullname)
+
+    def deferred():
+        with deferred_checks():
+            for _ in range(1000):
+                check(0, "set species {} id", fullname)
+
+    for name, func, number in [
+        ("check with f-string", fail_fast_fstring, 1000),
+        ("check with lazy message", fail_fast, 1000),
+        ("deferred check", deferred, 1),
+    ]:
+        best = min(timeit.repeat(func, repeat=5, number=number)) / 1000
+        print(f"{name:<24} {best * 1e9:8.1f} ns")
+
+
+def main():
+    bench_check()
+
+    for n in [100, 1000]:
+        m = create_model(n)
+
+        for backend in ["libsbml", "xml"]:
+            for mode in ["debug", "release"]:
+                elapsed = min(timeit.repeat(
+                    lambda: m.get_SBML_string(backend=backend, mode=mode),
+                    repeat=5,
+                    number=1,
+                ))
+                print(f"{n:<5} instances {backend:<8} {mode:<8} {elapsed * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
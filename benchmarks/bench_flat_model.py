@@ -0,0 +1,36 @@
+"""Benchmark building a FlatModel and exporting it into SBML.
+
+Usage: python benchmarks/bench_flat_model.py
+"""
+import timeit
+import tracemalloc
+
+from bench_sbml_export import create_model
+from onemodel.flat_model import FlatModel
+
+
+def main():
+    for n in [100, 1000]:
+        m = create_model(n)
+
+        # Fill the formula caches before measuring the memory.
+        FlatModel.from_onemodel(m)
+
+        tracemalloc.start()
+        flat_model = FlatModel.from_onemodel(m)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        for name, func in [
+            ("FlatModel.from_onemodel", lambda: FlatModel.from_onemodel(m)),
+            ("OneModel.get_SBML_string", lambda: m.get_SBML_string(backend="xml")),
+            ("FlatModel.get_SBML_string", lambda: flat_model.get_SBML_string("xml")),
+        ]:
+            elapsed = min(timeit.repeat(func, repeat=3, number=1))
+            print(f"{n:<5} instances {name:<26} {elapsed * 1e3:10.1f} ms")
+
+        print(f"{n:<5} instances {'FlatModel memory':<26} {size / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark the import time of OneModel with `python -X importtime`.
+
+Prints the cumulative import time of each command and the slowest imported
+modules, so regressions in the startup time are easy to spot.
+
+Usage: python benchmarks/bench_import_time.py
+"""
+import subprocess
+import sys
+
+COMMANDS = [
+    "import onemodel",
+    "import onemodel.__main__",
+    "import onemodel.onemodel_walker",
+    "import onemodel.onemodel_walker, libsbml",
+]
+
+
+def importtime(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue
+
+    return times
+
+
+def main():
+    for code in COMMANDS:
+        times = importtime(code)
+        top_level = {name: t for name, t in times.items() if "." not in name}
+
+        print(f"{code:<44} {sum(top_level.values()) / 1000:10.1f} ms")
+
+        slowest = sorted(top_level.items(), key=lambda item: -item[1])[:3]
+        for name, t in slowest:
+            print(f"    {name:<40} {t / 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
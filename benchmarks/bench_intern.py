@@ -0,0 +1,85 @@
+"""Benchmark interning the names, dotted names and formulas of a model.
+
+Measures with `tracemalloc` the memory allocated by walking a parsed model
+whose statements repeat the same names and formulas, and by flattening a
+model with many instances (see `FlatModel`), with and without interning
+(see `onemodel.utils.intern_name`). The parsing is not measured.
+
+Usage: python benchmarks/bench_intern.py
+"""
+import gc
+import tracemalloc
+
+from bench_sbml_export import create_model
+from onemodel import compiler, onemodel_walker, scope
+from onemodel.flat_model import FlatModel
+from onemodel.onemodel_walker import OneModelWalker
+
+N_STATEMENTS = 500
+N_INSTANCES = 1000
+MODULES = [compiler, onemodel_walker, scope]
+
+
+def create_code(n):
+    code = "model Gene\n  species mRNA, protein\nend\ng = Gene()\nparameter k_m, d_m\n"
+
+    for i in range(n):
+        code += f"reaction J{i}: g.mRNA -> g.protein; k_m * g.mRNA / (d_m + g.mRNA)\n"
+        code += f"rule R{i}: g.protein := k_m * g.mRNA\n"
+
+    return code
+
+
+def measure(function):
+    gc.collect()
+    tracemalloc.start()
+
+    result = function()
+
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return current, result
+
+
+def walk(ast):
+    walker = OneModelWalker()
+    walker.walk(ast)
+
+    return walker.onemodel
+
+
+def flatten(n):
+    m = create_model(0)
+    model = m["ProteinInduced"]
+
+    for i in range(n):
+        m[f"p{i}"] = model.call(m, [])
+
+    return measure(lambda: FlatModel.from_onemodel(m))[0]
+
+
+def main():
+    ast = OneModelWalker().parser.parse(create_code(N_STATEMENTS))
+    intern_name = onemodel_walker.intern_name
+
+    # Imports the modules and fills the caches used by the export.
+    flatten(1)
+    walk(ast)
+
+    for enabled in [False, True]:
+        for module in MODULES:
+            module.intern_name = intern_name if enabled else (lambda value: value)
+
+        label = "interned" if enabled else "not interned"
+
+        walked, _ = measure(lambda: walk(ast))
+        print(f"walk {2 * N_STATEMENTS} statements   {label:<13} {walked / 2**20:7.2f} MiB")
+
+        flattened = flatten(N_INSTANCES)
+        print(f"flatten {N_INSTANCES} instances  {label:<13} {flattened / 2**20:7.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark instantiating models from their prototype.
+
+Compares evaluating the body of a model on every instantiation against
+cloning the prototype of its first instance (see `onemodel.prototype`).
+As with `timeit`, the garbage collector is disabled while measuring, and
+the best of 3 runs is reported.
+
+Usage: python benchmarks/bench_prototype.py
+"""
+import gc
+import time
+
+from bench_sbml_export import create_model
+from onemodel.prototype import ModelPrototype
+
+N_INSTANCES = 5000
+
+
+def instantiate(name, n):
+    m = create_model(0)
+    model = m[name]
+
+    gc.disable()
+    start = time.perf_counter()
+
+    for i in range(n):
+        m[f"p{i}"] = model.call(m, [])
+
+    elapsed = time.perf_counter() - start
+    gc.enable()
+
+    return elapsed
+
+
+def main():
+    create = ModelPrototype.create
+
+    for name in ["ProteinConstitutive", "ProteinInduced"]:
+        ModelPrototype.create = lambda *args: None
+        before = min(instantiate(name, N_INSTANCES) for _ in range(3))
+
+        ModelPrototype.create = create
+        after = min(instantiate(name, N_INSTANCES) for _ in range(3))
+
+        for label, elapsed in [("body", before), ("prototype", after)]:
+            print(f"{N_INSTANCES} x {name + '()':<22} {label:<10} {elapsed * 1e3:8.1f} ms"
+                  f" ({N_INSTANCES / elapsed:,.0f} instances/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark getting a libsbml.SBMLDocument of a model.
+
+Compares reading back the string of `get_SBML_string` with libsbml against
+`to_SBML_document`, which returns the document directly, and then against
+patching one parameter of a kept document with `set_SBML_values`.
+
+Usage: python benchmarks/bench_sbml_document.py
+"""
+import timeit
+
+import libsbml
+
+from bench_sbml_export import create_model
+
+
+def main():
+    for n in [100, 1000]:
+        m = create_model(n)
+
+        def round_trip():
+            return libsbml.readSBMLFromString(m.get_SBML_string())
+
+        for name, func in [
+            ("string round-trip", round_trip),
+            ("to_SBML_document", m.to_SBML_document),
+        ]:
+            elapsed = min(timeit.repeat(func, repeat=3, number=1))
+            print(f"{n:<5} instances {name:<18} {elapsed * 1e3:10.1f} ms")
+
+        m.to_SBML_document(keep=True)
+
+        def patch():
+            m.set_SBML_values({"p0.k_p": 2})
+
+        elapsed = min(timeit.repeat(patch, repeat=3, number=100)) / 100
+        print(f"{n:<5} instances {'set_SBML_values':<18} {elapsed * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
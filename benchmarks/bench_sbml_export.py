@@ -0,0 +1,56 @@
+"""Benchmark the SBML export of a model with many instances.
+
+Usage: python benchmarks/bench_sbml_export.py
+"""
+import os
+import time
+import timeit
+
+from onemodel.onemodel_walker import OneModelWalker
+from onemodel.sbml_cache import SBMLFragmentCache
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+
+def create_model(n):
+    # The imports of the example are relative to its directory.
+    os.chdir(EXAMPLES_DIR)
+
+    with open("ex05_protein_induced.one") as file:
+        code = file.read()
+
+    code += "".join(f"p{i} = ProteinInduced()\n" for i in range(n))
+
+    walker = OneModelWalker()
+    walker.run(code)
+
+    return walker.onemodel
+
+
+def main():
+    for n in [10, 100, 1000]:
+        m = create_model(n)
+
+        for backend in ["libsbml", "xml"]:
+            elapsed = min(timeit.repeat(
+                lambda: m.get_SBML_string(backend=backend), repeat=3, number=1
+            ))
+            print(f"{n:<5} instances {backend:<12} {elapsed * 1e3:10.1f} ms")
+
+        # Re-export after changing one parameter, reusing the other objects.
+        cache = SBMLFragmentCache()
+        m.get_SBML_string(backend="xml", cache=cache)
+        m["p0"]["k_p"]["value"] = 2
+        cache.reset_stats()
+
+        start = time.perf_counter()
+        m.get_SBML_string(backend="xml", cache=cache)
+        elapsed = time.perf_counter() - start
+
+        ratio = cache.stats()["total"]["ratio"]
+        print(f"{n:<5} instances {'incremental':<12} {elapsed * 1e3:10.1f} ms"
+              f" (reuse ratio {ratio:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Benchmark Scope.get_fullname with namespaces nested at different depths.
+
+Usage: python benchmarks/bench_scope.py
+"""
+import timeit
+
+from onemodel.namespace import Namespace
+from onemodel.scope import Scope
+
+NAMES = [f"name_{i}" for i in range(100)]
+
+
+def create_scope(depth):
+    scope = Scope()
+    scope.push(Namespace(), "")
+
+    for i in range(depth):
+        scope.push(Namespace(), f"level_{i}")
+
+    for name in NAMES:
+        scope[name] = 0
+
+    return scope
+
+
+def main():
+    for depth in [1, 10, 50, 100]:
+        scope = create_scope(depth)
+
+        def lookup():
+            for name in NAMES:
+                scope.get_fullname(name)
+
+        best = min(timeit.repeat(lookup, repeat=5, number=100)) / 100 / len(NAMES)
+        print(f"depth {depth:<4} get_fullname {best * 1e9:10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark warm-starting a model from a snapshot.
+
+Compares evaluating a file with many instances against loading the
+snapshot saved from it.
+
+Usage: python benchmarks/bench_snapshot.py
+"""
+import os
+import shutil
+import tempfile
+import timeit
+
+from bench_sbml_export import EXAMPLES_DIR
+from onemodel.onemodel_walker import load_file
+from onemodel.snapshot import load_snapshot
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The imports of the example are relative to its directory.
+        for name in ["ex03_protein_constitutive.one", "ex05_protein_induced.one"]:
+            shutil.copy(os.path.join(EXAMPLES_DIR, name), tmp_dir)
+
+        os.chdir(tmp_dir)
+
+        with open("ex05_protein_induced.one") as file:
+            code = file.read()
+
+        for n in [10, 100, 1000]:
+            filename = os.path.join(tmp_dir, f"model_{n}.one")
+            path = os.path.join(tmp_dir, f"model_{n}.snapshot")
+
+            with open(filename, "w") as file:
+                file.write(code + "".join(f"p{i} = ProteinInduced()\n" for i in range(n)))
+
+            load_file(filename).save_snapshot(path)
+
+            evaluate = min(timeit.repeat(lambda: load_file(filename), repeat=3, number=1))
+            load = min(timeit.repeat(lambda: load_snapshot(path), repeat=3, number=1))
+            size = os.path.getsize(path)
+
+            print(f"{n:<5} instances evaluate {evaluate * 1e3:10.1f} ms"
+                  f"   snapshot {load * 1e3:8.1f} ms ({size / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
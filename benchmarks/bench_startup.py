@@ -0,0 +1,63 @@
+"""Benchmark the startup time of OneModelWalker.
+
+Compares the time needed to get the parser of the OneModel grammar when:
+
+* compiling the grammar with tatsu (no cache),
+* unpickling it from the disk cache (cold process),
+* taking it from the in-memory cache (warm process),
+* importing the pre-generated parser (`onemodel.onemodel_parser`).
+
+Usage: python benchmarks/bench_startup.py
+"""
+import os
+import tempfile
+import timeit
+
+import tatsu
+
+from onemodel import grammar
+from onemodel.onemodel_walker import OneModelWalker
+
+REPEAT = 5
+
+
+def bench(label, func, number=1):
+    times = timeit.repeat(func, repeat=REPEAT, number=number)
+    best = min(times) / number
+    print(f"{label:<32} {best * 1000:10.3f} ms")
+    return best
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["ONEMODEL_CACHE_DIR"] = cache_dir
+
+        text = grammar.read_grammar()
+
+        compile_time = bench(
+            "tatsu.compile", lambda: tatsu.compile(text, asmodel=True)
+        )
+
+        grammar.get_parser(generated=False)
+
+        def cold():
+            grammar.clear_parser_cache()
+            grammar.get_parser(generated=False)
+
+        def cold_generated():
+            grammar.clear_parser_cache()
+            grammar.get_parser()
+
+        disk_time = bench("get_parser (disk cache)", cold)
+        generated_time = bench("get_parser (generated)", cold_generated)
+        memory_time = bench("get_parser (memory cache)", grammar.get_parser, 1000)
+        bench("OneModelWalker()", OneModelWalker, 100)
+
+    print()
+    print(f"disk cache speed-up:   {compile_time / disk_time:10.1f}x")
+    print(f"generated speed-up:    {compile_time / generated_time:10.1f}x")
+    print(f"memory cache speed-up: {compile_time / memory_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
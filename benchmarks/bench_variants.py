@@ -0,0 +1,40 @@
+"""Benchmark writing variants of a model with different parameter values.
+
+Compares exporting the whole model again for each variant against
+`export_variants`, which patches the values of one SBML document.
+
+Usage: python benchmarks/bench_variants.py
+"""
+import tempfile
+import time
+
+from bench_sbml_export import create_model
+from onemodel.export import export_variants
+
+N_INSTANCES = 100
+N_VARIANTS = 100
+
+
+def main():
+    m = create_model(N_INSTANCES)
+    variants = [(str(i), {"p0.k_p": i}) for i in range(N_VARIANTS)]
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+
+        for name, values in variants:
+            m["p0"]["k_p"]["value"] = values["p0.k_p"]
+            m.export_SBML(f"{output_dir}/{name}.xml")
+
+        elapsed = time.perf_counter() - start
+        print(f"{N_VARIANTS} variants   re-export        {elapsed * 1e3:10.1f} ms")
+
+        for jobs in [1, 4]:
+            start = time.perf_counter()
+            export_variants(m, variants, output_dir, jobs)
+            elapsed = time.perf_counter() - start
+            print(f"{N_VARIANTS} variants   export_variants -j {jobs} {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,28 @@
-from .repl import shell
-from .onemodel_walker import evaluate
-from .onemodel_walker import load_file as load
-from .package_manager import install_dependencies
+# The public functions are imported lazily (PEP 562), so `import onemodel`
+# does not load readline, GitPython, tatsu or libsbml until they are needed.
+_lazy_attributes = {
+    "shell": ("onemodel.repl", "shell"),
+    "evaluate": ("onemodel.onemodel_walker", "evaluate"),
+    "load": ("onemodel.onemodel_walker", "load_file"),
+    "install_dependencies": ("onemodel.package_manager", "install_dependencies"),
+    "enable_ast_cache": ("onemodel.ast_cache", "enable_ast_cache"),
+    "disable_ast_cache": ("onemodel.ast_cache", "disable_ast_cache"),
+    "load_snapshot": ("onemodel.snapshot", "load_snapshot"),
+}
 
+
+def __getattr__(name):
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module 'onemodel' has no attribute '{name}'")
+
+    import importlib
+
+    module_name, attribute_name = _lazy_attributes[name]
+    result = getattr(importlib.import_module(module_name), attribute_name)
+    globals()[name] = result
+
+    return result
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attributes))
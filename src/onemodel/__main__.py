@@ -1,33 +1,149 @@
 import sys
 import os
+import time
 
-from onemodel.repl import Repl
-from onemodel.onemodel_walker import load_file
-from onemodel.package_manager import PackageManager
+
+def get_option(*names):
+    """Removes an option and its value from sys.argv and returns the value.
+
+    Returns None if the option is not in sys.argv.
+    """
+
+    for name in names:
+        if name in sys.argv[:-1]:
+            i = sys.argv.index(name)
+            value = sys.argv[i + 1]
+            del sys.argv[i:i + 2]
+
+            return value
+
+    return None
+
+def get_flag(name):
+    """Removes a flag from sys.argv and returns True if it was there."""
+
+    if name in sys.argv:
+        sys.argv.remove(name)
+        return True
+
+    return False
+
+def export_many(paths, output_dir=None, jobs=None, mode="debug"):
+    """Exports several files, directories or glob patterns in parallel.
+
+    Prints a summary of the export and exits with an error if any file
+    could not be exported.
+    """
+
+    from onemodel.export import export_files, find_files, get_summary
+
+    if output_dir is None:
+        output_dir = "build"
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    filenames = find_files(paths)
+
+    start = time.perf_counter()
+    results = export_files(filenames, output_dir, int(jobs), mode=mode)
+    elapsed = time.perf_counter() - start
+
+    print(get_summary(results, elapsed))
+
+    if any(result.error is not None for result in results):
+        sys.exit(1)
 
 def main():
+    if "--ast-cache" in sys.argv:
+        sys.argv.remove("--ast-cache")
+
+        from onemodel.ast_cache import enable_ast_cache
+        enable_ast_cache()
+
+        # Also enable it in the worker processes of `export -j`.
+        os.environ["ONEMODEL_AST_CACHE"] = "1"
+
     if len( sys.argv ) > 1:
         cmd = sys.argv[1]
 
         if cmd == "run":
+            from onemodel.onemodel_walker import load_file
+
             filename = sys.argv[2]
             onemodel = load_file(filename)
             sbml = onemodel.get_SBML_string()
             print(sbml)
 
         if cmd == "export":
-            filename = sys.argv[2]
-            onemodel = load_file(filename)
-            sbml = onemodel.get_SBML_string()
+            from onemodel.onemodel_walker import load_file
+
+            # --output is the SBML file of a single model, while --output-dir
+            # is where the SBML files are named after each model.
+            output = get_option("--output", "-o")
+            output_dir = get_option("--output-dir", "-d")
+            jobs = get_option("--jobs", "-j")
+            snapshot = get_option("--snapshot")
+            mode = "release" if get_flag("--release") else "debug"
+
+            paths = sys.argv[2:]
+
+            if not paths:
+                sys.exit(
+                    "usage: onemodel export FILE [-o OUTPUT] [--snapshot SNAPSHOT]\n"
+                    "       onemodel export PATH... [-d OUTPUT_DIR] [-j JOBS]"
+                )
+
+            if output is not None and output_dir is not None:
+                sys.exit("onemodel export: use either --output or --output-dir")
+
+            if len(paths) > 1 or jobs is not None or not os.path.isfile(paths[0]):
+                if output is not None:
+                    sys.exit(
+                        "onemodel export: --output is the SBML file of a single "
+                        "model, use --output-dir to export several files"
+                    )
+
+                if snapshot is not None:
+                    sys.exit("onemodel export: --snapshot can only be used with a single file")
+
+                export_many(paths, output_dir, jobs, mode)
+                return
+
+            filename = paths[0]
+            onemodel = load_file(filename, snapshot=snapshot)
 
-            if not os.path.exists("./build"):
-                os.mkdir("build")
+            if output is None:
+                output = os.path.join(output_dir or "build", onemodel.model_name + ".xml")
 
-            file = open("build/" + onemodel.model_name + ".xml", "w")
-            file.write(sbml)
-            file.close()
+            dirname = os.path.dirname(output)
+
+            if dirname and not os.path.exists(dirname):
+                os.makedirs(dirname)
+
+            onemodel.export_SBML(output, mode=mode)
+
+        if cmd == "variants":
+            from onemodel.export import export_variants, get_summary
+
+            output = get_option("--output", "-o") or "build"
+            jobs = get_option("--jobs", "-j") or os.cpu_count() or 1
+            mode = "release" if get_flag("--release") else "debug"
+
+            filename, table = sys.argv[2:4]
+
+            start = time.perf_counter()
+            results = export_variants(filename, table, output, int(jobs), mode)
+            elapsed = time.perf_counter() - start
+
+            print(get_summary(results, elapsed))
+
+            if any(result.error is not None for result in results):
+                sys.exit(1)
 
         if cmd == "install":
+            from onemodel.package_manager import PackageManager
+
             pm = PackageManager()
             pm.load_toml_file()
             pm.install_dependencies()
@@ -35,6 +151,8 @@ def main():
             print("Installed dependencies")
 
     else:
+        from onemodel.repl import Repl
+
         repl = Repl()
         repl.run()
 
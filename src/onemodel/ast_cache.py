@@ -0,0 +1,234 @@
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+from tatsu.ast import AST
+from tatsu.objectmodel import Node
+from tatsu.util import asjson
+
+from onemodel.grammar import get_grammar_hash
+from onemodel.utils.get_cache_dir import get_cache_dir
+
+# The AST cache used by the walkers (None if it is disabled).
+_ast_cache = None
+
+# Node classes used to rebuild the ASTs read from disk.
+_node_classes = {}
+
+
+def enable_ast_cache(directory=None, max_entries=128, max_size=256 * 1024**2):
+    """Enables the AST cache of OneModel files.
+
+    The AST cache can also be enabled by setting the environment variable
+    `ONEMODEL_AST_CACHE=1` or with `onemodel --ast-cache`.
+
+    Parameters
+    ----------
+    directory : :obj:`str`
+        Where to save the ASTs. By default, `~/.cache/onemodel/ast`.
+    max_entries : :obj:`int`
+        Maximum number of ASTs kept in memory.
+    max_size : :obj:`int`
+        Maximum size in bytes of the ASTs saved on disk.
+    """
+
+    global _ast_cache
+    _ast_cache = ASTCache(directory, max_entries, max_size)
+
+    return _ast_cache
+
+
+def disable_ast_cache():
+    """Disables the AST cache of OneModel files."""
+
+    global _ast_cache
+    _ast_cache = None
+
+
+def get_ast_cache():
+    """Returns the AST cache in use, or None if it is disabled."""
+
+    if _ast_cache is None:
+        value = os.environ.get("ONEMODEL_AST_CACHE", "")
+
+        if value.lower() in ["1", "true", "yes", "on"]:
+            enable_ast_cache()
+
+    return _ast_cache
+
+
+class ASTCache:
+    """Content-addressed cache of the ASTs of OneModel code.
+
+    The ASTs are indexed by the hash of the code plus the hash of the
+    grammar, so an AST is never reused if the code or the grammar change.
+    Lookups go through a LRU kept in memory, and then through the files
+    saved on disk. When the files on disk take more than `max_size` bytes,
+    the least recently used are removed.
+
+    Parameters
+    ----------
+    directory : :obj:`str`
+        Where to save the ASTs.
+    max_entries : :obj:`int`
+        Maximum number of ASTs kept in memory.
+    max_size : :obj:`int`
+        Maximum size in bytes of the ASTs saved on disk.
+    hits : :obj:`int`
+        Number of lookups that found the AST.
+    misses : :obj:`int`
+        Number of lookups that did not find the AST.
+    """
+
+    def __init__(self, directory=None, max_entries=128, max_size=256 * 1024**2):
+        if directory is None:
+            directory = get_cache_dir("ast")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.grammar_hash = get_grammar_hash()
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, parser, text):
+        """Returns the AST of the code, parsing it only if it is not cached."""
+
+        key = self.get_key(text)
+        ast = self.get(key)
+
+        if ast is None:
+            ast = parser.parse(text)
+            self.set(key, ast)
+
+        return ast
+
+    def get_key(self, text):
+        """Returns the key of the code in the cache."""
+
+        content = self.grammar_hash + "\n" + text
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Returns the AST saved with that key, or None if there is none."""
+
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        filepath = self._get_filepath(key)
+
+        try:
+            with open(filepath, "rb") as file:
+                ast = load_ast(pickle.load(file))
+            os.utime(filepath)
+        except Exception:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._remember(key, ast)
+
+        return ast
+
+    def set(self, key, ast):
+        """Saves the AST with that key in memory and on disk."""
+
+        self._remember(key, ast)
+
+        filepath = self._get_filepath(key)
+        tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_filepath, "wb") as file:
+                pickle.dump(dump_ast(ast), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filepath, filepath)
+        except OSError:
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Removes the least recently used files until max_size is met."""
+
+        files = []
+        total_size = 0
+
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".pickle"):
+                continue
+
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+        files.sort()
+
+        for _, size, path in files:
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+            total_size -= size
+
+    def clear(self):
+        """Removes all the ASTs of the cache."""
+
+        self.entries.clear()
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pickle"):
+                os.remove(entry.path)
+
+    def _remember(self, key, ast):
+        self.entries[key] = ast
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _get_filepath(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+
+def dump_ast(ast):
+    """Converts an AST into plain Python data that can be pickled.
+
+    The nodes built by tatsu keep references to the parser, so they cannot
+    be pickled directly.
+    """
+
+    return asjson(ast)
+
+
+def load_ast(data):
+    """Rebuilds an AST from the data returned by `dump_ast`."""
+
+    if isinstance(data, list):
+        return [load_ast(item) for item in data]
+
+    if not isinstance(data, dict):
+        return data
+
+    attributes = AST((name, load_ast(value)) for name, value in data.items()
+                     if name != "__class__")
+
+    if "__class__" not in data:
+        return attributes
+
+    name = data["__class__"]
+
+    if name not in _node_classes:
+        _node_classes[name] = type(name, (Node,), {})
+
+    return _node_classes[name](ast=attributes)
@@ -0,0 +1,390 @@
+from onemodel.objects.parameter import Parameter
+from onemodel.objects.species import Species
+from onemodel.objects.reaction import Reaction
+from onemodel.objects.assignment_rule import AssignmentRule
+from onemodel.objects.algebraic_rule import AlgebraicRule
+from onemodel.objects.rate_rule import RateRule
+from onemodel.objects.function import Function
+from onemodel.objects.model import Model
+from onemodel.utils.intern_name import intern_name
+
+
+class OneModelCompiler:
+    """Compiles the AST of OneModel statements into Python closures.
+
+    `OneModelWalker` looks for the `walk_<Class>` method of every node each
+    time that it is evaluated. The compiler resolves those methods once: each
+    `compile_<Class>` method returns a closure that evaluates the node the
+    same way as `walk_<Class>`, calling the closures of its children. The
+    bodies of functions and models are compiled the first time they are
+    called (see `OneModelWalker.execute`), so the next calls only run the
+    closures.
+
+    The closures take the Scope where they are evaluated (e.g. the Scope
+    where a model is instantiated), so the same code works for any OneModel
+    that calls the function or the model. The nodes without a
+    `compile_<Class>` method (e.g. imports) are evaluated by the walker.
+
+    Parameters
+    ----------
+    walker : :obj:`OneModelWalker`
+        The walker that evaluates the compiled code.
+    """
+
+    def __init__(self, walker):
+        self.walker = walker
+
+    def compile(self, node):
+        """Returns a function `code(scope)` that evaluates the node."""
+
+        if isinstance(node, (list, tuple)):
+            return self.compile_list(node)
+
+        method = getattr(self, "compile_" + type(node).__name__, None)
+
+        if method is not None:
+            return method(node)
+
+        if node is None or isinstance(node, str):
+            return _constant(None)
+
+        walker = self.walker
+
+        return lambda scope: walker.walk(node)
+
+    def compile_list(self, nodes):
+        codes = [self.compile(node) for node in nodes]
+
+        def evaluate_list(scope):
+            return [code(scope) for code in codes]
+
+        return evaluate_list
+
+    def compile_Addition(self, node):
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        return lambda scope: left(scope) + right(scope)
+
+    def compile_Subtraction(self, node):
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        return lambda scope: left(scope) - right(scope)
+
+    def compile_Multiplication(self, node):
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        return lambda scope: left(scope) * right(scope)
+
+    def compile_Division(self, node):
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        return lambda scope: left(scope) / right(scope)
+
+    def compile_InverseAddition(self, node):
+        base = self.compile(node.base)
+        return lambda scope: - base(scope)
+
+    def compile_Power(self, node):
+        base = self.compile(node.base)
+
+        if node.exponent is None:
+            return base
+
+        exponent = self.compile(node.exponent)
+        return lambda scope: base(scope) ** exponent(scope)
+
+    def compile_Call(self, node):
+        if node.next:
+            return self.compile(node.next)
+
+        value = self.compile(node.value)
+        args = self.compile(node.args)
+
+        def call(scope):
+            function = value(scope)
+            argument_values = args(scope)
+
+            if argument_values == None:
+                argument_values = []
+
+            result = function.call(scope, argument_values)
+
+            if type(result) == list:
+                result = result[-1]
+
+            return result
+
+        return call
+
+    def compile_Parameter(self, node):
+        target = self.compile_target(node.name)
+        value = self.compile(node.value)
+        documentation = self.compile(node.documentation)
+
+        def parameter(scope):
+            namespace, name = target(scope)
+            parameter_value = value(scope)
+            parameter_documentation = documentation(scope)
+
+            result = Parameter()
+            namespace[name] = result
+
+            if parameter_value:
+                result["value"] = parameter_value
+
+            if parameter_documentation:
+                result["__doc__"] = parameter_documentation
+
+        return parameter
+
+    def compile_Species(self, node):
+        target = self.compile_target(node.name)
+        value = self.compile(node.value)
+        documentation = self.compile(node.documentation)
+
+        def species(scope):
+            namespace, name = target(scope)
+            species_value = value(scope)
+            species_documentation = documentation(scope)
+
+            result = Species()
+            namespace[name] = result
+
+            if species_value:
+                result["initialConcentration"] = species_value
+            else:
+                result["initialConcentration"] = 0
+
+            if species_documentation:
+                result["__doc__"] = species_documentation
+
+        return species
+
+    def compile_Reaction(self, node):
+        target = self.compile_unnamed_target(node.name, "_J")
+        reactants = self.compile_dotted_names(node.reactants)
+        products = self.compile_dotted_names(node.products)
+        kinetic_law = intern_name(node.kinetic_law)
+        documentation = self.compile(node.documentation)
+
+        def reaction(scope):
+            namespace, name = target(scope)
+            reaction_reactants = reactants(scope)
+            reaction_products = products(scope)
+
+            result = Reaction()
+            namespace[name] = result
+
+            result["reactants"] = reaction_reactants
+            result["products"] = reaction_products
+            result["kinetic_law"] = kinetic_law
+
+            reaction_documentation = documentation(scope)
+            if reaction_documentation:
+                result["__doc__"] = reaction_documentation
+
+        return reaction
+
+    def compile_AssignmentRule(self, node):
+        return self.compile_rule(node, AssignmentRule)
+
+    def compile_AlgebraicRule(self, node):
+        return self.compile_rule(node, AlgebraicRule)
+
+    def compile_RateRule(self, node):
+        return self.compile_rule(node, RateRule)
+
+    def compile_rule(self, node, rule_class):
+        target = self.compile_unnamed_target(node.name, "_R")
+        variable = self.compile_DottedName(node.variable)
+        math = intern_name(node.math)
+        documentation = self.compile(node.documentation)
+
+        def rule(scope):
+            namespace, name = target(scope)
+            rule_variable = variable(scope)["dotted_name"]
+
+            result = rule_class()
+            namespace[name] = result
+            result["variable"] = rule_variable
+            result["math"] = math
+
+            rule_documentation = documentation(scope)
+            if rule_documentation:
+                result["__doc__"] = rule_documentation
+
+        return rule
+
+    def compile_Extends(self, node):
+        model = self.compile(node.model)
+
+        def extends(scope):
+            model(scope).extend(scope)
+
+        return extends
+
+    def compile_AssignName(self, node):
+        target = self.compile_target(node.name)
+        value = self.compile(node.value)
+
+        def assign_name(scope):
+            namespace, name = target(scope)
+            namespace[name] = value(scope)
+
+        return assign_name
+
+    def compile_AccessName(self, node):
+        target = self.compile_target(node.name)
+
+        def access_name(scope):
+            namespace, name = target(scope)
+            return namespace[name]
+
+        return access_name
+
+    def compile_FunctionDefinition(self, node):
+        walker = self.walker
+        name = node.name
+        args = node.args
+        body = node.body
+
+        if args == None:
+            args = []
+
+        def function_definition(scope):
+            result = Function()
+            result["argument_names"] = args
+            result["body"] = body
+            result.walker = walker
+
+            scope[name] = result
+
+            return result
+
+        return function_definition
+
+    def compile_ModelDefinition(self, node):
+        walker = self.walker
+        name = node.name
+        body = node.body
+
+        def model_definition(scope):
+            result = Model()
+            result["body"] = body
+            result.walker = walker
+
+            scope[name] = result
+
+            return result
+
+        return model_definition
+
+    def compile_Standalone(self, node):
+        body = self.compile(node.body)
+
+        def standalone(scope):
+            if scope["__name__"] == "__main__":
+                return body(scope)
+
+            return None
+
+        return standalone
+
+    def compile_DottedName(self, node):
+        target = self.compile_target(node)
+        dotted_name = _get_dotted_name(node)
+
+        def evaluate_dotted_name(scope):
+            namespace, name = target(scope)
+
+            result = {}
+            result["name"] = name
+            result["namespace"] = namespace
+            result["dotted_name"] = dotted_name
+
+            return result
+
+        return evaluate_dotted_name
+
+    def compile_target(self, node):
+        """Returns a closure that resolves a dotted name into the namespace
+        where it is defined and its last name.
+        """
+
+        qualifiers = [intern_name(qualifier) for qualifier in node.qualifiers or []]
+        name = intern_name(node.name)
+
+        if not qualifiers:
+            return lambda scope: (scope, name)
+
+        def target(scope):
+            namespace = scope
+
+            for qualifier in qualifiers:
+                namespace = namespace[qualifier]
+
+            return namespace, name
+
+        return target
+
+    def compile_unnamed_target(self, node, prefix):
+        """Like `compile_target`, but names the reactions and rules without
+        name with the counter of the OneModel (e.g. `_J0`).
+        """
+
+        if node is not None:
+            return self.compile_target(node)
+
+        def unnamed_target(scope):
+            name = f"{prefix}{scope.numberOfUnnamedReactions}"
+            scope.numberOfUnnamedReactions += 1
+
+            return scope, name
+
+        return unnamed_target
+
+    def compile_dotted_names(self, nodes):
+        """Returns a closure that returns the dotted names of the reactants or
+        the products of a reaction.
+        """
+
+        targets = [self.compile_target(node) for node in nodes or []]
+        dotted_names = [_get_dotted_name(node) for node in nodes or []]
+
+        # The qualifiers are still resolved, as the walker does, so a missing
+        # namespace raises the same error.
+        if all(not node.qualifiers for node in nodes or []):
+            return lambda scope: list(dotted_names)
+
+        def evaluate_dotted_names(scope):
+            for target in targets:
+                target(scope)
+
+            return list(dotted_names)
+
+        return evaluate_dotted_names
+
+    def compile_Float(self, node):
+        return _constant(float(node.value))
+
+    def compile_Integer(self, node):
+        return _constant(int(node.value))
+
+    def compile_Docstring(self, node):
+        text = str(node.value)
+        lines = text.split("\n")
+        return _constant("\n".join(line.strip() for line in lines))
+
+    def compile_String(self, node):
+        return _constant(str(node.value))
+
+
+def _constant(value):
+    return lambda scope: value
+
+
+def _get_dotted_name(node):
+    if node.qualifiers:
+        return intern_name(".".join(node.qualifiers) + "." + node.name)
+
+    return intern_name(node.name)
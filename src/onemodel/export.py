@@ -0,0 +1,442 @@
+import os
+import csv
+import glob
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+
+class ModuleASTs(OrderedDict):
+    """The ASTs of modules by the hash of their text, as a LRU.
+
+    It can be given to a ModuleRegistry (see `ModuleRegistry.get_ast`) to
+    share the ASTs of the modules across registries without keeping every
+    module ever parsed.
+
+    Parameters
+    ----------
+    max_entries : :obj:`int`
+        Maximum number of ASTs kept.
+    """
+
+    def __init__(self, max_entries=128):
+        super().__init__()
+        self.max_entries = max_entries
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+
+        while len(self) > self.max_entries:
+            self.popitem(last=False)
+
+
+# The ASTs of the modules parsed by this process, shared by all the files
+# it exports (each file evaluates its modules in its own ModuleRegistry).
+_module_asts = ModuleASTs()
+
+# The VariantWriter of a process of the pool used by `export_variants`.
+_variant_writer = None
+
+
+class ExportResult:
+    """The result of exporting a OneModel file into SBML.
+
+    Parameters
+    ----------
+    filename : :obj:`str`
+        The exported OneModel file.
+    output : :obj:`str`
+        The SBML file written.
+    time : :obj:`float`
+        Seconds spent loading and exporting the file.
+    error : :obj:`str`
+        The error raised while exporting the file, or None if there was none.
+    """
+
+    def __init__(self, filename, output, time=0.0, error=None):
+        self.filename = filename
+        self.output = output
+        self.time = time
+        self.error = error
+
+    def __repr__(self):
+        status = "ok" if self.error is None else "error"
+        return f"<ExportResult {self.filename} {status} {self.time:.3f}s>"
+
+
+def find_files(paths):
+    """Returns the OneModel files of a list of paths.
+
+    Each path can be a file, a directory (all the `.one` files inside it
+    are exported) or a glob pattern.
+    """
+
+    result = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            pattern = os.path.join(path, "**", "*.one")
+            result += sorted(glob.glob(pattern, recursive=True))
+        elif glob.has_magic(path):
+            result += sorted(glob.glob(path, recursive=True))
+        else:
+            result.append(path)
+
+    # Remove duplicates keeping the order.
+    return list(dict.fromkeys(result))
+
+
+def get_output_filename(filename, output_dir):
+    """Returns where the SBML of a OneModel file is written."""
+
+    model_name = os.path.splitext(os.path.basename(filename))[0]
+
+    return os.path.join(output_dir, model_name + ".xml")
+
+
+def export_file(filename, output, backend="libsbml", mode="debug"):
+    """Exports a OneModel file into a SBML file.
+
+    The errors are not raised, but returned in the result, so a single
+    file cannot stop the export of the others.
+
+    Parameters
+    ----------
+    filename : :obj:`str`
+        The OneModel file.
+    output : :obj:`str`
+        Where to write the SBML file.
+    backend : :obj:`str`
+        The SBML backend (see `OneModel.get_SBML_string`).
+    mode : :obj:`str`
+        "debug" or "release" (see `OneModel.get_SBML_string`).
+    """
+
+    from onemodel.onemodel_walker import load_file
+    from onemodel.objects.module import ModuleRegistry
+
+    # A file can change the modules it imports, so the modules are not
+    # shared with the other files, only their ASTs.
+    modules = ModuleRegistry(asts=_module_asts)
+
+    start = time.perf_counter()
+    error = None
+
+    try:
+        onemodel = load_file(filename, modules=modules)
+
+        dirname = os.path.dirname(output)
+
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        onemodel.export_SBML(output, backend=backend, mode=mode)
+    except (Exception, SystemExit) as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return ExportResult(filename, output, time.perf_counter() - start, error)
+
+
+def export_files(filenames, output_dir="build", jobs=1, backend="libsbml", mode="debug"):
+    """Exports many OneModel files into SBML files.
+
+    The files are spread across a pool of `jobs` processes. Each process
+    compiles the grammar once when it starts, and then reuses it and the
+    ASTs of the imported modules for all the files that it exports. Each
+    file evaluates its imports again, so the files do not depend on each
+    other nor on the order in which they are exported.
+
+    Parameters
+    ----------
+    filenames : :obj:`list` of :obj:`str`
+        The OneModel files.
+    output_dir : :obj:`str`
+        The directory where the SBML files are written, named after each
+        file (e.g. `build/model.xml`).
+    jobs : :obj:`int`
+        Number of processes. If 1, the files are exported by this process.
+    backend : :obj:`str`
+        The SBML backend (see `OneModel.get_SBML_string`).
+    mode : :obj:`str`
+        "debug" or "release" (see `OneModel.get_SBML_string`).
+
+    Returns
+    -------
+    results : :obj:`list` of :obj:`ExportResult`
+        The result of each file, in the same order as `filenames`.
+    """
+
+    outputs = [get_output_filename(filename, output_dir) for filename in filenames]
+
+    if len(set(outputs)) != len(outputs):
+        duplicates = sorted({output for output in outputs if outputs.count(output) > 1})
+        raise ValueError(f"Several files would be exported to {', '.join(duplicates)}")
+
+    backends = [backend] * len(filenames)
+    modes = [mode] * len(filenames)
+
+    if jobs <= 1 or len(filenames) <= 1:
+        return list(map(export_file, filenames, outputs, backends, modes))
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker) as executor:
+        return list(executor.map(export_file, filenames, outputs, backends, modes))
+
+
+def init_worker():
+    """Warms up a process of the pool used by `export_files`."""
+
+    from onemodel.grammar import get_parser
+    from onemodel.onemodel_walker import OneModelWalker
+
+    get_parser()
+    OneModelWalker()
+
+    import libsbml  # noqa: F401
+
+
+def read_variants(filename):
+    """Reads a table of variants of a model.
+
+    The table can be a CSV file or a `.npy` file with a structured array
+    (requires numpy). Each column is a parameter or species of the model, by
+    its dotted name (e.g. `circuit.z1.k`), and each row is a variant. The
+    column "variant" of a CSV file names the variants; otherwise they are
+    named by their row number. An empty cell of a CSV file keeps the value
+    of the model.
+
+    Returns
+    -------
+    variants : :obj:`list` of :obj:`tuple`
+        The `(name, values)` of each variant, where values is a dict of the
+        new values by dotted name.
+    """
+
+    if filename.endswith(".npy"):
+        import numpy
+
+        table = numpy.load(filename)
+
+        if table.dtype.names is None:
+            raise ValueError(f"'{filename}' has to contain a structured array")
+
+        return [
+            (str(i), {name: row[name].item() for name in table.dtype.names})
+            for i, row in enumerate(table)
+        ]
+
+    result = []
+
+    with open(filename, newline="") as file:
+        for i, row in enumerate(csv.DictReader(file)):
+            name = row.pop("variant", None) or str(i)
+            values = {}
+
+            for key, value in row.items():
+                if value is None or not value.strip():
+                    continue
+
+                try:
+                    values[key.strip()] = float(value)
+                except ValueError:
+                    raise ValueError(
+                        f"'{filename}', variant {name}: "
+                        f"the value of '{key.strip()}' is not a number: '{value}'"
+                    ) from None
+
+            result.append((name, values))
+
+    return result
+
+
+def export_variants(model, variants, output_dir="build", jobs=1, mode="debug"):
+    """Exports variants of a model that only differ in some values.
+
+    The model is evaluated and exported once into a SBML document of its
+    own, so the model and the document it may keep (see
+    `OneModel.to_SBML_document`) are not changed. Then, each variant patches
+    the values of that document in place (see `VariantWriter`) and writes
+    it, so the structure of the model is never walked again.
+    With several jobs, each process reads the SBML document once and writes
+    a share of the variants.
+
+    Parameters
+    ----------
+    model : :obj:`OneModel` or :obj:`str`
+        The evaluated model or the OneModel file to load.
+    variants : :obj:`list` of :obj:`tuple` or :obj:`str`
+        The `(name, values)` of each variant, or a table of variants (see
+        `read_variants`). The names that a variant does not set keep the
+        value of the model.
+    output_dir : :obj:`str`
+        The directory where the SBML files are written, named after the
+        model and the variant (e.g. `build/model_0.xml`).
+    jobs : :obj:`int`
+        Number of processes. If 1, the variants are written by this process.
+    mode : :obj:`str`
+        "debug" or "release" (see `OneModel.get_SBML_string`).
+
+    Returns
+    -------
+    results : :obj:`list` of :obj:`ExportResult`
+        The result of each variant, in the same order as `variants`.
+    """
+
+    if isinstance(model, str):
+        from onemodel.onemodel_walker import load_file
+
+        model = load_file(model)
+
+    if isinstance(variants, str):
+        variants = read_variants(variants)
+
+    names = [name for name, _ in variants]
+    values = [values for _, values in variants]
+    outputs = [
+        os.path.join(output_dir, f"{model.model_name}_{name}.xml") for name in names
+    ]
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    from onemodel.scope import ExportScope
+
+    scope = ExportScope(model.root)
+    SBML_document = model._create_SBML_document(mode=mode, scope=scope)
+
+    if jobs <= 1 or len(variants) <= 1:
+        writer = VariantWriter(SBML_document, scope.SBML_index)
+
+        return list(map(writer.write, names, values, outputs))
+
+    import libsbml
+
+    initargs = (libsbml.writeSBMLToString(SBML_document), scope.SBML_index)
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_variant_worker, initargs=initargs
+    ) as executor:
+        return list(executor.map(export_variant, names, values, outputs))
+
+
+def init_variant_worker(SBML_string, SBML_index):
+    """Reads the SBML document patched by a process of `export_variants`."""
+
+    global _variant_writer
+
+    import libsbml
+
+    _variant_writer = VariantWriter(libsbml.readSBMLFromString(SBML_string), SBML_index)
+
+
+def export_variant(name, values, output):
+    """Writes a variant with the VariantWriter of a process of the pool."""
+
+    return _variant_writer.write(name, values, output)
+
+
+class VariantWriter:
+    """Writes variants of a SBML document by patching its values in place.
+
+    The value of each parameter or species is kept before it is patched for
+    the first time, so every variant starts again from the values of the
+    model and the names that it does not set are not left with the values
+    of a previous variant.
+
+    Parameters
+    ----------
+    SBML_document : :obj:`libsbml.SBMLDocument`
+        The document patched and written by each variant.
+    SBML_index : :obj:`dict`
+        The kind of SBML object emitted under each fullname.
+    """
+
+    def __init__(self, SBML_document, SBML_index):
+        from onemodel.utils.get_SBML_elements import get_SBML_elements
+
+        self.SBML_document = SBML_document
+        self.SBML_elements = get_SBML_elements(SBML_document)
+        self.SBML_index = SBML_index
+
+        # The value in the model of each name patched so far.
+        self.base_values = {}
+
+    def write(self, name, values, output):
+        """Patches the values of a variant into the document and writes it.
+
+        The errors are not raised, but returned in the result.
+        """
+
+        import libsbml
+        from onemodel.utils.set_SBML_values import set_SBML_values
+
+        start = time.perf_counter()
+        error = None
+
+        try:
+            for key in values:
+                self.keep_base_value(key)
+
+            set_SBML_values(
+                self.SBML_elements, self.SBML_index, {**self.base_values, **values}
+            )
+
+            if not libsbml.SBMLWriter().writeSBMLToFile(self.SBML_document, output):
+                raise OSError(f"Could not write SBML file '{output}'")
+        except (Exception, SystemExit) as e:
+            error = f"{type(e).__name__}: {e}"
+
+        return ExportResult(name, output, time.perf_counter() - start, error)
+
+    def keep_base_value(self, name):
+        if name in self.base_values:
+            return
+
+        fullname = name.replace(".", "__")
+        kind = self.SBML_index.get(fullname)
+
+        # Unknown names are reported by `set_SBML_values`.
+        if kind == "parameter":
+            self.base_values[name] = self.SBML_elements[fullname].getValue()
+        elif kind == "species":
+            self.base_values[name] = self.SBML_elements[fullname].getInitialConcentration()
+
+
+def get_summary(results, elapsed=None):
+    """Returns a table with the time and the error of each exported file.
+
+    Parameters
+    ----------
+    results : :obj:`list` of :obj:`ExportResult`
+        The results returned by `export_files`.
+    elapsed : :obj:`float`
+        The wall time of the whole export. By default, the sum of the time
+        of each file.
+    """
+
+    from tabulate import tabulate
+
+    data = []
+
+    for result in results:
+        status = "ok" if result.error is None else result.error
+        data.append([result.filename, f"{result.time:.3f}", status])
+
+    errors = sum(result.error is not None for result in results)
+
+    if elapsed is None:
+        elapsed = sum(result.time for result in results)
+
+    table = tabulate(data, headers=["File", "Time (s)", "Status"])
+
+    return (
+        f"{table}\n\n"
+        f"Exported {len(results) - errors} of {len(results)} files "
+        f"in {elapsed:.3f} s ({errors} failed)"
+    )
@@ -0,0 +1,413 @@
+from array import array
+
+from onemodel.scope import ExportScope
+from onemodel.objects.object import Object
+from onemodel.objects.species import Species
+from onemodel.objects.parameter import Parameter
+from onemodel.objects.reaction import Reaction
+from onemodel.objects.assignment_rule import AssignmentRule
+from onemodel.objects.rate_rule import RateRule
+from onemodel.objects.algebraic_rule import AlgebraicRule
+from onemodel.utils.check import check
+from onemodel.utils.formula_2_ast import formula_2_ast
+from onemodel.utils.get_ast_names import get_formula_fullnames
+from onemodel.utils.math_2_fullname import math_2_fullname
+
+
+class FlatModel:
+    """A OneModel model flattened into tables.
+
+    The FlatModel is built once from an evaluated OneModel (see
+    `from_onemodel`): the tree of namespaces is walked, every name is
+    resolved to its fullname and every formula is rewritten with fullnames.
+    The result is a set of tables with one row per SBML object, which can
+    be read in linear time without walking the tree or using a Scope again.
+
+    Numeric columns are stored in `array.array` and the participants of the
+    reactions in CSR format: the reactants of reaction `i` are
+    `reactant_ids[reactant_offsets[i]:reactant_offsets[i + 1]]`. As in the
+    SBML export, the reactants and products are fullnames, which are usually
+    (but not necessarily) species. The modifiers are always species, so they
+    are stored as indexes into the species table.
+
+    The SBML export writes each row directly, in the same order as the
+    OneModel.
+
+    Parameters
+    ----------
+    model_name : :obj:`str`
+        The name of the model.
+    species_ids : :obj:`list` of :obj:`str`
+        The fullname of each species.
+    species_indexes : :obj:`dict`
+        The row of each species by fullname.
+    initial_concentrations : :obj:`array` of :obj:`float`
+    compartments : :obj:`list` of :obj:`str`
+    substance_units : :obj:`list` of :obj:`str`
+    species_constant : :obj:`array` of :obj:`bool`
+    boundary_conditions : :obj:`array` of :obj:`bool`
+    has_only_substance_units : :obj:`array` of :obj:`bool`
+    parameter_ids : :obj:`list` of :obj:`str`
+        The fullname of each parameter.
+    parameter_values : :obj:`array` of :obj:`float`
+    parameter_units : :obj:`list` of :obj:`str`
+    parameter_constant : :obj:`array` of :obj:`bool`
+    reaction_ids : :obj:`list` of :obj:`str`
+        The fullname of each reaction.
+    reversible : :obj:`array` of :obj:`bool`
+    reactant_offsets : :obj:`array` of :obj:`int`
+    reactant_ids : :obj:`list` of :obj:`str`
+        The fullnames of the reactants of each reaction.
+    product_offsets : :obj:`array` of :obj:`int`
+    product_ids : :obj:`list` of :obj:`str`
+        The fullnames of the products of each reaction.
+    modifier_offsets, modifier_species : :obj:`array` of :obj:`int`
+        The modifiers of each reaction.
+    kinetic_laws : :obj:`list` of :obj:`str`
+        The kinetic law of each reaction, with fullnames.
+    rule_kinds : :obj:`list` of :obj:`str`
+        "assignment", "rate" or "algebraic".
+    rule_ids : :obj:`list` of :obj:`str`
+        The fullname of each rule.
+    rule_variables : :obj:`list` of :obj:`str`
+        The fullname of the variable of each rule.
+    rule_formulas : :obj:`list` of :obj:`str`
+        The formula of each rule, with fullnames. An algebraic rule means
+        that `variable - (formula)` is zero.
+    export_kinds : :obj:`list` of :obj:`str`
+        The table ("species", "parameter", "reaction" or "rule") of each
+        object, in the order of the SBML export.
+    export_rows : :obj:`array` of :obj:`int`
+        The row of each object in its table, in the order of the SBML export.
+    """
+
+    def __init__(self, model_name="main"):
+        self.model_name = model_name
+
+        self.species_ids = []
+        self.species_indexes = {}
+        self.initial_concentrations = array("d")
+        self.compartments = []
+        self.substance_units = []
+        self.species_constant = array("b")
+        self.boundary_conditions = array("b")
+        self.has_only_substance_units = array("b")
+
+        self.parameter_ids = []
+        self.parameter_values = array("d")
+        self.parameter_units = []
+        self.parameter_constant = array("b")
+
+        self.reaction_ids = []
+        self.reversible = array("b")
+        self.reactant_offsets = array("l", [0])
+        self.reactant_ids = []
+        self.product_offsets = array("l", [0])
+        self.product_ids = []
+        self.modifier_offsets = array("l", [0])
+        self.modifier_species = array("l")
+        self.kinetic_laws = []
+
+        self.rule_kinds = []
+        self.rule_ids = []
+        self.rule_variables = []
+        self.rule_formulas = []
+
+        self.export_kinds = []
+        self.export_rows = array("l")
+
+    @classmethod
+    def from_onemodel(cls, onemodel):
+        """Builds the FlatModel of an evaluated OneModel.
+
+        The objects are visited in the same order as in the SBML export, so
+        the modifiers of each reaction are the same species.
+        """
+
+        result = cls(onemodel.model_name)
+        builder = _FlatModelBuilder(result)
+        builder.add_namespace(ExportScope(onemodel.root))
+
+        return result
+
+    def get_reactants(self, i):
+        """Returns the fullnames of the reactants of reaction i."""
+
+        return self.reactant_ids[self.reactant_offsets[i]:self.reactant_offsets[i + 1]]
+
+    def get_products(self, i):
+        """Returns the fullnames of the products of reaction i."""
+
+        return self.product_ids[self.product_offsets[i]:self.product_offsets[i + 1]]
+
+    def get_modifiers(self, i):
+        """Returns the species indexes of the modifiers of reaction i."""
+
+        return self.modifier_species[self.modifier_offsets[i]:self.modifier_offsets[i + 1]]
+
+    def to_SBML_document(self, backend="libsbml"):
+        """Returns the SBML document of the model.
+
+        It is the same document that `OneModel.get_SBML_string` writes.
+        """
+
+        from onemodel.onemodel import init_SBML_document
+
+        SBML_document, SBML_model = init_SBML_document(self.model_name, backend)
+        self.add_to_SBML_model(SBML_model)
+
+        return SBML_document
+
+    def get_SBML_string(self, backend="libsbml"):
+        """Returns a SBML representation of the model."""
+
+        SBML_document = self.to_SBML_document(backend)
+
+        if backend == "xml":
+            return SBML_document.write_to_string()
+
+        import libsbml
+
+        return libsbml.writeSBMLToString(SBML_document)
+
+    def add_to_SBML_model(self, SBML_model):
+        """Includes the objects of the tables into a SBML model.
+
+        Each row is written directly with the fullnames and formulas of the
+        tables, so the formulas are not resolved again and the modifiers of
+        the reactions are not looked up again.
+        """
+
+        create = {
+            "species": self.create_SBML_species,
+            "parameter": self.create_SBML_parameter,
+            "reaction": self.create_SBML_reaction,
+            "rule": self.create_SBML_rule,
+        }
+
+        for kind, i in zip(self.export_kinds, self.export_rows):
+            create[kind](SBML_model, i)
+
+    def create_SBML_species(self, SBML_model, i):
+        """Creates the SBML species of row i of the species table."""
+
+        fullname = self.species_ids[i]
+
+        s = SBML_model.createSpecies()
+        check(s, "create species {}", fullname)
+        check(s.setId(fullname), "set species {} id", fullname)
+        check(
+            s.setCompartment(self.compartments[i]),
+            "set species {} in default_compartment", fullname
+        )
+        check(
+            s.setConstant(bool(self.species_constant[i])),
+            'set "constant" attribute on {}', fullname
+        )
+        check(
+            s.setInitialConcentration(self.initial_concentrations[i]),
+            "set initial amount for {}", fullname
+        )
+        check(
+            s.setSubstanceUnits(self.substance_units[i]),
+            "set substance units for {}", fullname
+        )
+        check(
+            s.setBoundaryCondition(bool(self.boundary_conditions[i])),
+            'set "boundaryCondition" on {}', fullname
+        )
+        check(
+            s.setHasOnlySubstanceUnits(bool(self.has_only_substance_units[i])),
+            'set "hasOnlySubstanceUnits" on {}', fullname,
+        )
+
+    def create_SBML_parameter(self, SBML_model, i):
+        """Creates the SBML parameter of row i of the parameter table."""
+
+        fullname = self.parameter_ids[i]
+
+        p = SBML_model.createParameter()
+        check(p, "create parameter {}", fullname)
+        check(p.setId(fullname), "set parameter {} id", fullname)
+        check(
+            p.setConstant(bool(self.parameter_constant[i])),
+            'set parameter {} "constant"', fullname
+        )
+        check(p.setValue(self.parameter_values[i]), "set parameter {} value", fullname)
+        check(p.setUnits(self.parameter_units[i]), "set parameter {} units", fullname)
+
+    def create_SBML_reaction(self, SBML_model, i):
+        """Creates the SBML reaction of row i of the reaction table."""
+
+        fullname = self.reaction_ids[i]
+
+        r = SBML_model.createReaction()
+        check(r, "create reaction {}", fullname)
+        check(r.setId(fullname), "set reaction id {}", fullname)
+        check(r.setReversible(bool(self.reversible[i])), "set reaction reversibility flag")
+
+        for item in self.get_reactants(i):
+            reactant = r.createReactant()
+            check(reactant, "create reactant")
+            check(reactant.setSpecies(item), "assign reactant species {}", item)
+            check(reactant.setConstant(True), 'set "constant" on species {}', item)
+
+        for item in self.get_products(i):
+            product = r.createProduct()
+            check(product, "create product")
+            check(product.setSpecies(item), "assign product species")
+            check(product.setConstant(True), 'set "constant" on species {}', item)
+
+        math_ast = formula_2_ast(self.kinetic_laws[i])
+        check(math_ast, "create AST for rate expression")
+
+        kinetic_law = r.createKineticLaw()
+        check(kinetic_law, "create kinetic law")
+        check(kinetic_law.setMath(math_ast), "set math on kinetic law")
+
+        for j in self.get_modifiers(i):
+            modifier = r.createModifier()
+            check(modifier, "create modifier")
+            check(modifier.setSpecies(self.species_ids[j]), "assign modifier species")
+
+    def create_SBML_rule(self, SBML_model, i):
+        """Creates the SBML rule of row i of the rule table."""
+
+        kind = self.rule_kinds[i]
+        fullname = self.rule_ids[i]
+        variable = self.rule_variables[i]
+        formula = self.rule_formulas[i]
+
+        if kind == "algebraic":
+            r = SBML_model.createAlgebraicRule()
+            formula = f"{variable}-({formula})"
+        elif kind == "rate":
+            r = SBML_model.createRateRule()
+        else:
+            r = SBML_model.createAssignmentRule()
+
+        name = f"{kind} rule"
+
+        check(r, "create {} {}", name, fullname)
+        check(r.setIdAttribute(fullname), "set {} id {}", name, fullname)
+
+        if kind != "algebraic":
+            check(r.setVariable(variable), "set variable on {} {}", name, fullname)
+
+        check(r.setMath(formula_2_ast(formula)), "set math on {} {}", name, fullname)
+
+    def __repr__(self):
+        result = "<flat-model"
+        result += f" species={len(self.species_ids)}"
+        result += f" parameters={len(self.parameter_ids)}"
+        result += f" reactions={len(self.reaction_ids)}"
+        result += f" rules={len(self.rule_ids)}"
+        result += ">"
+
+        return result
+
+
+class _FlatModelBuilder:
+    """Fills the tables of a FlatModel walking a OneModel."""
+
+    def __init__(self, flat_model):
+        self.flat_model = flat_model
+
+    def add_row(self, kind, i):
+        m = self.flat_model
+
+        m.export_kinds.append(kind)
+        m.export_rows.append(i)
+
+    def add_namespace(self, scope):
+        for name, value in scope.peek().items():
+
+            if not isinstance(value, Object):
+                continue
+
+            if isinstance(value, Species):
+                self.add_species(name, value, scope)
+            elif isinstance(value, Parameter):
+                self.add_parameter(name, value, scope)
+            elif isinstance(value, Reaction):
+                self.add_reaction(name, value, scope)
+            elif isinstance(value, AssignmentRule):
+                self.add_rule("assignment", name, value, scope)
+            elif isinstance(value, RateRule):
+                self.add_rule("rate", name, value, scope)
+            elif isinstance(value, AlgebraicRule):
+                self.add_rule("algebraic", name, value, scope)
+
+            scope.push(value, name)
+            self.add_namespace(scope)
+            scope.pop()
+
+    def add_species(self, name, value, scope):
+        m = self.flat_model
+        fullname = scope.get_fullname(name)
+
+        self.add_row("species", len(m.species_ids))
+
+        m.species_indexes[fullname] = len(m.species_ids)
+        m.species_ids.append(fullname)
+        m.initial_concentrations.append(value["initialConcentration"])
+        m.compartments.append(value["compartment"])
+        m.substance_units.append(value["substanceUnits"])
+        m.species_constant.append(value["constant"])
+        m.boundary_conditions.append(value["boundaryCondition"])
+        m.has_only_substance_units.append(value["hasOnlySubstanceUnits"])
+
+    def add_parameter(self, name, value, scope):
+        m = self.flat_model
+
+        self.add_row("parameter", len(m.parameter_ids))
+
+        m.parameter_ids.append(scope.get_fullname(name))
+        m.parameter_values.append(value["value"])
+        m.parameter_units.append(value["units"])
+        m.parameter_constant.append(value["isConstant"])
+
+    def add_reaction(self, name, value, scope):
+        m = self.flat_model
+
+        reactants = [scope.get_fullname(item) for item in value["reactants"] if item is not None]
+        products = [scope.get_fullname(item) for item in value["products"] if item is not None]
+        kinetic_law = math_2_fullname(value["kinetic_law"], scope)
+
+        # As in the SBML export, the modifiers are the species already
+        # defined that appear in the kinetic law but not in the reaction.
+        involved = set(reactants) | set(products)
+        modifiers = [
+            m.species_indexes[item]
+            for item in get_formula_fullnames(value["kinetic_law"], scope)
+            if item in m.species_indexes and item not in involved
+        ]
+
+        self.add_row("reaction", len(m.reaction_ids))
+
+        m.reaction_ids.append(scope.get_fullname(name))
+        m.reversible.append(value["reversible"])
+        m.reactant_ids.extend(reactants)
+        m.reactant_offsets.append(len(m.reactant_ids))
+        m.product_ids.extend(products)
+        m.product_offsets.append(len(m.product_ids))
+        m.kinetic_laws.append(kinetic_law)
+        m.modifier_species.extend(modifiers)
+        m.modifier_offsets.append(len(m.modifier_species))
+
+    def add_rule(self, kind, name, value, scope):
+        m = self.flat_model
+
+        self.add_row("rule", len(m.rule_ids))
+
+        # The variable of an algebraic rule is part of its formula, so it
+        # is rewritten with the formula (e.g. a dotted name).
+        if kind == "algebraic":
+            variable = math_2_fullname(value["variable"], scope)
+        else:
+            variable = scope.get_fullname(value["variable"])
+
+        m.rule_kinds.append(kind)
+        m.rule_ids.append(scope.get_fullname(name))
+        m.rule_variables.append(variable)
+        m.rule_formulas.append(math_2_fullname(value["math"], scope))
@@ -0,0 +1,244 @@
+import os
+import pickle
+import hashlib
+import threading
+from importlib_resources import files
+import tatsu
+from tatsu.model import ModelBuilderSemantics
+
+from onemodel.utils.get_cache_dir import get_cache_dir
+
+# Parsers of this process indexed by their cache key, and the parser
+# returned by `get_parser` ("generated" or "compiled").
+_parsers = {}
+
+
+def read_grammar():
+    """Returns the text of the OneModel grammar (onemodel.ebnf)."""
+
+    return files("onemodel").joinpath("onemodel.ebnf").read_text()
+
+
+def get_grammar_hash(grammar=None):
+    """Returns a hash that identifies the OneModel grammar.
+
+    Parameters
+    ----------
+    grammar : :obj:`str`
+        Text of the grammar. If None, the grammar of the package is used.
+    """
+
+    if grammar is None:
+        grammar = read_grammar()
+
+    return hashlib.sha256(grammar.encode("utf-8")).hexdigest()
+
+
+def get_parser(generated=True):
+    """Returns the parser of the OneModel grammar.
+
+    By default, the parser pre-generated in `onemodel.onemodel_parser` is
+    used. If that module is missing or out of date with the grammar, the
+    grammar is compiled at runtime (see `get_compiled_parser`).
+
+    Parameters
+    ----------
+    generated : :obj:`bool`
+        If False, always use the parser compiled at runtime.
+
+    Notes
+    -----
+    The grammar is only read and hashed the first time, and then the same
+    parser is returned until `clear_parser_cache` is called.
+    """
+
+    key = "generated" if generated else "compiled"
+    parser = _parsers.get(key)
+
+    if parser is not None:
+        return parser
+
+    grammar = read_grammar()
+    grammar_hash = get_grammar_hash(grammar)
+
+    if generated and is_generated_parser_up_to_date(grammar_hash):
+        parser = GeneratedParser()
+    else:
+        parser = get_compiled_parser(grammar, grammar_hash)
+
+    _parsers[key] = parser
+
+    return parser
+
+
+def get_compiled_parser(grammar=None, grammar_hash=None):
+    """Returns the parser of the OneModel grammar compiled with tatsu.
+
+    Compiling the grammar with tatsu is expensive, so the compiled parser is
+    cached twice:
+
+    * In memory, so every walker of the process shares the same parser.
+    * On disk, keyed by the grammar hash and the tatsu version, so a new
+      process unpickles the parser instead of compiling it again. If the
+      cache directory cannot be created or written, it is skipped.
+    """
+
+    if grammar is None:
+        grammar = read_grammar()
+
+    if grammar_hash is None:
+        grammar_hash = get_grammar_hash(grammar)
+
+    key = grammar_hash[:16] + "-tatsu" + tatsu.__version__
+
+    if key in _parsers:
+        return _parsers[key]
+
+    # Without a writable cache directory, the grammar is only compiled in
+    # memory.
+    try:
+        filepath = os.path.join(get_cache_dir("grammar"), key + ".pickle")
+    except OSError:
+        filepath = None
+
+    parser = _load_parser(filepath) if filepath else None
+
+    if parser is None:
+        parser = tatsu.compile(grammar, asmodel=True)
+
+        if filepath:
+            _save_parser(parser, filepath)
+
+    _parsers[key] = parser
+
+    return parser
+
+
+def is_generated_parser_up_to_date(grammar_hash=None):
+    """Returns True if `onemodel.onemodel_parser` can parse the grammar.
+
+    The generated parser is used without further checks unless the grammar
+    file is newer than the generated module. In that case, the grammar hash
+    stored in the module decides whether the module is still valid.
+    """
+
+    try:
+        from onemodel import onemodel_parser
+    except ImportError:
+        return False
+
+    grammar_path = str(files("onemodel").joinpath("onemodel.ebnf"))
+
+    try:
+        grammar_mtime = os.path.getmtime(grammar_path)
+        parser_mtime = os.path.getmtime(onemodel_parser.__file__)
+    except OSError:
+        grammar_mtime = parser_mtime = 0
+
+    if grammar_mtime <= parser_mtime:
+        return True
+
+    if grammar_hash is None:
+        grammar_hash = get_grammar_hash()
+
+    return getattr(onemodel_parser, "GRAMMAR_HASH", None) == grammar_hash
+
+
+def generate_parser(filepath=None):
+    """Generates the Python module of the parser of the OneModel grammar.
+
+    The module is generated with the code generator of tatsu and it is saved
+    by default as `onemodel/onemodel_parser.py`. This has to be run every
+    time `onemodel.ebnf` is changed (see `make parser`).
+
+    Parameters
+    ----------
+    filepath : :obj:`str`
+        Where to save the generated module.
+    """
+
+    if filepath is None:
+        filepath = str(files("onemodel").joinpath("onemodel_parser.py"))
+
+    grammar = read_grammar()
+
+    source = tatsu.to_python_sourcecode(grammar, name="OneModel")
+    source += f"\n\nGRAMMAR_HASH = '{get_grammar_hash(grammar)}'\n"
+
+    with open(filepath, "w") as file:
+        file.write(source)
+
+    return filepath
+
+
+class GeneratedParser:
+    """Wrapper of the pre-generated parser of the OneModel grammar.
+
+    It builds the same AST nodes as the parser compiled at runtime with
+    `tatsu.compile(grammar, asmodel=True)`.
+
+    A generated tatsu parser keeps the state of the text being parsed, so
+    each thread uses its own instance of the parser (the parsers compiled
+    at runtime create a new state for each text instead).
+    """
+
+    def __init__(self):
+        from onemodel.onemodel_parser import OneModelParser
+
+        self.parser_class = OneModelParser
+        self.local = threading.local()
+
+    def parse(self, text, **kwargs):
+        """Parses OneModel code and returns its AST."""
+
+        local = self.local
+
+        try:
+            parser = local.parser
+        except AttributeError:
+            parser = local.parser = self.parser_class()
+            local.semantics = ModelBuilderSemantics()
+
+        return parser.parse(text, semantics=local.semantics, **kwargs)
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+
+def clear_parser_cache():
+    """Removes the compiled parsers kept in memory."""
+
+    _parsers.clear()
+
+
+def _load_parser(filepath):
+    """Returns the parser pickled in filepath, or None if it is not valid."""
+
+    try:
+        with open(filepath, "rb") as file:
+            return pickle.load(file)
+    except Exception:
+        return None
+
+
+def _save_parser(parser, filepath):
+    """Pickles the parser into filepath.
+
+    The parser is written into a temporary file and then renamed, so other
+    processes never read a partially written file.
+    """
+
+    tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_filepath, "wb") as file:
+            pickle.dump(parser, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, filepath)
+    except OSError:
+        try:
+            os.remove(tmp_filepath)
+        except OSError:
+            pass
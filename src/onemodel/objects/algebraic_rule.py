@@ -1,7 +1,6 @@
-from libsbml import parseL3Formula
-
 from onemodel.utils.check import check
 from onemodel.utils.math_2_fullname import math_2_fullname
+from onemodel.utils.formula_2_ast import formula_2_ast
 from onemodel.objects.object import Object
 
 
@@ -29,25 +28,27 @@ class AlgebraicRule(Object):
         # We have to pass the variable to the other equation side.
         math = f"{self['variable']} - ({self['math']})"
         math_fullname = math_2_fullname(math, scope)
-        math_ast = parseL3Formula(math_fullname)
+        math_ast = formula_2_ast(math_fullname)
 
         r = model.createAlgebraicRule()
 
         check(
             r, 
-            f"create algebraic rule {fullname}"
+            "create algebraic rule {}", fullname
         )
 
         check(
             r.setIdAttribute(fullname), 
-            f"set algebraic rule id {fullname}"
+            "set algebraic rule id {}", fullname
         )
 
         check(
             r.setMath(math_ast),
-            f"set math on algebraic rule {fullname}"
+            "set math on algebraic rule {}", fullname
         )
 
+        self.add_to_SBML_index(fullname, "algebraic_rule", scope)
+
     def __repr__(self):
         result = "<algebraic-function"
         result += f" eq='{self['variable']} == {self['math'].strip()}'"
@@ -13,7 +13,7 @@ class Function(BaseFunction):
 
     def execute(self, scope):
         """ Run the builtin function given the scope. """
-        result = self.walker.walk(self["body"])
+        result = self.walker.execute(self["body"], scope)
         return result
 
     def __repr__(self):
@@ -1,5 +1,6 @@
 from onemodel.objects.object import Object
 from onemodel.objects.base_function import BaseFunction
+from onemodel.prototype import ModelPrototype
 
 class Model(BaseFunction):
     """ Models defined with onemodel syntax.
@@ -8,24 +9,42 @@ class Model(BaseFunction):
     ----------
     body : :obj:`ast`
         The abstract syntax tree of the body of a model.
+    prototype : :obj:`ModelPrototype`
+        The first instance of the model, cloned by the next calls (see
+        `onemodel.prototype`), or None.
     """
 
+    def __init__(self):
+        super().__init__()
+
+        self.prototype = None
+
     def execute(self, scope):
         """ Run the builtin function given the scope. """
 
+        prototype = self.prototype
+
+        if prototype is not None and prototype.is_valid(self, scope):
+            return prototype.instantiate(scope)
+
+        first_unnamed = getattr(scope, "numberOfUnnamedReactions", None)
+
         scope["self"] = Object()
         scope.push(scope["self"])
 
-        self.walker.walk(self["body"])
+        self.walker.execute(self["body"], scope)
 
         scope.pop()
         result = scope["self"]
 
+        if first_unnamed is not None:
+            self.prototype = ModelPrototype.create(self, result, scope, first_unnamed)
+
         return result
 
-    def extend(self):
+    def extend(self, scope):
         """Execute the model into current namespace. """
-        self.walker.walk(self["body"])
+        self.walker.execute(self["body"], scope)
 
     def __repr__(self):
         result = "<model"
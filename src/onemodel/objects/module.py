@@ -1,4 +1,5 @@
 import os
+import hashlib
 
 from onemodel.objects.object import Object
 
@@ -42,17 +43,25 @@ def load_module(walker, module_name, import_name=None, assign_name=None, qualifi
 
     filename = find_module(walker, module_name, qualifiers, dots_number)
 
-    module = Module()
-    module["__name__"] = module_name
-    module["__file__"] = filename
+    modules = walker.onemodel.modules
+    module = modules.get_module(filename)
 
-    file = open(filename)
-    text = file.read()
-    file.close()
-    
-    walker.onemodel.push(module)
-    walker.run(text)
-    walker.onemodel.pop()
+    if module is None:
+        module = Module()
+        module["__name__"] = module_name
+        module["__file__"] = filename
+
+        file = open(filename)
+        text = file.read()
+        file.close()
+
+        ast = modules.get_ast(walker, text)
+
+        walker.onemodel.push(module)
+        walker.walk(ast)
+        walker.onemodel.pop()
+
+        modules.add_module(filename, module, text)
 
     if assign_name is None and import_name:
         assign_name = import_name
@@ -97,3 +106,92 @@ class Module(Object):
         result += ">"
 
         return result
+
+class ModuleRegistry(dict):
+    """The modules already evaluated, indexed by their absolute path.
+
+    It works like Python `sys.modules`: a module is evaluated the first time
+    it is imported and the next imports reuse the same Module object. A
+    module is evaluated again if its file is modified.
+
+    Parameters
+    ----------
+    hits : :obj:`int`
+        Number of imports that reused an evaluated module.
+    misses : :obj:`int`
+        Number of imports that had to evaluate the module.
+    asts : :obj:`dict`
+        The ASTs of the modules by the hash of their text. The ASTs are not
+        changed by evaluating them, so several registries can share them
+        (e.g. the files exported by a process, see `export_file`), and each
+        one still evaluates its modules from scratch.
+    """
+
+    def __init__(self, asts=None):
+        super().__init__()
+        self.hits = 0
+        self.misses = 0
+        self.asts = {} if asts is None else asts
+
+    def get_module(self, filename):
+        """Returns the module of that file, or None if it has to be evaluated.
+
+        If the modification time of the file has changed, the hash of its
+        content decides whether the module is still valid.
+        """
+
+        entry = self.get(filename)
+
+        if entry is not None:
+            mtime, text_hash, module = entry
+
+            try:
+                new_mtime = os.path.getmtime(filename)
+            except OSError:
+                new_mtime = None
+
+            if new_mtime == mtime:
+                self.hits += 1
+                return module
+
+            if new_mtime is not None and _get_file_hash(filename) == text_hash:
+                self[filename] = (new_mtime, text_hash, module)
+                self.hits += 1
+                return module
+
+            del self[filename]
+
+        self.misses += 1
+        return None
+
+    def get_ast(self, walker, text):
+        """Returns the AST of the text of a module, parsing it only once."""
+
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        ast = self.asts.get(text_hash)
+
+        if ast is None:
+            ast = walker.parse(text, cache=True)
+            self.asts[text_hash] = ast
+
+        return ast
+
+    def add_module(self, filename, module, text):
+        """Saves the module evaluated from the text of that file."""
+
+        mtime = os.path.getmtime(filename)
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        self[filename] = (mtime, text_hash, module)
+
+    def stats(self):
+        """Returns the number of hits and misses of the registry."""
+
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _get_file_hash(filename):
+    with open(filename) as file:
+        text = file.read()
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
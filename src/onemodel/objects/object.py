@@ -39,6 +39,27 @@ class Object(Namespace):
         """
         pass
 
+    def add_to_SBML_index(self, fullname, kind, scope):
+        """Record the kind of SBML object emitted under a fullname.
+
+        The index lets other objects (e.g. reactions looking for their
+        modifiers) know what a fullname is without querying the SBML model.
+
+        Parameters
+        ----------
+        fullname : :obj:`str`
+            The id of the SBML object.
+        kind : :obj:`str`
+            The kind of SBML object (e.g. "species" or "parameter").
+        scope : :obj:`Scope`
+            The scope used for the export.
+        """
+
+        index = getattr(scope, "SBML_index", None)
+
+        if index is not None:
+            index[fullname] = kind
+
     def __repr__(self):
         result = "<object"
         result += ">"
@@ -33,29 +33,31 @@ class Parameter(Object):
 
         check(
             p,
-            f"create parameter {fullname}"
+            "create parameter {}", fullname
         )
 
         check(
             p.setId(fullname), 
-            f"set parameter {fullname} id"
+            "set parameter {} id", fullname
         )
 
         check(
             p.setConstant(self["isConstant"]), 
-            f'set parameter {fullname} "constant"'
+            'set parameter {} "constant"', fullname
         )
 
         check(
             p.setValue(self["value"]), 
-            f"set parameter {fullname} value"
+            "set parameter {} value", fullname
         )
 
         check(
             p.setUnits(self["units"]), 
-            f"set parameter {fullname} units"
+            "set parameter {} units", fullname
         )
 
+        self.add_to_SBML_index(fullname, "parameter", scope)
+
     def __repr__(self):
         result = "<parameter "
         result += f"value={self['value']}>"
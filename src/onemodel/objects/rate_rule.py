@@ -1,7 +1,6 @@
-from libsbml import parseL3Formula
-
 from onemodel.utils.check import check
 from onemodel.utils.math_2_fullname import math_2_fullname
+from onemodel.utils.formula_2_ast import formula_2_ast
 from onemodel.objects.object import Object
 
 
@@ -29,30 +28,32 @@ class RateRule(Object):
         variable_fullname = scope.get_fullname(self["variable"])
 
         math_fullname = math_2_fullname(self["math"], scope)
-        math_ast = parseL3Formula(math_fullname)
+        math_ast = formula_2_ast(math_fullname)
 
         r = model.createRateRule()
 
         check(
             r, 
-            f"create rate rule {fullname}"
+            "create rate rule {}", fullname
         )
 
         check(
             r.setIdAttribute(fullname), 
-            f"set rate rule id {fullname}"
+            "set rate rule id {}", fullname
         )
 
         check(
             r.setVariable(variable_fullname), 
-            f"set variable on rate rule {fullname}"
+            "set variable on rate rule {}", fullname
         )
 
         check(
             r.setMath(math_ast), 
-            f"set math on rate rule {fullname}"
+            "set math on rate rule {}", fullname
         )
 
+        self.add_to_SBML_index(fullname, "rate_rule", scope)
+
     def __repr__(self):
         result = "<rate-rule"
         result += f" eq='der({self['variable']}) := {self['math'].strip()}'"
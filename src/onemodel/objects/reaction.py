@@ -1,9 +1,11 @@
-from libsbml import Species, parseL3Formula
-
 from onemodel.utils.check import check
-from onemodel.utils.get_ast_names import get_ast_names
+from onemodel.utils.lazy_import import lazy_import
+from onemodel.utils.get_ast_names import get_formula_fullnames
 from onemodel.objects.object import Object
 from onemodel.utils.math_2_fullname import math_2_fullname
+from onemodel.utils.formula_2_ast import formula_2_ast
+
+libsbml = lazy_import("libsbml")
 
 
 class Reaction(Object):
@@ -27,8 +29,8 @@ class Reaction(Object):
     def add_to_SBML_model(self, name, scope, model):
         """Include this object into a SBML model. """
 
-        # List of species involved as reactans or products in the reaction.
-        species_involved = []
+        # Set of species involved as reactans or products in the reaction.
+        species_involved = set()
 
         r = self.create_SBML_reaction(name, scope, model)
         self.create_SBML_reaction_reactants(r, species_involved, scope)
@@ -44,12 +46,12 @@ class Reaction(Object):
 
         check(
             r, 
-            f"create reaction {fullname}"
+            "create reaction {}", fullname
         )
 
         check(
             r.setId(fullname), 
-            f"set reaction id {fullname}"
+            "set reaction id {}", fullname
         )
 
         check(
@@ -57,6 +59,8 @@ class Reaction(Object):
             "set reaction reversibility flag"
         )
 
+        self.add_to_SBML_index(fullname, "reaction", scope)
+
         return r
 
     def create_SBML_reaction_reactants(self, reaction, species_involved, scope):
@@ -77,15 +81,15 @@ class Reaction(Object):
 
             check(
                 reactant.setSpecies(fullname), 
-                f"assign reactant species {fullname}"
+                "assign reactant species {}", fullname
             )
 
             check(
                 reactant.setConstant(True), 
-                f'set "constant" on species {fullname}'
+                'set "constant" on species {}', fullname
             )
 
-            species_involved.append(fullname)
+            species_involved.add(fullname)
 
     def create_SBML_reaction_products(self, reaction, species_involved, scope):
         """Create and add the SBML products. """
@@ -110,16 +114,16 @@ class Reaction(Object):
 
             check(
                 species_ref.setConstant(True), 
-                f'set "constant" on species {fullname}'
+                'set "constant" on species {}', fullname
             )
 
-            species_involved.append(name)
+            species_involved.add(fullname)
 
     def create_SBML_reaction_kinetic_law(self, reaction, model, species_involved, scope):
         """Add the kinetic law to the reaction"""
 
         math_fullname = math_2_fullname(self["kinetic_law"], scope)
-        math_ast = parseL3Formula(math_fullname)
+        math_ast = formula_2_ast(math_fullname)
 
         check(
             math_ast, 
@@ -139,14 +143,22 @@ class Reaction(Object):
         )
 
         # Sometimes a species appears in the kinetic rate formula of a reaction 
-        # but is itself neither created nor destroyed in that reaction
-        names = get_ast_names(math_ast)
+        # but is itself neither created nor destroyed in that reaction. The
+        # names of the kinetic law are cached before resolving them, so they
+        # are shared by every instance of the same model.
+        names = get_formula_fullnames(self["kinetic_law"], scope)
         names_modifier = []
 
+        # Fullnames of the objects already exported.
+        index = getattr(scope, "SBML_index", None)
+
         for name in names:
-            elem = model.getElementBySId(name)
+            if index is not None:
+                is_species = index.get(name) == "species"
+            else:
+                is_species = type(model.getElementBySId(name)) == libsbml.Species
 
-            if type(elem) != Species:
+            if not is_species:
                 continue
 
             if name in species_involved:
@@ -33,44 +33,46 @@ class Species(Object):
 
         check(
             s,
-            f"create species {fullname}"
+            "create species {}", fullname
         )
 
         check(
             s.setId(fullname), 
-            f"set species {fullname} id"
+            "set species {} id", fullname
         )
 
         check(
             s.setCompartment(self["compartment"]), 
-            f"set species {fullname} in default_compartment"
+            "set species {} in default_compartment", fullname
         )
 
         check(
             s.setConstant(self["constant"]), 
-            f'set "constant" attribute on {fullname}'
+            'set "constant" attribute on {}', fullname
         )
 
         check(
             s.setInitialConcentration(self["initialConcentration"]), 
-            f"set initial amount for {fullname}"
+            "set initial amount for {}", fullname
         )
 
         check(
             s.setSubstanceUnits(self["substanceUnits"]), 
-            f"set substance units for {fullname}"
+            "set substance units for {}", fullname
         )
 
         check(
             s.setBoundaryCondition(self["boundaryCondition"]), 
-            f'set "boundaryCondition" on {fullname}'
+            'set "boundaryCondition" on {}', fullname
         )
 
         check(
             s.setHasOnlySubstanceUnits(self["hasOnlySubstanceUnits"]),
-            f'set "hasOnlySubstanceUnits" on {fullname}',
+            'set "hasOnlySubstanceUnits" on {}', fullname,
         )
 
+        self.add_to_SBML_index(fullname, "species", scope)
+
     def __repr__(self):
         result = "<species"
         result += f" initialConcentration={self['initialConcentration']}"
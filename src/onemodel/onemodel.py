@@ -1,10 +1,92 @@
-import libsbml
-from libsbml import UNIT_KIND_SECOND, SBMLDocument
-
-from onemodel.utils.check import check
+import io
+import os
+from contextlib import nullcontext
+
+from onemodel.utils.check import check, deferred_checks
+from onemodel.utils.lazy_import import lazy_import
+from onemodel.utils.get_SBML_elements import get_SBML_elements
+from onemodel.utils.set_SBML_values import set_SBML_values
 from onemodel.namespace import Namespace
-from onemodel.scope import Scope
+from onemodel.scope import Scope, ExportScope
 from onemodel.objects.object import Object
+from onemodel.objects.module import ModuleRegistry
+from onemodel.sbml_xml import XMLDocument
+
+libsbml = lazy_import("libsbml")
+
+
+def _create_libsbml_document(level, version):
+    return libsbml.SBMLDocument(level, version)
+
+
+# Functions that create an empty SBML document for each backend.
+SBML_backends = {
+    "libsbml": _create_libsbml_document,
+    "xml": XMLDocument,
+}
+
+
+def init_SBML_document(model_name, backend="libsbml"):
+    """Creates a SBML document with the units and compartment of OneModel.
+
+    Parameters
+    ----------
+    model_name : :obj:`str`
+        The id and name of the SBML model.
+    backend : :obj:`str`
+        "libsbml" or "xml" (see `OneModel.get_SBML_string`).
+
+    Returns
+    -------
+    SBML_document, SBML_model
+        The document and its model, where the objects are added.
+    """
+
+    # Create and empty SBMLDocument object.
+    try:
+        SBML_document = SBML_backends[backend](3, 2)
+    except ValueError:
+        raise SystemExit("Could not create SBMLDocument object")
+
+    # Create the basic Model object inside the SBMLDocument object.
+    SBML_model = SBML_document.createModel()
+    check(SBML_model, "create model")
+    check(SBML_model.setName(model_name), "set model name")
+    check(SBML_model.setId(model_name), "set model id")
+    check(SBML_model.setTimeUnits("second"), "set model-wide time units")
+    check(SBML_model.setExtentUnits("mole"), "set model units of extent")
+    check(SBML_model.setSubstanceUnits("mole"), "set model substance units")
+
+    # Create a unit definition we will need later.
+    per_second = SBML_model.createUnitDefinition()
+    check(per_second, "create unit definition")
+    check(per_second.setId("per_second"), "set unit definition id")
+
+    unit = per_second.createUnit()
+    check(unit, "create unit on per_second")
+    check(unit.setKind(libsbml.UNIT_KIND_SECOND), "set unit kind")
+    check(unit.setExponent(-1), "set unit exponent")
+    check(unit.setScale(0), "set unit scale")
+    check(unit.setMultiplier(1), "set unit multiplier")
+
+    # Create a default_compartment.
+    c = SBML_model.createCompartment()
+
+    # TODO: This should be added to root context.
+    # self.current_context.set(
+    #    'default_compartment',
+    #    c
+    # )
+
+    check(c, "create default compartment")
+    check(c.setId("default_compartment"), "set compartment id")
+    check(c.setConstant(True), 'set compartment "constant"')
+    check(c.setSize(1), 'set compartment "size"')
+    check(c.setSpatialDimensions(3), "set compartment dimensions")
+    check(c.setUnits("litre"), "set compartment size units")
+
+    return SBML_document, SBML_model
+
 
 class OneModel(Scope):
     """OneModel contains the root namespace where we define the models.
@@ -20,6 +102,29 @@ class OneModel(Scope):
 
     root : :obj:`Namespace`
         The root namespace of the model.
+
+    modules : :obj:`ModuleRegistry`
+        The modules imported in this session.
+
+    SBML_document : :obj:`libsbml.SBMLDocument`
+        The SBML document kept by `to_SBML_document(keep=True)`, or None.
+
+    SBML_index : :obj:`dict`
+        The kind of SBML object (e.g. "species") emitted under each fullname
+        of `SBML_document`.
+
+    SBML_elements : :obj:`dict`
+        The parameters and species of `SBML_document` by fullname.
+
+    numberOfUnnamedReactions : :obj:`int`
+        The number of reactions and rules defined without a name, used to
+        name them (e.g. `_J0` or `_R1`).
+
+    Notes
+    -----
+    The SBML export walks the model with its own `ExportScope`, so it does
+    not change the namespaces of the session, and the same model can be
+    exported from several threads at the same time.
     """
 
     def __init__(self):
@@ -28,84 +133,209 @@ class OneModel(Scope):
         self.model_name = "main"
         self.root = Namespace()
         self.locals = Namespace()
+        self.modules = ModuleRegistry()
+        self.SBML_document = None
+        self.SBML_index = {}
+        self.SBML_elements = {}
+        self.numberOfUnnamedReactions = 0
 
         self.push(self.root, "")
         self.locals = Namespace()
 
-    def get_SBML_string(self):
-        """Returns a SBML representation of the model. """
+    def save_snapshot(self, path):
+        """Saves the evaluated model into a snapshot file.
+
+        See `onemodel.snapshot.save_snapshot` and `load_snapshot`.
+        """
+
+        from onemodel.snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    def __getstate__(self):
+        # The libsbml objects of the kept SBML document cannot be pickled.
+        state = self.__dict__.copy()
+        state["SBML_document"] = None
+        state["SBML_index"] = {}
+        state["SBML_elements"] = {}
+
+        return state
+
+    def to_SBML_document(self, keep=False, mode="debug"):
+        """Returns the model as a libsbml.SBMLDocument.
+
+        This avoids writing the model into a SBML string and reading it back
+        with libsbml (e.g. to pass it to a simulator).
+
+        Parameters
+        ----------
+        keep : :obj:`bool`
+            If True, also keep the document in `SBML_document` (and the
+            fullnames emitted in `SBML_index`), so it can be modified later
+            in place.
+        mode : :obj:`str`
+            "debug" or "release" (see `get_SBML_string`).
+        """
+
+        scope = ExportScope(self.root)
+        SBML_document = self._create_SBML_document(mode=mode, scope=scope)
+
+        if keep:
+            self.SBML_document = SBML_document
+            self.SBML_index = scope.SBML_index
+            self.SBML_elements = get_SBML_elements(SBML_document)
+
+        return SBML_document
+
+    def set_SBML_values(self, values):
+        """Changes values of the document kept by `to_SBML_document`.
+
+        Only the SBML document is modified, in place, so each change costs a
+        lookup in `SBML_index` instead of exporting the model again. The
+        objects of the model keep their values.
+
+        Parameters
+        ----------
+        values : :obj:`dict`
+            The new values by dotted name (e.g. `circuit.z1.k`). The value
+            of a parameter is its "value", and the value of a species is its
+            "initialConcentration".
+        """
+
+        if self.SBML_document is None:
+            raise ValueError(
+                "There is no SBML document, use to_SBML_document(keep=True) first"
+            )
+
+        set_SBML_values(self.SBML_elements, self.SBML_index, values)
+
+    def get_SBML_string(self, backend="libsbml", cache=None, mode="debug"):
+        """Returns a SBML representation of the model.
+
+        Parameters
+        ----------
+        backend : :obj:`str`
+            "libsbml" builds the document with libsbml. "xml" writes the XML
+            directly in Python (libsbml is only used for the MathML), which
+            is faster for large models.
+        cache : :obj:`SBMLFragmentCache`
+            Reuse the SBML elements of the objects that have not changed
+            since a previous export with the same cache (only with the "xml"
+            backend).
+        mode : :obj:`str`
+            "debug" stops at the first libsbml error. "release" checks all
+            the libsbml status codes at the end and reports every error
+            together, which is faster for large models.
+        """
+
+        SBML_document = self._create_SBML_document(backend, cache, mode)
+
+        if backend == "xml":
+            return SBML_document.write_to_string()
 
-        # Perform self.pop() until the root namespace.
-        while len(self.namespaces) > 1:
-            self.pop()
-
-        SBML_document, SBML_model = self._init_SBML_document()
-        self._populate_SBML_document(SBML_model)
-        # self.check_SBML_consistency()
         result = libsbml.writeSBMLToString(SBML_document)
 
         return result
 
-    def _init_SBML_document(self):
+    def export_SBML(self, file, backend="libsbml", cache=None, mode="debug"):
+        """Writes the SBML representation of the model into a file.
+
+        If a path is given, the document is written directly by libsbml
+        without building the whole SBML string in memory. Paths ending in
+        `.gz`, `.bz2` or `.zip` are compressed.
+
+        Parameters
+        ----------
+        file : :obj:`str`, :obj:`os.PathLike` or file object
+            Where to write the SBML document.
+        backend : :obj:`str`
+            The backend used to build the document (see `get_SBML_string`).
+        cache : :obj:`SBMLFragmentCache`
+            The cache of SBML elements (see `get_SBML_string`).
+        mode : :obj:`str`
+            "debug" or "release" (see `get_SBML_string`).
+        """
+
+        SBML_document = self._create_SBML_document(backend, cache, mode)
+
+        if isinstance(file, (str, os.PathLike)) and backend == "xml":
+            SBML_document.write_to_file(os.fspath(file))
+            return
+
+        if isinstance(file, (str, os.PathLike)):
+            filename = os.fspath(file)
+            writer = libsbml.SBMLWriter()
+
+            if not writer.writeSBMLToFile(SBML_document, filename):
+                raise OSError(f"Could not write SBML file '{filename}'")
+
+            return
+
+        # libsbml cannot write into Python file objects.
+        if backend == "xml":
+            result = SBML_document.write_to_string()
+        else:
+            result = libsbml.writeSBMLToString(SBML_document)
+
+        if isinstance(file, io.TextIOBase):
+            file.write(result)
+        else:
+            file.write(result.encode("utf-8"))
+
+    def _create_SBML_document(
+        self, backend="libsbml", cache=None, mode="debug", scope=None
+    ):
+        """Creates the SBML document of the model.
+
+        Parameters
+        ----------
+        scope : :obj:`ExportScope`
+            The scope used to walk the model. By default, a new scope that
+            starts at the root namespace.
+        """
+
+        if backend not in SBML_backends:
+            raise ValueError(f"Unknown SBML backend '{backend}'")
+
+        if cache is not None and backend != "xml":
+            raise ValueError("The SBML fragment cache requires the 'xml' backend")
+
+        if mode not in ["debug", "release"]:
+            raise ValueError(f"Unknown SBML export mode '{mode}'")
+
+        if scope is None:
+            scope = ExportScope(self.root)
+
+        checks = deferred_checks() if mode == "release" else nullcontext()
+
+        with checks:
+            SBML_document, SBML_model = self._init_SBML_document(backend)
+            self._populate_SBML_document(scope, SBML_model, cache)
+        # self.check_SBML_consistency()
+
+        return SBML_document
+
+    def _init_SBML_document(self, backend="libsbml"):
         """Initializes the SBML document. """
 
-        # Create and empty SBMLDocument object.
-        try:
-            SBML_document = SBMLDocument(3, 2)
-        except ValueError:
-            raise SystemExit("Could not create SBMLDocument object")
-
-        # Create the basic Model object inside the SBMLDocument object.
-        SBML_model = SBML_document.createModel()
-        check(SBML_model, "create model")
-        check(SBML_model.setName(self.model_name), "set model name")
-        check(SBML_model.setId(self.model_name), "set model id")
-        check(SBML_model.setTimeUnits("second"), "set model-wide time units")
-        check(SBML_model.setExtentUnits("mole"), "set model units of extent")
-        check(SBML_model.setSubstanceUnits("mole"), "set model substance units")
-
-        # Create a unit definition we will need later.
-        per_second = SBML_model.createUnitDefinition()
-        check(per_second, "create unit definition")
-        check(per_second.setId("per_second"), "set unit definition id")
-
-        unit = per_second.createUnit()
-        check(unit, "create unit on per_second")
-        check(unit.setKind(UNIT_KIND_SECOND), "set unit kind")
-        check(unit.setExponent(-1), "set unit exponent")
-        check(unit.setScale(0), "set unit scale")
-        check(unit.setMultiplier(1), "set unit multiplier")
-
-        # Create a default_compartment.
-        c = SBML_model.createCompartment()
-
-        # TODO: This should be added to root context.
-        # self.current_context.set(
-        #    'default_compartment',
-        #    c
-        # )
-
-        check(c, "create default compartment")
-        check(c.setId("default_compartment"), "set compartment id")
-        check(c.setConstant(True), 'set compartment "constant"')
-        check(c.setSize(1), 'set compartment "size"')
-        check(c.setSpatialDimensions(3), "set compartment dimensions")
-        check(c.setUnits("litre"), "set compartment size units")
-
-        return SBML_document, SBML_model
-
-    def _populate_SBML_document(self, SBML_model):
-        """Populates the SBML with the objects in the root namespace."""
-
-        for name, value in self.peek().items():
+        return init_SBML_document(self.model_name, backend)
+
+    def _populate_SBML_document(self, scope, SBML_model, cache=None):
+        """Populates the SBML with the objects in the last namespace of scope."""
+
+        for name, value in scope.peek().items():
 
             if not isinstance(value, Object):
                 continue
 
-            value.add_to_SBML_model(name, self, SBML_model)
-            self.push(value, name)
-            self._populate_SBML_document(SBML_model)
-            self.pop()
+            if cache is None:
+                value.add_to_SBML_model(name, scope, SBML_model)
+            else:
+                cache.add_to_SBML_model(value, name, scope, SBML_model)
+
+            scope.push(value, name)
+            self._populate_SBML_document(scope, SBML_model, cache)
+            scope.pop()
 
     def __str__(self):
         from tabulate import tabulate
@@ -0,0 +1,1045 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# CAVEAT UTILITOR
+#
+# This file was automatically generated by TatSu.
+#
+#    https://pypi.python.org/pypi/tatsu/
+#
+# Any changes you make to it will be overwritten the next time
+# the file is generated.
+
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import sys
+
+from tatsu.buffering import Buffer
+from tatsu.parsing import Parser
+from tatsu.parsing import tatsumasu, leftrec, nomemo
+from tatsu.parsing import leftrec, nomemo  # noqa
+from tatsu.util import re, generic_main  # noqa
+
+
+KEYWORDS = {
+    'end',
+    'extends',
+    'from',
+    'function',
+    'has',
+    'if',
+    'import',
+    'input',
+    'model',
+    'parameter',
+    'reaction',
+    'rule',
+    'species',
+    'standalone',
+}  # type: ignore
+
+
+class OneModelBuffer(Buffer):
+    def __init__(
+        self,
+        text,
+        whitespace=re.compile('[\\t ]+'),
+        nameguard=None,
+        comments_re=None,
+        eol_comments_re='#.*?$',
+        ignorecase=None,
+        namechars='',
+        **kwargs
+    ):
+        super(OneModelBuffer, self).__init__(
+            text,
+            whitespace=whitespace,
+            nameguard=nameguard,
+            comments_re=comments_re,
+            eol_comments_re=eol_comments_re,
+            ignorecase=ignorecase,
+            namechars=namechars,
+            **kwargs
+        )
+
+
+class OneModelParser(Parser):
+    def __init__(
+        self,
+        whitespace=re.compile('[\\t ]+'),
+        nameguard=None,
+        comments_re=None,
+        eol_comments_re='#.*?$',
+        ignorecase=None,
+        left_recursion=True,
+        parseinfo=True,
+        keywords=None,
+        namechars='',
+        buffer_class=OneModelBuffer,
+        **kwargs
+    ):
+        if keywords is None:
+            keywords = KEYWORDS
+        super(OneModelParser, self).__init__(
+            whitespace=whitespace,
+            nameguard=nameguard,
+            comments_re=comments_re,
+            eol_comments_re=eol_comments_re,
+            ignorecase=ignorecase,
+            left_recursion=left_recursion,
+            parseinfo=parseinfo,
+            keywords=keywords,
+            namechars=namechars,
+            buffer_class=buffer_class,
+            **kwargs
+        )
+
+    @tatsumasu()
+    @nomemo
+    def _start_(self):  # noqa
+
+        def block0():
+            self._statements_()
+            self.name_last_node('@')
+        self._closure(block0)
+        self._check_eof()
+
+    @tatsumasu()
+    @nomemo
+    def _statements_(self):  # noqa
+
+        def block0():
+            self._newline_()
+        self._closure(block0)
+        self._statement_()
+        self.name_last_node('@')
+
+        def block2():
+
+            def block3():
+                self._newline_()
+            self._positive_closure(block3)
+            self._statement_()
+            self.name_last_node('@')
+        self._closure(block2)
+
+        def block5():
+            self._newline_()
+        self._closure(block5)
+
+    @tatsumasu()
+    @nomemo
+    def _statement_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token('parameter')
+                self._newline_()
+                self._cut()
+
+                def block0():
+                    with self._choice():
+                        with self._option():
+                            self._newline_()
+                        with self._option():
+                            self._parameter_()
+                            self.name_last_node('@')
+
+                            def block2():
+                                self._token(',')
+                                self._parameter_()
+                                self.name_last_node('@')
+                            self._closure(block2)
+                            self._newline_()
+                        self._error('no available options')
+                self._closure(block0)
+                self._token('end')
+            with self._option():
+                self._token('species')
+                self._newline_()
+                self._cut()
+
+                def block5():
+                    with self._choice():
+                        with self._option():
+                            self._newline_()
+                        with self._option():
+                            self._species_()
+                            self.name_last_node('@')
+
+                            def block7():
+                                self._token(',')
+                                self._species_()
+                                self.name_last_node('@')
+                            self._closure(block7)
+                            self._newline_()
+                        self._error('no available options')
+                self._closure(block5)
+                self._token('end')
+            with self._option():
+                self._token('reaction')
+                self._newline_()
+                self._cut()
+
+                def block10():
+                    with self._choice():
+                        with self._option():
+                            self._newline_()
+                        with self._option():
+                            self._reaction_()
+                            self.name_last_node('@')
+                        self._error('no available options')
+                self._closure(block10)
+                self._token('end')
+            with self._option():
+                self._token('rule')
+                self._newline_()
+                self._cut()
+
+                def block13():
+                    with self._choice():
+                        with self._option():
+                            self._newline_()
+                        with self._option():
+                            self._rule_()
+                            self.name_last_node('@')
+                            self._newline_()
+                        self._error('no available options')
+                self._closure(block13)
+                self._token('end')
+            with self._option():
+                self._import_()
+            with self._option():
+                self._expression_()
+            self._error('no available options')
+
+    @tatsumasu()
+    @leftrec
+    def _expression_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token('parameter')
+                self._cut()
+                self._parameter_()
+                self.name_last_node('@')
+
+                def block1():
+                    self._token(',')
+                    self._parameter_()
+                    self.name_last_node('@')
+                self._closure(block1)
+            with self._option():
+                self._token('species')
+                self._cut()
+                self._species_()
+                self.name_last_node('@')
+
+                def block4():
+                    self._token(',')
+                    self._species_()
+                    self.name_last_node('@')
+                self._closure(block4)
+            with self._option():
+                self._token('reaction')
+                self._cut()
+                self._reaction_()
+                self.name_last_node('@')
+            with self._option():
+                self._token('rule')
+                self._cut()
+                self._rule_()
+                self.name_last_node('@')
+            with self._option():
+                self._token('extends')
+                self._cut()
+                self._extends_()
+                self.name_last_node('@')
+            with self._option():
+                self._addition_()
+            with self._option():
+                self._subtraction_()
+            with self._option():
+                self._assign_name_()
+            with self._option():
+                self._term_()
+            self._error('no available options')
+
+    @tatsumasu('Addition')
+    @nomemo
+    def _addition_(self):  # noqa
+        self._expression_()
+        self.name_last_node('left')
+        self._token('+')
+        self.name_last_node('op')
+        self._cut()
+        self._term_()
+        self.name_last_node('right')
+        self.ast._define(
+            ['left', 'op', 'right'],
+            []
+        )
+
+    @tatsumasu('Subtraction')
+    @nomemo
+    def _subtraction_(self):  # noqa
+        self._expression_()
+        self.name_last_node('left')
+        self._token('-')
+        self.name_last_node('op')
+        self._cut()
+        self._term_()
+        self.name_last_node('right')
+        self.ast._define(
+            ['left', 'op', 'right'],
+            []
+        )
+
+    @tatsumasu()
+    @leftrec
+    def _term_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._multiplication_()
+            with self._option():
+                self._division_()
+            with self._option():
+                self._factor_()
+            self._error('no available options')
+
+    @tatsumasu('Multiplication')
+    @nomemo
+    def _multiplication_(self):  # noqa
+        self._term_()
+        self.name_last_node('left')
+        self._token('*')
+        self.name_last_node('op')
+        self._cut()
+        self._factor_()
+        self.name_last_node('right')
+        self.ast._define(
+            ['left', 'op', 'right'],
+            []
+        )
+
+    @tatsumasu('Division')
+    @nomemo
+    def _division_(self):  # noqa
+        self._term_()
+        self.name_last_node('left')
+        self._token('/')
+        self.name_last_node('op')
+        self._cut()
+        self._factor_()
+        self.name_last_node('right')
+        self.ast._define(
+            ['left', 'op', 'right'],
+            []
+        )
+
+    @tatsumasu()
+    def _factor_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token('+')
+                self._cut()
+                self._factor_()
+                self.name_last_node('@')
+            with self._option():
+                self._inverse_addition_()
+            with self._option():
+                self._power_()
+            self._error('no available options')
+
+    @tatsumasu('InverseAddition')
+    def _inverse_addition_(self):  # noqa
+        self._token('-')
+        self._cut()
+        self._factor_()
+        self.name_last_node('base')
+        self.ast._define(
+            ['base'],
+            []
+        )
+
+    @tatsumasu('Power')
+    def _power_(self):  # noqa
+        self._call_()
+        self.name_last_node('base')
+        with self._optional():
+            self._token('^')
+            self._cut()
+            self._factor_()
+            self.name_last_node('exponent')
+        self.ast._define(
+            ['base', 'exponent'],
+            []
+        )
+
+    @tatsumasu('Call')
+    def _call_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._atom_()
+                self.name_last_node('value')
+                self._token('(')
+                with self._optional():
+                    self._expression_()
+                    self.add_last_node_to_name('args')
+
+                    def block2():
+                        self._token(',')
+                        self._expression_()
+                        self.add_last_node_to_name('args')
+                    self._closure(block2)
+                self._token(')')
+            with self._option():
+                self._atom_()
+                self.name_last_node('next')
+            self._error('no available options')
+        self.ast._define(
+            ['next', 'value'],
+            ['args']
+        )
+
+    @tatsumasu()
+    def _atom_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token('(')
+                self._cut()
+                self._expression_()
+                self.name_last_node('@')
+                self._token(')')
+            with self._option():
+                self._number_()
+            with self._option():
+                self._docstring_()
+            with self._option():
+                self._string_()
+            with self._option():
+                self._access_name_()
+            with self._option():
+                self._function_definition_()
+            with self._option():
+                self._model_definition_()
+            with self._option():
+                self._standalone_()
+            self._error('no available options')
+
+    @tatsumasu()
+    def _number_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._float_()
+            with self._option():
+                self._integer_()
+            self._error('no available options')
+
+    @tatsumasu()
+    def _newline_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token(';')
+            with self._option():
+                self._pattern('\\n')
+            self._error('no available options')
+
+    @tatsumasu('Import')
+    def _import_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token('import')
+                self._cut()
+
+                def block0():
+                    self._token('.')
+                    self.add_last_node_to_name('dots')
+                self._closure(block0)
+
+                def block2():
+                    self._name_()
+                    self.add_last_node_to_name('qualifiers')
+                    self._token('.')
+                self._closure(block2)
+                self._name_()
+                self.name_last_node('module_name')
+                with self._optional():
+                    self._token('as')
+                    self._name_()
+                    self.name_last_node('assign_name')
+            with self._option():
+                self._token('from')
+                self._cut()
+
+                def block6():
+                    self._token('.')
+                    self.add_last_node_to_name('dots')
+                self._closure(block6)
+
+                def block8():
+                    self._name_()
+                    self.add_last_node_to_name('qualifiers')
+                    self._token('.')
+                self._closure(block8)
+                self._name_()
+                self.name_last_node('module_name')
+                self._token('import')
+                self._name_()
+                self.name_last_node('import_name')
+                with self._optional():
+                    self._token('as')
+                    self._name_()
+                    self.name_last_node('assign_name')
+            self._error('no available options')
+        self.ast._define(
+            ['assign_name', 'import_name', 'module_name'],
+            ['dots', 'qualifiers']
+        )
+
+    @tatsumasu('Parameter')
+    def _parameter_(self):  # noqa
+        self._dotted_name_()
+        self.name_last_node('name')
+        with self._optional():
+            self._token('=')
+            self._number_()
+            self.name_last_node('value')
+        with self._optional():
+            with self._optional():
+                self._newline_()
+            with self._group():
+                with self._choice():
+                    with self._option():
+                        self._docstring_()
+                    with self._option():
+                        self._string_()
+                    self._error('no available options')
+            self.name_last_node('documentation')
+        self.ast._define(
+            ['documentation', 'name', 'value'],
+            []
+        )
+
+    @tatsumasu('Species')
+    def _species_(self):  # noqa
+        with self._optional():
+            self._token('input')
+        self._dotted_name_()
+        self.name_last_node('name')
+        with self._optional():
+            self._token('=')
+            self._number_()
+            self.name_last_node('value')
+        with self._optional():
+            with self._optional():
+                self._newline_()
+            with self._group():
+                with self._choice():
+                    with self._option():
+                        self._docstring_()
+                    with self._option():
+                        self._string_()
+                    self._error('no available options')
+            self.name_last_node('documentation')
+        self.ast._define(
+            ['documentation', 'name', 'value'],
+            []
+        )
+
+    @tatsumasu('Reaction')
+    def _reaction_(self):  # noqa
+        with self._optional():
+            self._dotted_name_()
+            self.name_last_node('name')
+            self._token(':')
+        with self._group():
+            with self._choice():
+                with self._option():
+                    self._token('0')
+                with self._option():
+                    self._dotted_name_()
+                    self.add_last_node_to_name('reactants')
+
+                    def block2():
+                        with self._choice():
+                            with self._option():
+                                self._token('+')
+                            with self._option():
+                                self._dotted_name_()
+                                self.add_last_node_to_name('reactants')
+                            self._error('no available options')
+                    self._closure(block2)
+                self._error('no available options')
+        self._token('->')
+        with self._group():
+            with self._choice():
+                with self._option():
+                    self._token('0')
+                with self._option():
+                    self._dotted_name_()
+                    self.add_last_node_to_name('products')
+
+                    def block7():
+                        with self._choice():
+                            with self._option():
+                                self._token('+')
+                            with self._option():
+                                self._dotted_name_()
+                                self.add_last_node_to_name('products')
+                            self._error('no available options')
+                    self._closure(block7)
+                self._error('no available options')
+        self._newline_()
+        self._formula_()
+        self.name_last_node('kinetic_law')
+        with self._optional():
+            with self._optional():
+                self._newline_()
+            with self._group():
+                with self._choice():
+                    with self._option():
+                        self._docstring_()
+                    with self._option():
+                        self._string_()
+                    self._error('no available options')
+            self.name_last_node('documentation')
+        self.ast._define(
+            ['documentation', 'kinetic_law', 'name'],
+            ['products', 'reactants']
+        )
+
+    @tatsumasu()
+    def _rule_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._assignment_rule_()
+            with self._option():
+                self._algebraic_rule_()
+            with self._option():
+                self._rate_rule_()
+            self._error('no available options')
+
+    @tatsumasu('AssignmentRule')
+    def _assignment_rule_(self):  # noqa
+        with self._optional():
+            self._dotted_name_()
+            self.name_last_node('name')
+            self._token(':')
+            with self._ifnot():
+                self._token('=')
+        self._dotted_name_()
+        self.name_last_node('variable')
+        self._token(':=')
+        self._formula_()
+        self.name_last_node('math')
+        with self._optional():
+            with self._optional():
+                self._newline_()
+            with self._group():
+                with self._choice():
+                    with self._option():
+                        self._docstring_()
+                    with self._option():
+                        self._string_()
+                    self._error('no available options')
+            self.name_last_node('documentation')
+        self.ast._define(
+            ['documentation', 'math', 'name', 'variable'],
+            []
+        )
+
+    @tatsumasu('AlgebraicRule')
+    def _algebraic_rule_(self):  # noqa
+        with self._optional():
+            self._dotted_name_()
+            self.name_last_node('name')
+            self._token(':')
+        self._dotted_name_()
+        self.name_last_node('variable')
+        self._token('==')
+        self._formula_()
+        self.name_last_node('math')
+        with self._optional():
+            with self._optional():
+                self._newline_()
+            with self._group():
+                with self._choice():
+                    with self._option():
+                        self._docstring_()
+                    with self._option():
+                        self._string_()
+                    self._error('no available options')
+            self.name_last_node('documentation')
+        self.ast._define(
+            ['documentation', 'math', 'name', 'variable'],
+            []
+        )
+
+    @tatsumasu('RateRule')
+    def _rate_rule_(self):  # noqa
+        with self._optional():
+            self._dotted_name_()
+            self.name_last_node('name')
+            self._token(':')
+            with self._ifnot():
+                self._token('=')
+        self._token('der')
+        self._token('(')
+        self._dotted_name_()
+        self.name_last_node('variable')
+        self._token(')')
+        self._token(':=')
+        self._formula_()
+        self.name_last_node('math')
+        with self._optional():
+            with self._optional():
+                self._newline_()
+            with self._group():
+                with self._choice():
+                    with self._option():
+                        self._docstring_()
+                    with self._option():
+                        self._string_()
+                    self._error('no available options')
+            self.name_last_node('documentation')
+        self.ast._define(
+            ['documentation', 'math', 'name', 'variable'],
+            []
+        )
+
+    @tatsumasu('Extends')
+    def _extends_(self):  # noqa
+        self._access_name_()
+        self.name_last_node('model')
+        self.ast._define(
+            ['model'],
+            []
+        )
+
+    @tatsumasu('AssignName')
+    def _assign_name_(self):  # noqa
+        self._dotted_name_()
+        self.name_last_node('name')
+        self._token('=')
+        self._expression_()
+        self.name_last_node('value')
+        self.ast._define(
+            ['name', 'value'],
+            []
+        )
+
+    @tatsumasu('AccessName')
+    def _access_name_(self):  # noqa
+        self._dotted_name_()
+        self.name_last_node('name')
+        self.ast._define(
+            ['name'],
+            []
+        )
+
+    @tatsumasu('FunctionDefinition')
+    def _function_definition_(self):  # noqa
+        self._token('function')
+        self._name_()
+        self.name_last_node('name')
+        self._token('(')
+        with self._optional():
+            self._name_()
+            self.add_last_node_to_name('args')
+
+            def block2():
+                self._token(',')
+                self._name_()
+                self.add_last_node_to_name('args')
+            self._closure(block2)
+        self._token(')')
+        self._newline_()
+
+        def block4():
+            with self._choice():
+                with self._option():
+                    self._newline_()
+                with self._option():
+                    self._statement_()
+                    self.name_last_node('body')
+                    self._newline_()
+                self._error('no available options')
+        self._closure(block4)
+        self._token('end')
+        self.ast._define(
+            ['body', 'name'],
+            ['args']
+        )
+
+    @tatsumasu('ModelDefinition')
+    def _model_definition_(self):  # noqa
+        self._token('model')
+        self._name_()
+        self.name_last_node('name')
+        self._newline_()
+
+        def block1():
+            with self._choice():
+                with self._option():
+                    self._newline_()
+                with self._option():
+                    self._statement_()
+                    self.name_last_node('body')
+                    self._newline_()
+                self._error('no available options')
+        self._closure(block1)
+        self._token('end')
+        self.ast._define(
+            ['body', 'name'],
+            []
+        )
+
+    @tatsumasu('Standalone')
+    def _standalone_(self):  # noqa
+        self._token('standalone')
+        self._newline_()
+
+        def block0():
+            with self._choice():
+                with self._option():
+                    self._newline_()
+                with self._option():
+                    self._statement_()
+                    self.name_last_node('body')
+                    self._newline_()
+                self._error('no available options')
+        self._closure(block0)
+        self._token('end')
+        self.ast._define(
+            ['body'],
+            []
+        )
+
+    @tatsumasu('DottedName')
+    def _dotted_name_(self):  # noqa
+
+        def block0():
+            self._name_()
+            self.add_last_node_to_name('qualifiers')
+            self._token('.')
+        self._closure(block0)
+        self._name_()
+        self.name_last_node('name')
+        self.ast._define(
+            ['name'],
+            ['qualifiers']
+        )
+
+    @tatsumasu('str')
+    def _name_(self):  # noqa
+        self._pattern('(?!\\d)\\w+')
+        self._check_name()
+
+    @tatsumasu('Float')
+    def _float_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._pattern('\\d*(?:\\.\\d+)?(?:(e|E)(?:\\+|\\-|)\\d+)')
+                self.name_last_node('value')
+            with self._option():
+                self._pattern('\\d*\\.\\d+')
+                self.name_last_node('value')
+            self._error('no available options')
+        self.ast._define(
+            ['value'],
+            []
+        )
+
+    @tatsumasu('Integer')
+    def _integer_(self):  # noqa
+        self._pattern('\\d+')
+        self.name_last_node('value')
+        self.ast._define(
+            ['value'],
+            []
+        )
+
+    @tatsumasu('Docstring')
+    def _docstring_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token('"""')
+                self._cut()
+                self._pattern('[\\w\\W]*?(?=\\")')
+                self.name_last_node('value')
+                self._token('"""')
+            with self._option():
+                self._token("'''")
+                self._cut()
+                self._pattern("[\\w\\W]*?(?=\\')")
+                self.name_last_node('value')
+                self._token("'''")
+            self._error('no available options')
+        self.ast._define(
+            ['value'],
+            []
+        )
+
+    @tatsumasu('String')
+    def _string_(self):  # noqa
+        with self._choice():
+            with self._option():
+                self._token('"')
+                self._pattern('.+?(?=\\")')
+                self.name_last_node('value')
+                self._token('"')
+            with self._option():
+                self._token("'")
+                self._pattern(".+?(?=\\')")
+                self.name_last_node('value')
+                self._token("'")
+            self._error('no available options')
+        self.ast._define(
+            ['value'],
+            []
+        )
+
+    @tatsumasu('str')
+    def _formula_(self):  # noqa
+        self._pattern('[^\\\\\\r\\n\\f\'\\;#\\"]*')
+
+
+class OneModelSemantics(object):
+    def start(self, ast):  # noqa
+        return ast
+
+    def statements(self, ast):  # noqa
+        return ast
+
+    def statement(self, ast):  # noqa
+        return ast
+
+    def expression(self, ast):  # noqa
+        return ast
+
+    def addition(self, ast):  # noqa
+        return ast
+
+    def subtraction(self, ast):  # noqa
+        return ast
+
+    def term(self, ast):  # noqa
+        return ast
+
+    def multiplication(self, ast):  # noqa
+        return ast
+
+    def division(self, ast):  # noqa
+        return ast
+
+    def factor(self, ast):  # noqa
+        return ast
+
+    def inverse_addition(self, ast):  # noqa
+        return ast
+
+    def power(self, ast):  # noqa
+        return ast
+
+    def call(self, ast):  # noqa
+        return ast
+
+    def atom(self, ast):  # noqa
+        return ast
+
+    def number(self, ast):  # noqa
+        return ast
+
+    def newline(self, ast):  # noqa
+        return ast
+
+    def import_(self, ast):  # noqa
+        return ast
+
+    def parameter(self, ast):  # noqa
+        return ast
+
+    def species(self, ast):  # noqa
+        return ast
+
+    def reaction(self, ast):  # noqa
+        return ast
+
+    def rule(self, ast):  # noqa
+        return ast
+
+    def assignment_rule(self, ast):  # noqa
+        return ast
+
+    def algebraic_rule(self, ast):  # noqa
+        return ast
+
+    def rate_rule(self, ast):  # noqa
+        return ast
+
+    def extends(self, ast):  # noqa
+        return ast
+
+    def assign_name(self, ast):  # noqa
+        return ast
+
+    def access_name(self, ast):  # noqa
+        return ast
+
+    def function_definition(self, ast):  # noqa
+        return ast
+
+    def model_definition(self, ast):  # noqa
+        return ast
+
+    def standalone(self, ast):  # noqa
+        return ast
+
+    def dotted_name(self, ast):  # noqa
+        return ast
+
+    def name(self, ast):  # noqa
+        return ast
+
+    def float(self, ast):  # noqa
+        return ast
+
+    def integer(self, ast):  # noqa
+        return ast
+
+    def docstring(self, ast):  # noqa
+        return ast
+
+    def string(self, ast):  # noqa
+        return ast
+
+    def formula(self, ast):  # noqa
+        return ast
+
+
+def main(filename, start=None, **kwargs):
+    if start is None:
+        start = 'start'
+    if not filename or filename == '-':
+        text = sys.stdin.read()
+    else:
+        with open(filename) as f:
+            text = f.read()
+    parser = OneModelParser()
+    return parser.parse(text, rule_name=start, filename=filename, **kwargs)
+
+
+if __name__ == '__main__':
+    import json
+    from tatsu.util import asjson
+
+    ast = generic_main(main, OneModelParser, name='OneModel')
+    print('AST:')
+    print(ast)
+    print()
+    print('JSON:')
+    print(json.dumps(asjson(ast), indent=2))
+    print()
+
+
+GRAMMAR_HASH = 'c8d271c23ac9d2d54cd268c931c3206242431302a9026d7363c5d00ea9740e39'
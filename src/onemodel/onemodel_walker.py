@@ -1,7 +1,8 @@
 import os
-from importlib_resources import files
-import tatsu
 from tatsu.walkers import NodeWalker
+from onemodel.grammar import get_parser
+from onemodel.ast_cache import get_ast_cache
+from onemodel.compiler import OneModelCompiler
 from onemodel.onemodel import OneModel
 from onemodel.objects.object import Object
 from onemodel.objects.parameter import Parameter
@@ -16,6 +17,7 @@ from onemodel.objects.module import Module
 from onemodel.objects.module import find_module
 from onemodel.objects.module import load_module
 from onemodel.builtin_functions import load_builtin_functions
+from onemodel.utils.intern_name import intern_name
 
 def evaluate(code):
     """Evaluate OneModel code."""
@@ -26,24 +28,52 @@ def evaluate(code):
     onemodel = walker.onemodel
     return walker.onemodel
 
-def load_file(filename):
-    """Load a file into OneModel. """
+def load_file(filename, modules=None, snapshot=None):
+    """Load a file into OneModel.
+
+    Parameters
+    ----------
+    filename : :obj:`str`
+        The OneModel file to load.
+    modules : :obj:`ModuleRegistry`
+        The modules already evaluated, shared with other loaded files. By
+        default, the modules are only shared inside this file.
+    snapshot : :obj:`str`
+        A snapshot file (see `onemodel.snapshot`). If it is up to date with
+        the file and its imports, the model is loaded from it. Otherwise,
+        the file is evaluated and the snapshot saved.
+    """
 
     filepath = os.path.abspath(filename)
+
+    if snapshot is not None:
+        from onemodel.snapshot import load_snapshot
+
+        onemodel = load_snapshot(snapshot, filepath)
+
+        if onemodel is not None:
+            return onemodel
+
     file = open(filepath)
     text = file.read()
     file.close()
 
     walker = OneModelWalker(file=filepath)
-    result, ast = walker.run(text)
+
+    if modules is not None:
+        walker.onemodel.modules = modules
+
+    result, ast = walker.run(text, cache=True)
     
     onemodel = walker.onemodel
 
+    if snapshot is not None:
+        onemodel.save_snapshot(snapshot)
+
     return onemodel
 
 class OneModelWalker(NodeWalker):
 
-    numberOfUnnamedReactions = 0
     numberOfUnnamedRules = 0
     
     def __init__(self, file=None):
@@ -61,16 +91,65 @@ class OneModelWalker(NodeWalker):
 
         load_builtin_functions(self.onemodel)
 
-        grammar = files("onemodel").joinpath("onemodel.ebnf").read_text()
-        self.parser = tatsu.compile(grammar, asmodel=True)
+        self.parser = get_parser()
+
+        # The compiled bodies of functions and models, by id of their AST.
+        self.compiler = OneModelCompiler(self)
+        self.compiled = {}
+
+    def run(self, onemodel_code, cache=False):
+        """Parse and evaluate OneModel code.
 
-    def run(self, onemodel_code):
+        Parameters
+        ----------
+        onemodel_code : :obj:`str`
+            The code to evaluate.
+        cache : :obj:`bool`
+            If True, look for the AST of the code in the AST cache (only if
+            the AST cache is enabled).
+        """
 
-        ast = self.parser.parse(onemodel_code)
+        ast = self.parse(onemodel_code, cache)
         result = self.walk(ast)
 
         return result, ast
 
+    def parse(self, onemodel_code, cache=False):
+        """Returns the AST of OneModel code.
+
+        Parameters
+        ----------
+        onemodel_code : :obj:`str`
+            The code to parse.
+        cache : :obj:`bool`
+            If True, look for the AST of the code in the AST cache (only if
+            the AST cache is enabled).
+        """
+
+        ast_cache = get_ast_cache() if cache else None
+
+        if ast_cache is None:
+            return self.parser.parse(onemodel_code)
+
+        return ast_cache.parse(self.parser, onemodel_code)
+
+    def execute(self, node, scope):
+        """Evaluate an AST that is evaluated many times (e.g. the body of a
+        function or a model) in a Scope.
+
+        The AST is compiled into closures the first time (see
+        `OneModelCompiler`), and the next times only the closures are run.
+        """
+
+        compiled = self.compiled.get(id(node))
+
+        # The AST is kept with its code, so its id is not reused.
+        if compiled is None or compiled[0] is not node:
+            compiled = (node, self.compiler.compile(node))
+            self.compiled[id(node)] = compiled
+
+        return compiled[1](scope)
+
     def walk_Addition(self, node):
         left = self.walk(node.left)
         right = self.walk(node.right)
@@ -173,8 +252,8 @@ class OneModelWalker(NodeWalker):
         result = self.walk(node.name)
 
         if result is None:
-            name = f"_J{self.numberOfUnnamedReactions}"
-            self.numberOfUnnamedReactions += 1
+            name = f"_J{self.onemodel.numberOfUnnamedReactions}"
+            self.onemodel.numberOfUnnamedReactions += 1
             namespace = self.onemodel
         else:
             name = result["name"]
@@ -182,7 +261,7 @@ class OneModelWalker(NodeWalker):
 
         reactants = self.walk(node.reactants)
         products = self.walk(node.products)
-        kinetic_law = node.kinetic_law
+        kinetic_law = intern_name(node.kinetic_law)
 
         namespace[name] = Reaction()
 
@@ -204,15 +283,15 @@ class OneModelWalker(NodeWalker):
         result = self.walk(node.name)
 
         if result is None:
-            name = f"_R{self.numberOfUnnamedReactions}"
-            self.numberOfUnnamedReactions += 1
+            name = f"_R{self.onemodel.numberOfUnnamedReactions}"
+            self.onemodel.numberOfUnnamedReactions += 1
             namespace = self.onemodel
         else:
             name = result["name"]
             namespace = result["namespace"]
 
         variable = self.walk(node.variable)['dotted_name']
-        math = node.math
+        math = intern_name(node.math)
 
         namespace[name] = AssignmentRule()
         namespace[name]['variable'] = variable
@@ -227,15 +306,15 @@ class OneModelWalker(NodeWalker):
         result = self.walk(node.name)
 
         if result is None:
-            name = f"_R{self.numberOfUnnamedReactions}"
-            self.numberOfUnnamedReactions += 1
+            name = f"_R{self.onemodel.numberOfUnnamedReactions}"
+            self.onemodel.numberOfUnnamedReactions += 1
             namespace = self.onemodel
         else:
             name = result["name"]
             namespace = result["namespace"]
 
         variable = self.walk(node.variable)['dotted_name']
-        math = node.math
+        math = intern_name(node.math)
 
         namespace[name] = AlgebraicRule()
         namespace[name]['variable'] = variable
@@ -249,15 +328,15 @@ class OneModelWalker(NodeWalker):
         result = self.walk(node.name)
 
         if result is None:
-            name = f"_R{self.numberOfUnnamedReactions}"
-            self.numberOfUnnamedReactions += 1
+            name = f"_R{self.onemodel.numberOfUnnamedReactions}"
+            self.onemodel.numberOfUnnamedReactions += 1
             namespace = self.onemodel
         else:
             name = result["name"]
             namespace = result["namespace"]
 
         variable = self.walk(node.variable)['dotted_name']
-        math = node.math
+        math = intern_name(node.math)
 
         namespace[name] = RateRule()
         namespace[name]['variable'] = variable
@@ -269,7 +348,7 @@ class OneModelWalker(NodeWalker):
 
     def walk_Extends(self, node):
         model = self.walk(node.model)
-        result = model.extend()
+        result = model.extend(self.onemodel)
 
     def walk_AssignName(self, node):
         result = self.walk(node.name)
@@ -324,14 +403,14 @@ class OneModelWalker(NodeWalker):
 
     def walk_DottedName(self, node):
         qualifiers = node.qualifiers
-        name = node.name
+        name = intern_name(node.name)
         namespace = self.onemodel
 
         dotted_name = ''
 
         if qualifiers:
             dotted_name = '.'.join(qualifiers)
-            dotted_name = dotted_name + '.' + name
+            dotted_name = intern_name(dotted_name + '.' + name)
         else:
             dotted_name = name
 
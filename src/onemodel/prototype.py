@@ -0,0 +1,370 @@
+import re
+
+from onemodel.namespace import Namespace
+
+# The names given to unnamed reactions and rules (see `OneModel`).
+UNNAMED_PATTERN = re.compile(r"_[JR]\d+$")
+
+# The statements that a prototype can reproduce, by AST class.
+TARGET_STATEMENTS = {
+    "Parameter",
+    "Species",
+    "Reaction",
+    "AssignmentRule",
+    "AlgebraicRule",
+    "RateRule",
+    "AssignName",
+}
+CONSTANTS = {"Float", "Integer", "String", "Docstring"}
+OPERATORS = {"Addition", "Subtraction", "Multiplication", "Division"}
+
+# The names of the bodies already analyzed, by id of their AST.
+_body_names = {}
+
+
+class ModelPrototype:
+    """An evaluated instance of a model, cloned by its next instantiations.
+
+    A model without arguments whose body only defines parameters, species,
+    reactions, rules and instances of other models builds the same objects
+    every time it is called. The first call evaluates the body and keeps a
+    copy of the instance; the next calls return a structural clone of that
+    copy instead of evaluating the body again.
+
+    The prototype is only used while the models that the body extends or
+    instantiates (directly or through other models) still resolve to the
+    same Model objects with the same bodies. The unnamed reactions and rules
+    of the clone (e.g. `_J0`) are renamed with the counter of the OneModel,
+    as if the body had been evaluated.
+
+    Parameters
+    ----------
+    body : :obj:`ast`
+        The body of the model when the prototype was created.
+    instance : :obj:`Object`
+        The copy of the first instance of the model.
+    plan : :obj:`tuple`
+        How to clone the instance (see `get_clone_plan`).
+    dependencies : :obj:`list` of :obj:`tuple`
+        The `(name, model, body)` of each model used by the body.
+    first_unnamed : :obj:`int`
+        The counter of unnamed reactions and rules of the first instance.
+    number_of_unnamed : :obj:`int`
+        Number of unnamed reactions and rules created by each instance.
+    """
+
+    def __init__(self, body, instance, dependencies, first_unnamed, number_of_unnamed):
+        self.body = body
+        self.instance = instance
+        self.plan = get_clone_plan(instance)
+        self.dependencies = dependencies
+        self.first_unnamed = first_unnamed
+        self.number_of_unnamed = number_of_unnamed
+
+    @classmethod
+    def create(cls, model, instance, scope, first_unnamed):
+        """Returns the prototype of the first instance of a model, or None
+        if the model cannot be instantiated by cloning.
+
+        Parameters
+        ----------
+        model : :obj:`Model`
+            The model instantiated.
+        instance : :obj:`Object`
+            The instance returned by the first call of the model.
+        scope : :obj:`Scope`
+            The Scope where the model was called.
+        first_unnamed : :obj:`int`
+            The counter of unnamed reactions and rules before the call.
+        """
+
+        from onemodel.objects.model import Model
+
+        dependencies = {}
+        local_names = set()
+        models = [model]
+
+        while models:
+            body = models.pop()["body"]
+            names = get_body_names(body)
+
+            if names is None:
+                return None
+
+            local_names |= names[0]
+
+            for name in names[1]:
+                if name in dependencies:
+                    continue
+
+                value = scope.get(name)
+
+                if type(value) is not Model:
+                    return None
+
+                dependencies[name] = value
+                models.append(value)
+
+        # The bodies look up the models in every namespace of the Scope, so
+        # a local name of one model could hide a model used by another one.
+        if local_names & set(dependencies):
+            return None
+
+        number_of_unnamed = scope.numberOfUnnamedReactions - first_unnamed
+
+        # The prototype is a copy, so the first instance can be changed.
+        instance = clone_from_plan(get_clone_plan(instance))
+
+        return cls(
+            model["body"],
+            instance,
+            [(name, value, value["body"]) for name, value in dependencies.items()],
+            first_unnamed,
+            number_of_unnamed,
+        )
+
+    def is_valid(self, model, scope):
+        """Returns True if the model would build the same instance."""
+
+        if model["body"] is not self.body:
+            return False
+
+        for name, value, body in self.dependencies:
+            if scope.get(name) is not value or value["body"] is not body:
+                return False
+
+        return True
+
+    def instantiate(self, scope):
+        """Returns a new instance of the model."""
+
+        first_unnamed = scope.numberOfUnnamedReactions
+        scope.numberOfUnnamedReactions = first_unnamed + self.number_of_unnamed
+
+        return clone_from_plan(self.plan, first_unnamed - self.first_unnamed)
+
+
+def get_clone_plan(value):
+    """Returns how to clone a Namespace quickly.
+
+    The plan of a Namespace is a tuple with its class, its attributes, a
+    template with its items, the plans of the Namespaces inside it, the
+    names of its lists and its unnamed reactions and rules. The clone copies
+    the template and then replaces the Namespaces and the lists, which keeps
+    the order of the items.
+
+    The plan shares the items of the Namespace, so it should not be changed
+    afterwards.
+    """
+
+    children = []
+    lists = []
+    unnamed = []
+
+    for name, item in value.items():
+        if isinstance(item, Namespace):
+            plan = get_clone_plan(item)
+            is_leaf = plan[1] is None and not plan[3] and not plan[4] and not plan[5]
+            children.append((name, plan, is_leaf))
+        elif type(item) is list:
+            lists.append(name)
+
+        if UNNAMED_PATTERN.match(name):
+            unnamed.append((name, name[:2], int(name[2:])))
+
+    return (
+        type(value),
+        getattr(value, "__dict__", None) or None,
+        dict(value),
+        tuple(children),
+        tuple(lists),
+        tuple(unnamed),
+    )
+
+
+def clone_from_plan(plan, offset=0):
+    """Returns a copy of the Namespace of a plan (see `get_clone_plan`).
+
+    Parameters
+    ----------
+    plan : :obj:`tuple`
+        The plan of the Namespace.
+    offset : :obj:`int`
+        The number added to the unnamed reactions and rules (e.g. with an
+        offset of 3, `_J0` is renamed `_J3`).
+    """
+
+    cls, attributes, template, children, lists, unnamed = plan
+
+    result = cls.__new__(cls)
+
+    if attributes:
+        result.__dict__.update(attributes)
+
+    dict.update(result, template)
+
+    for name, child, is_leaf in children:
+        if is_leaf:
+            child_cls = child[0]
+            item = child_cls.__new__(child_cls)
+            dict.update(item, child[2])
+        else:
+            item = clone_from_plan(child, offset)
+
+        dict.__setitem__(result, name, item)
+
+    for name in lists:
+        dict.__setitem__(result, name, list(template[name]))
+
+    if offset and unnamed:
+        renames = {name: prefix + str(number + offset) for name, prefix, number in unnamed}
+        items = [(renames.get(name, name), item) for name, item in result.items()]
+        dict.clear(result)
+        dict.update(result, items)
+
+    return result
+
+
+def get_body_names(body):
+    """Returns the names defined and the models used by a body.
+
+    Returns
+    -------
+    names : :obj:`tuple`
+        The set of names defined by the body and the set of names of the
+        models that it extends or instantiates. None if the body does other
+        things (e.g. calls functions, imports modules or uses the names of
+        other namespaces), so it cannot be instantiated by cloning.
+    """
+
+    entry = _body_names.get(id(body))
+
+    # The AST is kept with its names, so its id is not reused.
+    if entry is None or entry[0] is not body:
+        entry = (body, _get_body_names(body))
+        _body_names[id(body)] = entry
+
+    return entry[1]
+
+
+def _get_body_names(body):
+    local_names = set()
+    model_names = set()
+
+    def is_local(node):
+        # Qualified names have to start with a name defined before.
+        if node.qualifiers:
+            return node.qualifiers[0] in local_names
+
+        return True
+
+    def define(node):
+        if node is None:
+            return True
+
+        if not is_local(node) or node.name == "self":
+            return False
+
+        if UNNAMED_PATTERN.match(node.name):
+            return False
+
+        if not node.qualifiers:
+            local_names.add(node.name)
+
+        return True
+
+    for statement in _get_statements(body):
+        kind = type(statement).__name__
+
+        if kind in CONSTANTS:
+            continue
+
+        if kind == "Extends":
+            name = _get_model_name(statement.model)
+
+            if name is None:
+                return None
+
+            model_names.add(name)
+            continue
+
+        if kind not in TARGET_STATEMENTS:
+            return None
+
+        if kind == "AssignName":
+            value = statement.value
+            name = _get_model_name(_get_call(value))
+
+            if name is not None:
+                model_names.add(name)
+            elif not _is_constant(value):
+                return None
+
+        if kind == "Reaction":
+            for node in (statement.reactants or []) + (statement.products or []):
+                if not is_local(node):
+                    return None
+
+        if kind.endswith("Rule") and not is_local(statement.variable):
+            return None
+
+        if not define(statement.name):
+            return None
+
+    return local_names, model_names
+
+
+def _get_statements(body):
+    """Yields the statements of a body, including those of blocks."""
+
+    if isinstance(body, (list, tuple)):
+        for item in body:
+            yield from _get_statements(item)
+    elif body is not None:
+        yield body
+
+
+def _get_call(node):
+    """Returns the Call without arguments of an expression, or None."""
+
+    while type(node).__name__ == "Power" and node.exponent is None:
+        node = node.base
+
+    if type(node).__name__ != "Call" or node.next or node.args:
+        return None
+
+    return node.value
+
+
+def _get_model_name(node):
+    """Returns the name of an unqualified AccessName, or None."""
+
+    if type(node).__name__ != "AccessName" or node.name.qualifiers:
+        return None
+
+    name = node.name.name
+
+    return None if name == "self" else name
+
+
+def _is_constant(node):
+    kind = type(node).__name__
+
+    if kind in CONSTANTS:
+        return True
+
+    if kind in OPERATORS:
+        return _is_constant(node.left) and _is_constant(node.right)
+
+    if kind == "InverseAddition":
+        return _is_constant(node.base)
+
+    if kind == "Power":
+        return _is_constant(node.base) and (
+            node.exponent is None or _is_constant(node.exponent)
+        )
+
+    if kind == "Call":
+        return node.next is not None and _is_constant(node.next)
+
+    return False
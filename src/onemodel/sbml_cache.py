@@ -0,0 +1,275 @@
+import hashlib
+
+from onemodel.objects.object import Object
+
+
+class SBMLFragmentCache:
+    """Cache of the SBML elements emitted by each object of a model.
+
+    An object emits the same SBML elements every time it is exported with
+    the same content and under the same fullnames. The first export of an
+    object records:
+
+    * The elements that its `add_to_SBML_model` created.
+    * The fullnames resolved with `scope.get_fullname`.
+    * The entries of `SBML_index` that it read and wrote.
+
+    The next exports reuse those elements as long as the content of the
+    object has not changed and the recorded fullnames and index entries
+    still resolve to the same values. Otherwise, the object is exported
+    again and its fragment replaced, so the cache keeps at most one fragment
+    for each object (i.e. it does not grow while a model is edited).
+
+    The fragments are kept as `onemodel.sbml_xml` elements, so the cache
+    only works with the "xml" backend. The same cache can be shared by the
+    exports of different OneModel objects (e.g. the same file loaded again
+    after a change).
+
+    Parameters
+    ----------
+    fragments : :obj:`dict`
+        The last fragment of each object, indexed by the kind, name and
+        prefix of the object.
+    hits : :obj:`dict`
+        Number of objects reused, by kind of object.
+    misses : :obj:`dict`
+        Number of objects exported again, by kind of object.
+    """
+
+    def __init__(self):
+        self.fragments = {}
+        self.hits = {}
+        self.misses = {}
+
+    def add_to_SBML_model(self, value, name, scope, SBML_model):
+        """Includes an object into a SBML model, reusing its last fragment.
+
+        Parameters
+        ----------
+        value : :obj:`Object`
+            The object to include.
+        name : :obj:`str`
+            Name of the object in the current namespace of the scope.
+        scope : :obj:`Scope`
+            The scope used for the export.
+        SBML_model : :obj:`XMLModel`
+            The SBML model where the object is included.
+        """
+
+        kind = type(value).__name__
+
+        # Objects that do not emit anything are not worth caching.
+        if type(value).add_to_SBML_model is Object.add_to_SBML_model:
+            return
+
+        prefix = scope.prefixes[-1] if scope.prefixes else ""
+        key = (kind, name, prefix)
+        content_hash = get_content_hash(value)
+
+        fragment = self.fragments.get(key)
+
+        if (
+            fragment is not None
+            and fragment.content_hash == content_hash
+            and fragment.is_valid(scope)
+        ):
+            fragment.add_to_SBML_model(scope, SBML_model)
+            self.hits[kind] = self.hits.get(kind, 0) + 1
+            return
+
+        fragment = SBMLFragment.record(value, name, scope, SBML_model)
+        fragment.content_hash = content_hash
+
+        self.fragments[key] = fragment
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+
+    def clear(self):
+        """Removes all the fragments and resets the stats."""
+
+        self.fragments.clear()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Resets the number of hits and misses."""
+
+        self.hits.clear()
+        self.misses.clear()
+
+    def stats(self):
+        """Returns the number of hits and misses and the reuse ratio.
+
+        Returns
+        -------
+        stats : :obj:`dict`
+            For each kind of object, plus "total", a dict with the keys
+            "hits", "misses" and "ratio" (the fraction of objects reused).
+        """
+
+        result = {}
+        kinds = sorted(set(self.hits) | set(self.misses))
+
+        for kind in kinds + ["total"]:
+            if kind == "total":
+                hits = sum(self.hits.values())
+                misses = sum(self.misses.values())
+            else:
+                hits = self.hits.get(kind, 0)
+                misses = self.misses.get(kind, 0)
+
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            result[kind] = {"hits": hits, "misses": misses, "ratio": ratio}
+
+        return result
+
+    def get_summary(self):
+        """Returns a table with the reuse ratio of each kind of object."""
+
+        from tabulate import tabulate
+
+        data = []
+
+        for kind, stats in self.stats().items():
+            data.append(
+                [kind, stats["hits"], stats["misses"], f"{stats['ratio']:.1%}"]
+            )
+
+        return tabulate(data, headers=["Object", "Reused", "Exported", "Reuse ratio"])
+
+
+class SBMLFragment:
+    """The SBML elements emitted by an object under some fullnames.
+
+    Parameters
+    ----------
+    elements : :obj:`list` of :obj:`tuple`
+        The `(list name, element)` pairs created in the SBML model.
+    fullnames : :obj:`dict`
+        The fullnames resolved by the object while it was exported.
+    index_reads : :obj:`dict`
+        The entries of `SBML_index` read by the object.
+    index_writes : :obj:`dict`
+        The entries of `SBML_index` written by the object.
+    content_hash : :obj:`bytes`
+        The hash of the content of the object (see `get_content_hash`).
+    """
+
+    def __init__(
+        self, elements, fullnames, index_reads, index_writes, content_hash=None
+    ):
+        self.elements = elements
+        self.fullnames = fullnames
+        self.index_reads = index_reads
+        self.index_writes = index_writes
+        self.content_hash = content_hash
+
+    @classmethod
+    def record(cls, value, name, scope, SBML_model):
+        """Exports an object and returns the fragment that it emitted."""
+
+        lengths = {
+            list_name: len(items) for list_name, items in SBML_model.children.items()
+        }
+
+        recording_scope = RecordingScope(scope)
+        value.add_to_SBML_model(name, recording_scope, SBML_model)
+
+        elements = []
+
+        for list_name, items in SBML_model.children.items():
+            for element in items[lengths[list_name]:]:
+                element.freeze()
+                elements.append((list_name, element))
+
+        return cls(
+            elements,
+            recording_scope.fullnames,
+            recording_scope.SBML_index.reads,
+            recording_scope.SBML_index.writes,
+        )
+
+    def is_valid(self, scope):
+        """Returns True if the fragment can be reused in the scope."""
+
+        for name, fullname in self.fullnames.items():
+            if scope.get_fullname(name) != fullname:
+                return False
+
+        index = scope.SBML_index
+
+        for fullname, kind in self.index_reads.items():
+            if index.get(fullname) != kind:
+                return False
+
+        return True
+
+    def add_to_SBML_model(self, scope, SBML_model):
+        """Adds the elements of the fragment to a SBML model."""
+
+        for list_name, element in self.elements:
+            SBML_model.children[list_name].append(element)
+
+        scope.SBML_index.update(self.index_writes)
+
+
+class RecordingScope:
+    """Wrapper of a scope that records what an object looks up in it."""
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.fullnames = {}
+        self.SBML_index = RecordingIndex(scope.SBML_index)
+
+    def get_fullname(self, name):
+        result = self.scope.get_fullname(name)
+        self.fullnames[name] = result
+
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.scope, name)
+
+
+class RecordingIndex:
+    """Wrapper of `OneModel.SBML_index` that records reads and writes."""
+
+    def __init__(self, index):
+        self.index = index
+        self.reads = {}
+        self.writes = {}
+
+    def get(self, fullname, default=None):
+        result = self.index.get(fullname)
+
+        if fullname not in self.writes:
+            self.reads[fullname] = result
+
+        return default if result is None else result
+
+    def __getitem__(self, fullname):
+        result = self.get(fullname)
+
+        if result is None:
+            raise KeyError(fullname)
+
+        return result
+
+    def __contains__(self, fullname):
+        return self.get(fullname) is not None
+
+    def __setitem__(self, fullname, kind):
+        self.index[fullname] = kind
+        self.writes[fullname] = kind
+
+
+def get_content_hash(value):
+    """Returns a hash of the attributes of an object.
+
+    The objects nested inside it are not included, since they are exported
+    on their own.
+    """
+
+    content = repr(
+        [(name, item) for name, item in value.items() if not isinstance(item, Object)]
+    )
+
+    return hashlib.sha1(content.encode("utf-8")).digest()
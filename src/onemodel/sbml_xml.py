@@ -0,0 +1,395 @@
+import io
+import os
+import gzip
+import bz2
+import math
+import zipfile
+import threading
+from collections import OrderedDict
+from xml.sax.saxutils import escape
+
+from onemodel.utils.lazy_import import lazy_import
+
+libsbml = lazy_import("libsbml")
+
+# Same value as libsbml.LIBSBML_OPERATION_SUCCESS.
+LIBSBML_OPERATION_SUCCESS = 0
+
+# Order in which libsbml writes the attributes of each SBML element.
+_attribute_order = {
+    "model": ["id", "name", "substanceUnits", "timeUnits", "extentUnits"],
+    "unitDefinition": ["id"],
+    "unit": ["kind", "exponent", "scale", "multiplier"],
+    "compartment": ["id", "spatialDimensions", "size", "units", "constant"],
+    "species": [
+        "id",
+        "compartment",
+        "initialConcentration",
+        "substanceUnits",
+        "hasOnlySubstanceUnits",
+        "boundaryCondition",
+        "constant",
+    ],
+    "parameter": ["id", "value", "units", "constant"],
+    "assignmentRule": ["id", "variable"],
+    "rateRule": ["id", "variable"],
+    "algebraicRule": ["id"],
+    "reaction": ["id", "reversible"],
+    "speciesReference": ["species", "constant"],
+    "modifierSpeciesReference": ["species"],
+    "kineticLaw": [],
+}
+
+# Methods of the libsbml objects used by OneModel and the attribute they set.
+_setters = {
+    "setId": "id",
+    "setIdAttribute": "id",
+    "setName": "name",
+    "setSubstanceUnits": "substanceUnits",
+    "setTimeUnits": "timeUnits",
+    "setExtentUnits": "extentUnits",
+    "setExponent": "exponent",
+    "setScale": "scale",
+    "setMultiplier": "multiplier",
+    "setSpatialDimensions": "spatialDimensions",
+    "setSize": "size",
+    "setUnits": "units",
+    "setConstant": "constant",
+    "setCompartment": "compartment",
+    "setInitialConcentration": "initialConcentration",
+    "setHasOnlySubstanceUnits": "hasOnlySubstanceUnits",
+    "setBoundaryCondition": "boundaryCondition",
+    "setValue": "value",
+    "setVariable": "variable",
+    "setReversible": "reversible",
+    "setSpecies": "species",
+}
+
+# MathML of the formulas already converted, indexed by the id of their
+# ASTNode. The ASTNode is kept alive, so its id cannot be reused.
+_mathml = OrderedDict()
+_mathml_max_entries = 4096
+_mathml_lock = threading.Lock()
+
+
+class XMLElement:
+    """Pure Python replacement of the libsbml objects used by OneModel.
+
+    It has the same `set*` and `create*` methods that the objects call in
+    `add_to_SBML_model`, but it only stores the values, which are written
+    as XML by `XMLDocument`.
+
+    Parameters
+    ----------
+    tag : :obj:`str`
+        The name of the SBML element.
+    attributes : :obj:`dict`
+        The values of the attributes of the element.
+    children : :obj:`dict` of :obj:`list`
+        The child elements grouped by their `listOf*` element.
+    math : :obj:`tuple` of :obj:`str`
+        The lines of the MathML of the element.
+    lines : :obj:`tuple`
+        The depth and the XML lines of a frozen element, saved the first
+        time it is written.
+    """
+
+    def __init__(self, tag, lists=()):
+        self.tag = tag
+        self.attributes = {}
+        self.children = {name: [] for name in lists}
+        self.math = None
+        self.frozen = False
+        self.lines = None
+
+    def freeze(self):
+        """Marks the element as final, so its XML can be reused.
+
+        Frozen elements are shared between documents by the SBML fragment
+        cache and must not be modified.
+        """
+
+        self.frozen = True
+
+    def setMath(self, ast):
+        self.math = ast_2_MathML(ast)
+        return LIBSBML_OPERATION_SUCCESS
+
+    def write(self, lines, depth):
+        """Appends the XML lines of this element to lines."""
+
+        if self.lines is not None and self.lines[0] == depth:
+            lines.extend(self.lines[1])
+            return
+
+        if self.frozen:
+            own_lines = []
+            self._write(own_lines, depth)
+            self.lines = (depth, own_lines)
+            lines.extend(own_lines)
+        else:
+            self._write(lines, depth)
+
+    def _write(self, lines, depth):
+        indent = "  " * depth
+        attributes = "".join(
+            f' {name}="{format_value(self.attributes[name])}"'
+            for name in _attribute_order[self.tag]
+            if name in self.attributes
+        )
+
+        children = [(name, items) for name, items in self.children.items() if items]
+
+        if not children and self.math is None:
+            lines.append(f"{indent}<{self.tag}{attributes}/>")
+            return
+
+        lines.append(f"{indent}<{self.tag}{attributes}>")
+
+        for name, items in children:
+            if name.startswith("listOf"):
+                lines.append(f"{indent}  <{name}>")
+                for item in items:
+                    item.write(lines, depth + 2)
+                lines.append(f"{indent}  </{name}>")
+            else:
+                for item in items:
+                    item.write(lines, depth + 1)
+
+        if self.math is not None:
+            for line in self.math:
+                lines.append(indent + "  " + line)
+
+        lines.append(f"{indent}</{self.tag}>")
+
+    def _create(self, list_name, tag, lists=(), cls=None):
+        if cls is None:
+            cls = XMLElement
+
+        element = cls(tag, lists)
+        self.children[list_name].append(element)
+
+        return element
+
+
+def _create_setter(attribute):
+    def setter(self, value):
+        self.attributes[attribute] = value
+        return LIBSBML_OPERATION_SUCCESS
+
+    return setter
+
+
+for _method, _attribute in _setters.items():
+    setattr(XMLElement, _method, _create_setter(_attribute))
+
+
+class XMLModel(XMLElement):
+    """Pure Python replacement of libsbml.Model."""
+
+    def __init__(self):
+        super().__init__(
+            "model",
+            [
+                "listOfUnitDefinitions",
+                "listOfCompartments",
+                "listOfSpecies",
+                "listOfParameters",
+                "listOfRules",
+                "listOfReactions",
+            ],
+        )
+
+    def createUnitDefinition(self):
+        return self._create(
+            "listOfUnitDefinitions", "unitDefinition", ["listOfUnits"], XMLUnitDefinition
+        )
+
+    def createCompartment(self):
+        return self._create("listOfCompartments", "compartment")
+
+    def createSpecies(self):
+        return self._create("listOfSpecies", "species")
+
+    def createParameter(self):
+        return self._create("listOfParameters", "parameter")
+
+    def createAssignmentRule(self):
+        return self._create("listOfRules", "assignmentRule")
+
+    def createRateRule(self):
+        return self._create("listOfRules", "rateRule")
+
+    def createAlgebraicRule(self):
+        return self._create("listOfRules", "algebraicRule")
+
+    def createReaction(self):
+        return self._create("listOfReactions", "reaction", cls=XMLReaction)
+
+    def getElementBySId(self, sid):
+        for items in self.children.values():
+            for item in items:
+                if item.attributes.get("id") == sid:
+                    return item
+
+        return None
+
+
+class XMLUnitDefinition(XMLElement):
+    """Pure Python replacement of libsbml.UnitDefinition."""
+
+    def createUnit(self):
+        return self._create("listOfUnits", "unit", cls=XMLUnit)
+
+
+class XMLUnit(XMLElement):
+    """Pure Python replacement of libsbml.Unit."""
+
+    def setKind(self, kind):
+        self.attributes["kind"] = libsbml.UnitKind_toString(kind)
+        return LIBSBML_OPERATION_SUCCESS
+
+
+class XMLReaction(XMLElement):
+    """Pure Python replacement of libsbml.Reaction."""
+
+    def __init__(self, tag="reaction", lists=()):
+        super().__init__(
+            tag,
+            ["listOfReactants", "listOfProducts", "listOfModifiers", "kineticLaw"],
+        )
+
+    def createReactant(self):
+        return self._create("listOfReactants", "speciesReference")
+
+    def createProduct(self):
+        return self._create("listOfProducts", "speciesReference")
+
+    def createModifier(self):
+        return self._create("listOfModifiers", "modifierSpeciesReference")
+
+    def createKineticLaw(self):
+        return self._create("kineticLaw", "kineticLaw")
+
+
+class XMLDocument:
+    """Pure Python replacement of libsbml.SBMLDocument.
+
+    It writes SBML Level 3 Version 2 documents with the same format as
+    libsbml, but without creating any libsbml object. libsbml is only used
+    to convert the formulas into MathML.
+    """
+
+    def __init__(self, level=3, version=2):
+        if (level, version) != (3, 2):
+            raise ValueError("XMLDocument only writes SBML Level 3 Version 2")
+
+        self.model = None
+
+    def createModel(self):
+        self.model = XMLModel()
+        return self.model
+
+    def write(self, file):
+        """Writes the SBML document into a text file object."""
+
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        file.write(
+            '<sbml xmlns="http://www.sbml.org/sbml/level3/version2/core"'
+            ' level="3" version="2">\n'
+        )
+
+        if self.model is not None:
+            lines = []
+            self.model.write(lines, 1)
+
+            for line in lines:
+                file.write(line)
+                file.write("\n")
+
+        file.write("</sbml>\n")
+
+    def write_to_string(self):
+        """Returns the SBML document as a string."""
+
+        file = io.StringIO()
+        self.write(file)
+
+        return file.getvalue()
+
+    def write_to_file(self, filename):
+        """Writes the SBML document into a file.
+
+        Files ending in `.gz`, `.bz2` or `.zip` are compressed. As with
+        libsbml, a `.zip` file holds the document under the name of the
+        file without `.zip` (e.g. `model.xml` in `model.xml.zip`).
+        """
+
+        if filename.endswith(".zip"):
+            name = os.path.basename(filename[: -len(".zip")])
+
+            with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as archive:
+                with archive.open(name, "w") as member:
+                    with io.TextIOWrapper(member, encoding="utf-8") as file:
+                        self.write(file)
+
+            return
+
+        if filename.endswith(".gz"):
+            file = gzip.open(filename, "wt", encoding="utf-8")
+        elif filename.endswith(".bz2"):
+            file = bz2.open(filename, "wt", encoding="utf-8")
+        else:
+            file = open(filename, "w", encoding="utf-8")
+
+        with file:
+            self.write(file)
+
+
+def ast_2_MathML(ast):
+    """Returns the lines of the MathML of a libsbml ASTNode.
+
+    The MathML is cached for each ASTNode, which `formula_2_ast` shares
+    between all the objects with the same formula.
+    """
+
+    key = id(ast)
+
+    with _mathml_lock:
+        if key in _mathml:
+            _mathml.move_to_end(key)
+            return _mathml[key][1]
+
+    text = libsbml.writeMathMLToString(ast)
+
+    # Remove the XML declaration.
+    lines = tuple(text.split("\n")[1:])
+
+    with _mathml_lock:
+        _mathml[key] = (ast, lines)
+
+        while len(_mathml) > _mathml_max_entries:
+            _mathml.popitem(last=False)
+
+    return lines
+
+
+def format_value(value):
+    """Returns the value of an attribute as libsbml writes it."""
+
+    if value is True:
+        return "true"
+
+    if value is False:
+        return "false"
+
+    if isinstance(value, str):
+        return escape(value, {'"': "&quot;"})
+
+    if math.isnan(value):
+        return "NaN"
+
+    if math.isinf(value):
+        return "INF" if value > 0 else "-INF"
+
+    return "%.15g" % value
@@ -1,3 +1,6 @@
+from onemodel.utils.intern_name import intern_name
+
+
 class Scope:
     """The Scope defines which namespaces can be accesed and referenced.
 
@@ -12,17 +15,27 @@ class Scope:
 
     identifiers : :obj:`list` of :obj:`str`
         List of the identifier name for each namespace.
+
+    prefixes : :obj:`list` of :obj:`str`
+        List of the prefix of the fullnames for each namespace.
     """
 
     def __init__(self):
         self.namespaces = []
         self.identifiers = []
+        self.prefixes = []
 
     def push(self, namespace, indentifier=""):
         """Inserts a namespace in the Scope."""
 
+        prefix = self.prefixes[-1] if self.prefixes else ""
+
+        if indentifier != "":
+            prefix = prefix + indentifier + "__"
+
         self.namespaces.append(namespace)
         self.identifiers.append(indentifier)
+        self.prefixes.append(prefix)
 
     def pop(self):
         """Removes the last inserted namespace in the Scope."""
@@ -30,6 +43,7 @@ class Scope:
         if self.namespaces:
             self.namespaces.pop()
             self.identifiers.pop()
+            self.prefixes.pop()
         else:
             raise Exception("Scope is empty")
 
@@ -69,38 +83,91 @@ class Scope:
         flattening, we need unique names for the objects that define the model.
         This unique names are generated by taking into account the name of the
         namespace where the object resides.
+
+        Notes
+        -----
+        The prefix of each namespace (e.g. `a__b__`) is computed once in
+        `push`. The fullnames are only memoized by `ExportScope`, whose
+        namespaces do not change during the export.
         """
 
         dotted_name = None
+        first_name = name
 
         if '.' in name:
             dotted_name = name.split('.')
-            name = dotted_name[0]
+            first_name = dotted_name[0]
 
         i = len(self.namespaces)
         for namespace in reversed(self.namespaces):
-            if name in namespace:
+            if first_name in namespace:
                 break
             i -= 1
-        position_namespace_has_name = i
 
-        basename = ""
-        i = 0
-        while i < position_namespace_has_name:
-            if self.identifiers[i] != "":
-                basename += self.identifiers[i] + "__"
-            i += 1
-        
-        result = basename + name
+        basename = self.prefixes[i - 1] if i > 0 else ""
 
         if dotted_name:
-            for name in dotted_name[1:]:
-                result = result + '__' + name
+            result = basename + '__'.join(dotted_name)
+        else:
+            result = basename + name
 
-        return result
+        # The same fullnames are resolved again from other namespaces.
+        return intern_name(result)
 
     def __setitem__(self, name, value):
         self.set(name, value)
 
     def __getitem__(self, name):
         return self.get(name)
+
+
+class ExportScope(Scope):
+    """The Scope used to export a model into SBML.
+
+    It starts at the root namespace of the model and it is only used by one
+    export, so exporting a model does not modify the Scope of the session.
+
+    Parameters
+    ----------
+    SBML_index : :obj:`dict`
+        The kind of SBML object (e.g. "species") emitted under each fullname
+        during the export.
+
+    fullnames : :obj:`list` of :obj:`dict`
+        List of the fullnames already resolved for each namespace.
+
+    Notes
+    -----
+    The export only reads the namespaces of the model, so the fullnames are
+    memoized for the last inserted namespace until it is removed or `set` is
+    used.
+    """
+
+    def __init__(self, root):
+        self.fullnames = []
+        super().__init__()
+        self.push(root, "")
+        self.SBML_index = {}
+
+    def push(self, namespace, indentifier=""):
+        super().push(namespace, indentifier)
+        self.fullnames.append({})
+
+    def pop(self):
+        super().pop()
+        self.fullnames.pop()
+
+    def set(self, name, value):
+        super().set(name, value)
+        self.fullnames[-1].clear()
+
+    def get_fullname(self, name):
+        fullnames = self.fullnames[-1] if self.fullnames else {}
+
+        if name in fullnames:
+            return fullnames[name]
+
+        result = super().get_fullname(name)
+        fullnames[name] = result
+
+        return result
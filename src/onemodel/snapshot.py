@@ -0,0 +1,197 @@
+import os
+import pickle
+import hashlib
+
+from tatsu.objectmodel import Node
+
+from onemodel.ast_cache import dump_ast, load_ast
+from onemodel.builtin_functions import builtin_functions
+from onemodel.onemodel_walker import OneModelWalker
+
+# Version of the snapshot format. Snapshots of other versions are ignored.
+SNAPSHOT_VERSION = 2
+
+# First bytes of every snapshot file.
+SNAPSHOT_MAGIC = b"ONEMODEL-SNAPSHOT\n"
+
+
+def save_snapshot(onemodel, path):
+    """Saves an evaluated OneModel into a snapshot file.
+
+    The snapshot is made of a header and the pickled OneModel (its
+    namespaces and objects). Fullnames are not saved: as for a model that
+    was just evaluated, they are resolved when the loaded model is
+    exported. The header keeps the hash of the source file of the model
+    and of every imported module, so `load_snapshot` can tell whether the
+    snapshot is out of date without unpickling the model.
+
+    Parameters
+    ----------
+    onemodel : :obj:`OneModel`
+        The model to save.
+    path : :obj:`str`
+        Where to save the snapshot.
+    """
+
+    source = onemodel.root.get("__file__")
+
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "source": source if isinstance(source, str) else None,
+        "files": get_source_hashes(onemodel),
+    }
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+            pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+            _SnapshotPickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(onemodel)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_snapshot(path, filename=None):
+    """Loads the OneModel saved in a snapshot file.
+
+    Returns None if the snapshot does not exist, was saved with another
+    version of the format, or if the source file of the model or any of
+    its imported modules has changed since it was saved.
+
+    Parameters
+    ----------
+    path : :obj:`str`
+        The snapshot file.
+    filename : :obj:`str`
+        If given, the snapshot is only loaded if it was saved from the model
+        of this OneModel file.
+    """
+
+    try:
+        file = open(path, "rb")
+    except OSError:
+        return None
+
+    with file:
+        if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            return None
+
+        try:
+            header = pickle.load(file)
+        except Exception:
+            return None
+
+        if header.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        if filename is not None and header["source"] != os.path.abspath(filename):
+            return None
+
+        for filename, file_hash in header["files"].items():
+            if _get_file_hash(filename) != file_hash:
+                return None
+
+        # The functions and models of the snapshot are evaluated again by
+        # a new walker, which works on the loaded model.
+        walker = OneModelWalker()
+        onemodel = _SnapshotUnpickler(file, walker).load()
+        walker.onemodel = onemodel
+
+    return onemodel
+
+
+def get_source_hashes(onemodel):
+    """Returns the hash of the files evaluated to build a OneModel.
+
+    These are the source file of the model (if any) and the files of its
+    imported modules.
+    """
+
+    filenames = list(onemodel.modules)
+    filename = onemodel.root.get("__file__")
+
+    if isinstance(filename, str) and os.path.isfile(filename):
+        filenames.insert(0, filename)
+
+    return {filename: _get_file_hash(filename) for filename in filenames}
+
+
+def _get_file_hash(filename):
+    try:
+        with open(filename) as file:
+            text = file.read()
+    except OSError:
+        return None
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickles a OneModel, replacing what cannot be pickled directly.
+
+    * The ASTs of functions and models are saved as plain data. Each AST
+      is saved once, with a number, and its other references only keep the
+      number, so they are still the same AST when loaded (e.g. the body of
+      a model and of its prototype, see `ModelPrototype.is_valid`).
+    * The walker of functions and models is not saved.
+    * The builtin functions are saved by name.
+    """
+
+    def __init__(self, file, protocol):
+        super().__init__(file, protocol)
+        self.builtin_names = {id(value): name for name, value in builtin_functions.items()}
+
+        # The number of each AST saved by id, with the AST so its id is not
+        # reused while pickling.
+        self.ast_numbers = {}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, Node):
+            number, _ = self.ast_numbers.get(id(obj), (None, None))
+
+            if number is not None:
+                return ("ast", number)
+
+            number = len(self.ast_numbers)
+            self.ast_numbers[id(obj)] = (number, obj)
+
+            return ("ast", number, dump_ast(obj))
+
+        if id(obj) in self.builtin_names:
+            return ("builtin", self.builtin_names[id(obj)])
+
+        if isinstance(obj, OneModelWalker):
+            return ("walker",)
+
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickles a OneModel saved by `_SnapshotPickler`."""
+
+    def __init__(self, file, walker):
+        super().__init__(file)
+        self.walker = walker
+
+        # The ASTs loaded, by number.
+        self.asts = {}
+
+    def persistent_load(self, pid):
+        kind = pid[0]
+
+        if kind == "ast":
+            if len(pid) == 3:
+                self.asts[pid[1]] = load_ast(pid[2])
+
+            return self.asts[pid[1]]
+
+        if kind == "builtin":
+            return builtin_functions[pid[1]]
+
+        if kind == "walker":
+            return self.walker
+
+        raise pickle.UnpicklingError(f"Unknown persistent id {kind}")
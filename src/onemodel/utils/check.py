@@ -1,30 +1,108 @@
-from libsbml import LIBSBML_OPERATION_SUCCESS
+import threading
+from contextlib import contextmanager
 
+from onemodel.utils.lazy_import import lazy_import
 
-def check(value, message):
+libsbml = lazy_import("libsbml")
+
+# Same value as libsbml.LIBSBML_OPERATION_SUCCESS (libsbml is imported lazily).
+LIBSBML_OPERATION_SUCCESS = 0
+
+# The failures recorded by `check` inside `deferred_checks` in each thread.
+_state = threading.local()
+
+
+def check(value, message, *args):
     """If 'value' is None, prints an error message constructed using
     'message' and then exits with status code 1.  If 'value' is an integer,
     it assumes it is a libSBML return status code.  If the code value is
     LIBSBML_OPERATION_SUCCESS, returns without further action; if it is not,
     prints an error message constructed using 'message' along with text from
     libSBML explaining the meaning of the code, and exits with status code 1.
+
+    The message is only formatted with 'args' (`message.format(*args)`) when
+    there is an error. Inside `deferred_checks`, the error codes are recorded
+    instead of raised. A null value is still raised right away (the next
+    calls would use it), together with the errors recorded before it.
     """
-    if value == None:
-        raise SystemExit("LibSBML returned a null value trying to " + message + ".")
+    if value is None:
+        pass
     elif type(value) is int:
         if value == LIBSBML_OPERATION_SUCCESS:
             return
-        else:
-            err_msg = (
-                "Error encountered trying to "
-                + message
-                + "."
-                + "LibSBML returned error code "
-                + str(value)
-                + ': "'
-                + OperationReturnValue_toString(value).strip()
-                + '"'
-            )
-        raise SystemExit(err_msg)
     else:
         return
+
+    failures = getattr(_state, "failures", None)
+
+    if failures is None:
+        raise SystemExit(get_error_message(value, message, args))
+
+    failures.append((value, message, args))
+
+    if value is None:
+        raise SystemExit(get_errors_message(failures))
+
+
+def get_error_message(value, message, args=()):
+    """Returns the error message of a failed `check`."""
+
+    if args:
+        message = message.format(*args)
+
+    if value is None:
+        return "LibSBML returned a null value trying to " + message + "."
+
+    return (
+        "Error encountered trying to "
+        + message
+        + "."
+        + "LibSBML returned error code "
+        + str(value)
+        + ': "'
+        + libsbml.OperationReturnValue_toString(value).strip()
+        + '"'
+    )
+
+
+def get_errors_message(failures):
+    """Returns the message of the failures recorded by `deferred_checks`."""
+
+    messages = [get_error_message(*failure) for failure in failures]
+
+    return (
+        f"{len(failures)} errors found building the SBML document:\n"
+        + "\n".join(messages)
+    )
+
+
+@contextmanager
+def deferred_checks():
+    """Records the errors of `check` and raises them all together at the end.
+
+    This is the "release" mode of the SBML export: the status codes are
+    collected while the document is built, and they are only validated
+    once at the end, reporting every failure. Outside this context, `check`
+    raises on the first error (fail-fast mode).
+
+    If an exception leaves the context after some failures were recorded,
+    the failures are raised instead, from that exception (it is often caused
+    by one of them).
+    """
+
+    previous = getattr(_state, "failures", None)
+    failures = []
+    _state.failures = failures
+
+    try:
+        yield failures
+    except Exception as error:
+        if failures:
+            raise SystemExit(get_errors_message(failures)) from error
+
+        raise
+    finally:
+        _state.failures = previous
+
+    if failures:
+        raise SystemExit(get_errors_message(failures))
@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+from onemodel.utils.lazy_import import lazy_import
+
+libsbml = lazy_import("libsbml")
+
+
+@lru_cache(maxsize=4096)
+def formula_2_ast(formula):
+    """Returns the libsbml ASTNode of a formula.
+
+    The result is cached by the text of the formula. The ASTNode must not be
+    modified: libsbml copies it in `setMath`, so it can be shared.
+
+    Parameters
+    ----------
+    formula : :obj:`str`
+        A formula with the syntax of libsbml.parseL3Formula().
+    """
+
+    return libsbml.parseL3Formula(formula)
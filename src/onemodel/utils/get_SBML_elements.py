@@ -0,0 +1,19 @@
+def get_SBML_elements(SBML_document):
+    """Returns the parameters and species of a libsbml.SBMLDocument by id.
+
+    Looking up the elements in this dict is faster than `getParameter(id)`,
+    which searches the whole list of parameters of the model.
+    """
+
+    result = {}
+    SBML_model = SBML_document.getModel()
+
+    for i in range(SBML_model.getNumParameters()):
+        parameter = SBML_model.getParameter(i)
+        result[parameter.getId()] = parameter
+
+    for i in range(SBML_model.getNumSpecies()):
+        species = SBML_model.getSpecies(i)
+        result[species.getId()] = species
+
+    return result
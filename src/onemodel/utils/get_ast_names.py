@@ -1,15 +1,123 @@
+from functools import lru_cache
+
+from onemodel.utils.formula_2_ast import formula_2_ast
+from onemodel.utils.math_2_fullname import tokenize_formula
+
+
 def get_ast_names(ast):
-    """Returns the user defined names in a MathML ast."""
-    names = []
+    """Returns the unique user defined names in a MathML ast.
+
+    The names are returned in the order they appear in the formula. The
+    ast is traversed iteratively, so long formulas do not hit the recursion
+    limit.
+    """
+    names = {}
+    stack = [ast]
+
+    while stack:
+        node = stack.pop()
+
+        if node.isName():
+            names[node.getName()] = None
+
+        # Push the children reversed to visit them from left to right.
+        for i in range(node.getNumChildren() - 1, -1, -1):
+            stack.append(node.getChild(i))
+
+    return list(names)
+
+
+@lru_cache(maxsize=4096)
+def get_formula_names(formula):
+    """Returns the unique user defined names of a formula with local names.
+
+    The result is cached by the text of the formula. The formulas are cached
+    before resolving their names, so the instances of the same model share
+    the entries (see `get_formula_fullnames`).
+
+    Parameters
+    ----------
+    formula : :obj:`str`
+        A formula with the syntax of libsbml.parseL3Formula(), whose names
+        can be dotted names (e.g. `a.b`).
+
+    Returns
+    -------
+    names : :obj:`tuple` of :obj:`tuple`
+        The parts of each name (e.g. `("a", "b")` for `a.b`), in the order
+        the names appear in the AST of the formula.
+    """
+
+    parts, name_indexes, _ = tokenize_formula(formula)
+
+    # Each name is replaced by a placeholder, so the formula is parsed as if
+    # its names were already fullnames.
+    result = list(parts)
+    names = {}
+    last_index = None
+
+    for i in name_indexes:
+        if last_index is not None and i == last_index + 2 and parts[i - 1] == "__":
+            first_index, name = current
+            current = first_index, name + (parts[i],)
+            result[i - 1] = result[i] = ""
+        else:
+            if last_index is not None:
+                _add_placeholder(result, names, *current)
+
+            current = i, (parts[i],)
+
+        last_index = i
+
+    if last_index is not None:
+        _add_placeholder(result, names, *current)
+
+    ast = formula_2_ast("".join(result))
+
+    if ast is None:
+        return ()
+
+    placeholders = {placeholder: name for name, placeholder in names.items()}
+
+    return tuple(placeholders[name] for name in get_ast_names(ast))
+
+
+def _add_placeholder(result, names, index, name):
+    placeholder = names.setdefault(name, f"_n{len(names)}")
+    result[index] = placeholder
+
+
+def get_formula_fullnames(formula, scope):
+    """Returns the unique fullnames used in a formula with local names.
+
+    It is the same as `get_ast_names(formula_2_ast(math_2_fullname(formula,
+    scope)))`, but the formula is only parsed and traversed once for all the
+    scopes where it is used (e.g. the kinetic law of every instance of a
+    model).
+
+    Parameters
+    ----------
+    formula : :obj:`str`
+        A formula with local names.
+    scope : :obj:`Scope`
+        The scope used to resolve the names (see `math_2_fullname`).
+    """
+
+    fullnames = {}
+
+    for name in get_formula_names(formula):
+        fullname = "__".join([scope.get_fullname(part) for part in name])
+        fullnames[fullname] = None
 
-    if ast.isName():
-        names.append(ast.getName())
+    # A name without prefix can be a constant of the formulas (e.g. `pi`).
+    return [
+        fullname
+        for fullname in fullnames
+        if "__" in fullname or _is_ast_name(fullname)
+    ]
 
-    for i in range(ast.getNumChildren()):
-        child = ast.getChild(i)
-        child_names = get_ast_names(child)
 
-        for item in child_names:
-            names.append(item)
+def _is_ast_name(fullname):
+    ast = formula_2_ast(fullname)
 
-    return names
+    return ast is not None and ast.isName()
@@ -0,0 +1,31 @@
+import os
+
+
+def get_cache_dir(*subdirs):
+    """Returns the directory where OneModel caches intermediate results.
+
+    The location can be set with the environment variable
+    `ONEMODEL_CACHE_DIR`. Otherwise, `$XDG_CACHE_HOME/onemodel` (or
+    `~/.cache/onemodel`) is used. The directory is created if it does not
+    exist.
+
+    Parameters
+    ----------
+    subdirs : :obj:`str`
+        Names of the subdirectories inside the cache directory.
+    """
+
+    result = os.environ.get("ONEMODEL_CACHE_DIR")
+
+    if not result:
+        cache_home = os.environ.get("XDG_CACHE_HOME")
+
+        if not cache_home:
+            cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+
+        result = os.path.join(cache_home, "onemodel")
+
+    result = os.path.join(result, *subdirs)
+    os.makedirs(result, exist_ok=True)
+
+    return result
@@ -0,0 +1,21 @@
+import sys
+
+
+def intern_name(value):
+    """Returns the interned copy of a name, a dotted name or a formula.
+
+    The parser returns a new string for every occurrence of a name, and the
+    dotted names and the fullnames are built again for every instance of a
+    model. Interning them keeps one copy of each string, and the dicts
+    looked up with an interned key find it by identity.
+
+    Parameters
+    ----------
+    value : :obj:`str`
+        The string to intern. Other values (e.g. None) are returned as is.
+    """
+
+    if isinstance(value, str):
+        return sys.intern(str(value))
+
+    return value
@@ -0,0 +1,36 @@
+import sys
+import types
+import importlib
+
+
+class LazyModule(types.ModuleType):
+    """A module that is only imported when one of its attributes is used.
+
+    After the first access, the attributes of the real module are copied
+    into this one, so later accesses are as fast as with a normal import.
+    """
+
+    def __getattr__(self, name):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+
+        return getattr(module, name)
+
+
+def lazy_import(name):
+    """Returns a module that is imported the first time it is used.
+
+    Heavy dependencies (e.g. libsbml) should be imported with this function,
+    so `import onemodel` and the commands of the CLI only load what they
+    need.
+
+    Parameters
+    ----------
+    name : :obj:`str`
+        The absolute name of the module.
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    return LazyModule(name)
@@ -1,37 +1,81 @@
-from io import BytesIO
-from tokenize import ENCODING, NAME, OP, tokenize
+import re
+from functools import lru_cache
+from tokenize import Number
+
+# A token of a formula: a number, a name or any other character. Numbers are
+# matched with the same regex as the Python tokenize module, so a formula is
+# split in the same names as with tokenize.
+_token_re = re.compile(
+    r"\s*(?:(?P<number>" + Number + r")|(?P<name>\w+)|(?P<other>\.\.\.|\S))"
+)
+
+
+@lru_cache(maxsize=4096)
+def tokenize_formula(formula):
+    """Splits a formula into literal text and names.
+
+    The result is cached by the text of the formula, as the same formulas
+    are exported again and again for every instance of a model.
+
+    Returns
+    -------
+    parts : :obj:`tuple` of :obj:`str`
+        The formula without whitespace split in literal text and names.
+        A dot before a name is replaced by "__".
+    name_indexes : :obj:`tuple` of :obj:`int`
+        Positions of the names in `parts`.
+    names : :obj:`tuple` of :obj:`str`
+        The unique names of the formula.
+    """
+
+    parts = []
+    name_indexes = []
+    last_token = None
+
+    stripped = formula.lstrip(" \t")
+
+    if stripped and len(stripped) != len(formula):
+        parts.append(formula[: len(formula) - len(stripped)])
+
+    for match in _token_re.finditer(formula):
+        kind = match.lastgroup
+        token = match.group(kind)
+
+        if kind == "name":
+            if last_token == ".":
+                parts[-1] = "__"
+
+            name_indexes.append(len(parts))
+
+        parts.append(token)
+        last_token = token
+
+    names = tuple(dict.fromkeys(parts[i] for i in name_indexes))
+
+    return tuple(parts), tuple(name_indexes), names
+
 
 def math_2_fullname(math_expr, scope):
     """Changes local user defined names into fullnames.
 
+    Every name of the formula is resolved once with `scope.get_fullname`,
+    and a dotted name `a.b` is rewritten as `fullname(a)__fullname(b)`.
+
     Arguments:
         math_expr: str
             Math formula obtained with libSBML.formulaToL3String()
     """
-    result = ""
-
-    g = tokenize(BytesIO(math_expr.encode("utf-8")).readline)
-
-    last_tokval = None
 
-    for toknum, tokval, _, _, _ in g:
-        if toknum == ENCODING:
-            continue
+    parts, name_indexes, names = tokenize_formula(math_expr)
 
-        if str(last_tokval) == "." and toknum == NAME:
-            result = result[0:-1]
-            result += "__"
+    if not name_indexes:
+        return "".join(parts)
 
-        if toknum == NAME:
-            try:
-                fullname = scope.get_fullname(str(tokval))
-                result += fullname
-            except:
-                result += str(tokval)
+    fullnames = {name: scope.get_fullname(name) for name in names}
 
-        else:
-            result += str(tokval)
+    result = list(parts)
 
-        last_tokval = tokval
+    for i in name_indexes:
+        result[i] = fullnames[result[i]]
 
-    return str(result)
+    return "".join(result)
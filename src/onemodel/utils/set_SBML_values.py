@@ -0,0 +1,35 @@
+from onemodel.utils.check import check
+
+
+def set_SBML_values(SBML_elements, SBML_index, values):
+    """Changes the values of parameters and species of a SBML document.
+
+    Parameters
+    ----------
+    SBML_elements : :obj:`dict`
+        The parameters and species of the document by fullname (see
+        `get_SBML_elements`).
+    SBML_index : :obj:`dict`
+        The kind of SBML object emitted under each fullname.
+    values : :obj:`dict`
+        The new values by dotted name (e.g. `circuit.z1.k`). The value of a
+        parameter is its "value", and the value of a species is its
+        "initialConcentration".
+    """
+
+    for name, value in values.items():
+        fullname = name.replace(".", "__")
+        kind = SBML_index.get(fullname)
+
+        if kind == "parameter":
+            check(
+                SBML_elements[fullname].setValue(value),
+                "set parameter {} value", fullname
+            )
+        elif kind == "species":
+            check(
+                SBML_elements[fullname].setInitialConcentration(value),
+                "set initial amount for {}", fullname
+            )
+        else:
+            raise KeyError(f"'{name}' is not a parameter or species of the model")
@@ -0,0 +1,65 @@
+import glob
+import os
+
+import pytest
+from tatsu.util import asjson
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The examples that cannot be loaded, with the reason.
+broken_examples = {
+    "examples/iwbda-22/solutions/exercise_06.one": "imports a package that is not installed",
+    "examples/iwbda-22/solutions/exercise_07.one": "imports a package that is not installed",
+    "examples/iwbda-22/solutions/exercise_08.one": "imports a package that is not installed",
+    "examples/iwbda-22/src/antithetic_controller_2.one": "imports a package that is not installed",
+    "examples/iwbda-22/src/host_aware_example.one": "imports a package that is not installed",
+    "examples/iwbda-22/src/host_aware_model_exogenous_protein.one": (
+        "imports a package that is not installed"
+    ),
+}
+
+examples = sorted(
+    os.path.relpath(path, root_dir).replace(os.sep, "/")
+    for path in glob.glob(os.path.join(root_dir, "examples", "**", "*.one"), recursive=True)
+)
+
+
+def _as_plain(ast):
+    """Convert an AST into dicts and lists to compare it ignoring key order."""
+    ast = asjson(ast)
+
+    if isinstance(ast, dict):
+        return {key: _as_plain(value) for key, value in ast.items()}
+
+    if isinstance(ast, list):
+        return [_as_plain(value) for value in ast]
+
+    return ast
+
+
+@pytest.fixture
+def as_plain():
+    """Returns a function that converts an AST into dicts and lists."""
+    return _as_plain
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(example, marks=pytest.mark.skip(reason=broken_examples[example]))
+        if example in broken_examples
+        else example
+        for example in examples
+    ]
+)
+def example_model(request, monkeypatch):
+    """Loads each OneModel file of the examples directory.
+
+    The test runs from the directory of the example. The examples in
+    `broken_examples` are skipped; any other error fails the test.
+    """
+    filepath = os.path.join(root_dir, request.param)
+    monkeypatch.chdir(os.path.dirname(filepath))
+
+    from onemodel.onemodel_walker import load_file
+
+    return load_file(os.path.basename(filepath))
@@ -6,6 +6,7 @@ from pathlib import Path
 from onemodel.objects.module import Module
 from onemodel.objects.module import find_module
 from onemodel.objects.module import load_module
+from onemodel.objects.module import ModuleRegistry
 from onemodel.onemodel_walker import OneModelWalker
 
 
@@ -134,3 +135,56 @@ def test_load_module_5(tmp_examples_dir):
             )
 
     assert walker.onemodel["module_3"]["module_3"] != None
+
+def test_load_module_registry(tmp_examples_dir):
+    os.chdir(tmp_examples_dir / "src")
+    walker = OneModelWalker()
+
+    result_1 = load_module(walker, "module_1")
+    result_2 = load_module(walker, "module_1", None, "foo")
+
+    assert result_1 is result_2
+    assert walker.onemodel["foo"] is result_1
+    assert walker.onemodel.modules.stats() == {"hits": 1, "misses": 1}
+
+def test_load_module_registry_transitive(tmp_examples_dir):
+    os.chdir(tmp_examples_dir / "src")
+    walker = OneModelWalker()
+
+    result = load_module(walker, "module_1")
+    load_module(walker, "module_2", None, None, ["other"])
+
+    filename = find_module(walker, "module_1")
+
+    assert walker.onemodel.modules[filename][2] is result
+    assert walker.onemodel.modules.stats() == {"hits": 1, "misses": 2}
+
+def test_load_module_registry_modified(tmp_examples_dir):
+    os.chdir(tmp_examples_dir / "src")
+    walker = OneModelWalker()
+
+    result_1 = load_module(walker, "module_1")
+
+    filename = find_module(walker, "module_1")
+    mtime = os.path.getmtime(filename)
+
+    # Same content with a new modification time.
+    os.utime(filename, (mtime + 1, mtime + 1))
+    result_2 = load_module(walker, "module_1")
+
+    # New content.
+    with open(filename, "a") as file:
+        file.write("\nparameter foo = 1\n")
+    os.utime(filename, (mtime + 2, mtime + 2))
+    result_3 = load_module(walker, "module_1")
+
+    assert result_1 is result_2
+    assert result_3 is not result_1
+    assert result_3["foo"]["value"] == 1
+    assert walker.onemodel.modules.stats() == {"hits": 1, "misses": 2}
+
+def test_module_registry():
+    registry = ModuleRegistry()
+
+    assert registry.get_module("/does/not/exist.one") is None
+    assert registry.stats() == {"hits": 0, "misses": 1}
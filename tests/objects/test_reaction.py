@@ -5,6 +5,7 @@ from onemodel.objects.parameter import Parameter
 from onemodel.objects.species import Species
 from onemodel.objects.reaction import Reaction
 from onemodel.onemodel import OneModel
+from onemodel.scope import ExportScope
 
 
 def test_init():
@@ -145,3 +146,59 @@ def test_reference_nested():
     expected = ElementTree.fromstring(expected_string)
 
     assert ElementTree.tostring(result) == ElementTree.tostring(expected)
+
+def test_modifiers():
+
+    m = OneModel()
+
+    m["A"] = Object()
+    m["A"]["X"] = Species()
+    m["A"]["Y"] = Species()
+    m["A"]["TF"] = Species()
+    m["A"]["k"] = Parameter()
+
+    m["A"]["J1"] = Reaction()
+    m["A"]["J1"]["reactants"] = ["X"]
+    m["A"]["J1"]["products"] = ["Y"]
+    m["A"]["J1"]["kinetic_law"] = "k*TF*X*Y"
+
+    result_string = m.get_SBML_string()
+    result = ElementTree.fromstring(result_string)
+
+    ns = {"sbml": "http://www.sbml.org/sbml/level3/version2/core"}
+    modifiers = result.findall(".//sbml:modifierSpeciesReference", ns)
+
+    assert [item.get("species") for item in modifiers] == ["A__TF"]
+
+    scope = ExportScope(m.root)
+    m._create_SBML_document(scope=scope)
+
+    assert scope.SBML_index["A__TF"] == "species"
+    assert scope.SBML_index["A__k"] == "parameter"
+    assert scope.SBML_index["A__J1"] == "reaction"
+
+def test_kinetic_law_names_shared():
+    """The instances of a model share the names of their kinetic law."""
+
+    from onemodel.utils.get_ast_names import get_formula_names
+
+    m = OneModel()
+
+    for name in ["A", "B"]:
+        m[name] = Object()
+        m[name]["X"] = Species()
+        m[name]["TF"] = Species()
+        m[name]["k"] = Parameter()
+        m[name]["J1"] = Reaction()
+        m[name]["J1"]["reactants"] = ["X"]
+        m[name]["J1"]["kinetic_law"] = "k*TF*X*names_shared"
+
+    get_formula_names.cache_clear()
+    root = ElementTree.fromstring(m.get_SBML_string())
+
+    assert get_formula_names.cache_info().misses == 1
+    assert get_formula_names.cache_info().hits == 1
+
+    modifiers = root.iter("{http://www.sbml.org/sbml/level3/version2/core}modifierSpeciesReference")
+
+    assert [item.get("species") for item in modifiers] == ["A__TF", "B__TF"]
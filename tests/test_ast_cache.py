@@ -0,0 +1,117 @@
+import os
+import pytest
+
+from onemodel import ast_cache
+from onemodel.ast_cache import ASTCache
+from onemodel.ast_cache import disable_ast_cache
+from onemodel.ast_cache import dump_ast
+from onemodel.ast_cache import enable_ast_cache
+from onemodel.ast_cache import get_ast_cache
+from onemodel.ast_cache import load_ast
+from onemodel.grammar import get_parser
+from onemodel.onemodel_walker import load_file
+
+examples_dir = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+@pytest.fixture(autouse=True)
+def no_ast_cache(monkeypatch):
+    monkeypatch.delenv("ONEMODEL_AST_CACHE", raising=False)
+    disable_ast_cache()
+    yield
+    disable_ast_cache()
+
+def test_dump_and_load_ast(as_plain):
+    with open(examples_dir + "/ex05_protein_induced.one") as file:
+        text = file.read()
+
+    ast = get_parser().parse(text)
+    result = load_ast(dump_ast(ast))
+
+    assert as_plain(result) == as_plain(ast)
+    assert type(result[0]).__name__ == type(ast[0]).__name__
+
+def test_parse(tmpdir):
+    cache = ASTCache(str(tmpdir))
+    parser = get_parser()
+
+    ast_1 = cache.parse(parser, "parameter foo = 1")
+    ast_2 = cache.parse(parser, "parameter foo = 1")
+
+    assert ast_1 is ast_2
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(os.listdir(tmpdir)) == 1
+
+def test_parse_from_disk(tmpdir, as_plain):
+    parser = get_parser()
+    ASTCache(str(tmpdir)).parse(parser, "parameter foo = 1")
+
+    cache = ASTCache(str(tmpdir))
+    ast = cache.parse(parser, "parameter foo = 1")
+
+    assert cache.hits == 1
+    assert as_plain(ast) == as_plain(parser.parse("parameter foo = 1"))
+
+def test_lru_in_memory(tmpdir):
+    cache = ASTCache(str(tmpdir), max_entries=2)
+    parser = get_parser()
+
+    for i in range(3):
+        cache.parse(parser, f"parameter foo = {i}")
+
+    assert len(cache.entries) == 2
+    assert cache.get_key("parameter foo = 0") not in cache.entries
+
+def test_evict(tmpdir):
+    parser = get_parser()
+    cache = ASTCache(str(tmpdir))
+
+    cache.parse(parser, "parameter foo = 0")
+    size = os.path.getsize(tmpdir / os.listdir(tmpdir)[0])
+
+    cache.max_size = 2 * size
+    for i in range(1, 5):
+        cache.parse(parser, f"parameter foo = {i}")
+        os.utime(cache._get_filepath(cache.get_key(f"parameter foo = {i}")), (i, i))
+
+    cache.evict()
+
+    assert len(os.listdir(tmpdir)) == 2
+
+def test_enable_ast_cache(tmpdir):
+    assert get_ast_cache() is None
+
+    cache = enable_ast_cache(str(tmpdir))
+
+    assert get_ast_cache() is cache
+
+    disable_ast_cache()
+
+    assert get_ast_cache() is None
+
+def test_enable_ast_cache_with_env(tmpdir, monkeypatch):
+    monkeypatch.setenv("ONEMODEL_CACHE_DIR", str(tmpdir))
+    monkeypatch.setenv("ONEMODEL_AST_CACHE", "1")
+
+    assert isinstance(get_ast_cache(), ASTCache)
+    assert get_ast_cache().directory == str(tmpdir / "ast")
+
+@pytest.mark.parametrize("example_name", [
+    "ex01_simple_gene_expression",
+    "ex05_protein_induced",
+    "ex06_antithetic_controller",
+])
+def test_load_file(tmpdir, monkeypatch, example_name):
+    monkeypatch.chdir(examples_dir)
+    filename = example_name + ".one"
+
+    expected = load_file(filename).get_SBML_string()
+
+    enable_ast_cache(str(tmpdir))
+    load_file(filename)
+    ast_cache._ast_cache = ASTCache(str(tmpdir))
+    result = load_file(filename).get_SBML_string()
+
+    assert result == expected
+    assert get_ast_cache().misses == 0
+    assert get_ast_cache().hits > 0
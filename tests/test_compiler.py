@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from onemodel.compiler import OneModelCompiler
+from onemodel.objects.function import Function
+from onemodel.objects.module import ModuleRegistry
+from onemodel.onemodel_walker import OneModelWalker, load_file
+
+examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+statements = [
+    'parameter a0 = 1 "This is a parameter"\nparameter a1 = 3, a2',
+    "species s1 = 2, s2\nspecies\n  s3 = 1e-3\nend",
+    "species x, y\nparameter k\nreaction J1: x + y -> x; k*x*y\nreaction\n  x -> 0; k*x\nend",
+    "species x\nparameter k\nrule R1: x := k * 2\nrule\n  x == k\n  der(x) := k\nend",
+    "parameter p\np.value = (1 + 2) * 3 / 4 - 2^3 + -1",
+    "parameter p\nq = p\nq.value = 5",
+    "function increase(param)\n  param.value = param.value + 1\nend\nparameter p = 1\nincrease(p)",
+]
+
+
+def evaluate_in_model(code):
+    """Evaluates the statements inside a model, so they are compiled."""
+
+    body = "\n".join("  " + line for line in code.split("\n"))
+
+    walker = OneModelWalker()
+    walker.run(f"model M\n{body}\nend\nm = M()\n")
+
+    return walker.onemodel.root["m"]
+
+
+@pytest.mark.parametrize("code", statements)
+def test_compile(code):
+    walker = OneModelWalker()
+    walker.run(code)
+
+    # Functions are not compared, since their bodies are different ASTs.
+    result = {
+        name: value
+        for name, value in evaluate_in_model(code).items()
+        if name != "__doc__" and not isinstance(value, Function)
+    }
+
+    expected = {name: walker.onemodel.root[name] for name in result}
+
+    assert result == expected
+
+
+def test_compile_node():
+    walker = OneModelWalker()
+    ast = walker.parser.parse("parameter a = 1\nb = 2 * 3\n")
+
+    code = OneModelCompiler(walker).compile(ast)
+
+    code(walker.onemodel)
+    code(walker.onemodel)
+
+    assert walker.onemodel["a"]["value"] == 1
+    assert walker.onemodel["b"] == 6
+
+
+def test_execute_cache():
+    walker = OneModelWalker()
+    walker.run("model M\n  parameter k = 1\nend\na = M()\nb = M()\n")
+
+    body = walker.onemodel["M"]["body"]
+
+    assert len(walker.compiled) == 1
+    assert walker.compiled[id(body)][0] is body
+    assert walker.onemodel["a"]["k"] == walker.onemodel["b"]["k"]
+    assert walker.onemodel["a"]["k"] is not walker.onemodel["b"]["k"]
+
+
+def test_unnamed_reactions():
+    walker = OneModelWalker()
+    walker.run("model M\n  species x\n  reaction x -> 0; x\n  rule x := 1\nend\na = M()\nb = M()\n")
+
+    root = walker.onemodel.root
+
+    assert "_J0" in root["a"] and "_R1" in root["a"]
+    assert "_J2" in root["b"] and "_R3" in root["b"]
+
+
+def test_shared_modules(monkeypatch):
+    monkeypatch.chdir(examples_dir)
+
+    filename = "ex05_protein_induced.one"
+    expected = load_file(filename).get_SBML_string()
+
+    # The models of a module evaluated by another file are instantiated in
+    # the OneModel that calls them.
+    modules = ModuleRegistry()
+    load_file(filename, modules=modules)
+    result = load_file(filename, modules=modules)
+
+    assert result.get_SBML_string() == expected
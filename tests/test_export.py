@@ -0,0 +1,224 @@
+import os
+import shutil
+
+import pytest
+
+from onemodel.export import export_files, export_variants, find_files, get_summary
+from onemodel.export import ModuleASTs, read_variants
+from onemodel.onemodel_walker import load_file
+
+examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+examples = [
+    "ex01_simple_gene_expression",
+    "ex03_protein_constitutive",
+    "ex05_protein_induced",
+]
+
+
+def test_find_files(tmpdir):
+    for name in ["a.one", "b.one", "sub/c.one", "sub/d.txt"]:
+        (tmpdir / name).write_text("", encoding="utf-8", ensure=True)
+
+    a = str(tmpdir / "a.one")
+    b = str(tmpdir / "b.one")
+    c = str(tmpdir / "sub" / "c.one")
+
+    assert find_files([str(tmpdir)]) == [a, b, c]
+    assert find_files([str(tmpdir / "*.one"), a]) == [a, b]
+    assert find_files(["missing.one"]) == ["missing.one"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_export_files(tmpdir, monkeypatch, jobs):
+    monkeypatch.chdir(examples_dir)
+
+    filenames = [name + ".one" for name in examples] + ["missing.one"]
+    results = export_files(filenames, str(tmpdir), jobs)
+
+    assert [result.filename for result in results] == filenames
+
+    for name, result in zip(examples, results):
+        assert result.error is None
+
+        with open(result.output) as file:
+            assert file.read() == load_file(name + ".one").get_SBML_string()
+
+    assert results[-1].error.startswith("FileNotFoundError")
+    assert not os.path.exists(results[-1].output)
+
+    summary = get_summary(results)
+
+    assert "missing.one" in summary
+    assert "Exported 3 of 4 files" in summary
+    assert "(1 failed)" in summary
+
+
+def test_export_files_independent_imports(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+
+    (tmpdir / "m.one").write_text("parameter k = 1\n", encoding="utf-8")
+    (tmpdir / "a.one").write_text("import m\nparameter m.k = 5\n", encoding="utf-8")
+    (tmpdir / "b.one").write_text("import m\n", encoding="utf-8")
+
+    results = export_files(["a.one", "b.one"], str(tmpdir / "out"), 1)
+
+    for result in results:
+        assert result.error is None
+
+        with open(result.output) as file:
+            assert file.read() == load_file(result.filename).get_SBML_string()
+
+
+def test_export_files_duplicated_outputs(tmpdir):
+    os.mkdir(tmpdir / "other")
+
+    for name in ["model.one", "other/model.one"]:
+        shutil.copy(os.path.join(examples_dir, "ex01_simple_gene_expression.one"), tmpdir / name)
+
+    with pytest.raises(ValueError):
+        export_files([str(tmpdir / "model.one"), str(tmpdir / "other" / "model.one")])
+
+
+def test_read_variants(tmpdir):
+    filename = str(tmpdir / "variants.csv")
+
+    with open(filename, "w") as file:
+        file.write("variant,A.k_p,A.protein\nlow,0.5,1\nhigh,2,3\n")
+
+    assert read_variants(filename) == [
+        ("low", {"A.k_p": 0.5, "A.protein": 1.0}),
+        ("high", {"A.k_p": 2.0, "A.protein": 3.0}),
+    ]
+
+    with open(filename, "w") as file:
+        file.write("A.k_p\n0.5\n2\n")
+
+    assert read_variants(filename) == [("0", {"A.k_p": 0.5}), ("1", {"A.k_p": 2.0})]
+
+
+def test_read_variants_empty_cell(tmpdir):
+    filename = str(tmpdir / "variants.csv")
+
+    with open(filename, "w") as file:
+        file.write("variant,A.k_p,A.protein\nlow,0.5,\nhigh,,3\n")
+
+    assert read_variants(filename) == [
+        ("low", {"A.k_p": 0.5}),
+        ("high", {"A.protein": 3.0}),
+    ]
+
+    with open(filename, "w") as file:
+        file.write("variant,A.k_p\nlow,fast\n")
+
+    with pytest.raises(ValueError, match="variant low: the value of 'A.k_p'"):
+        read_variants(filename)
+
+
+def test_read_variants_npy(tmpdir):
+    numpy = pytest.importorskip("numpy")
+
+    filename = str(tmpdir / "variants.npy")
+    table = numpy.array([(0.5, 1.0), (2.0, 3.0)], dtype=[("A.k_p", float), ("A.protein", float)])
+    numpy.save(filename, table)
+
+    assert read_variants(filename) == [
+        ("0", {"A.k_p": 0.5, "A.protein": 1.0}),
+        ("1", {"A.k_p": 2.0, "A.protein": 3.0}),
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_export_variants(tmpdir, monkeypatch, jobs):
+    monkeypatch.chdir(examples_dir)
+
+    variants = [
+        ("low", {"A.k_p": 0.5, "A.protein": 1}),
+        ("high", {"A.k_p": 2, "A.protein": 3}),
+        ("bad", {"A.k_p": 2, "A.missing": 3}),
+    ]
+
+    results = export_variants("ex03_protein_constitutive.one", variants, str(tmpdir), jobs)
+
+    assert [result.filename for result in results] == ["low", "high", "bad"]
+    assert results[2].error.startswith("KeyError")
+
+    for result, (_, values) in zip(results[:2], variants):
+        assert result.error is None
+        assert result.output == str(tmpdir / f"ex03_protein_constitutive_{result.filename}.xml")
+
+        m = load_file("ex03_protein_constitutive.one")
+        m["A"]["k_p"]["value"] = values["A.k_p"]
+        m["A"]["protein"]["initialConcentration"] = values["A.protein"]
+
+        with open(result.output) as file:
+            assert file.read() == m.get_SBML_string()
+
+
+def test_export_variants_model_unchanged(tmpdir, monkeypatch):
+    monkeypatch.chdir(examples_dir)
+
+    m = load_file("ex03_protein_constitutive.one")
+    expected = m.get_SBML_string()
+
+    results = export_variants(m, [("high", {"A.k_p": 2})], str(tmpdir))
+
+    assert results[0].error is None
+    assert m.SBML_document is None
+    assert m.get_SBML_string() == expected
+
+    # The document kept by the model is not patched either.
+    SBML_document = m.to_SBML_document(keep=True)
+    export_variants(m, [("high", {"A.k_p": 2})], str(tmpdir))
+
+    assert m.SBML_document is SBML_document
+    assert m.SBML_elements["A__k_p"].getValue() == m["A"]["k_p"]["value"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_export_variants_reset(tmpdir, monkeypatch, jobs):
+    """The names that a variant does not set keep the value of the model."""
+
+    monkeypatch.chdir(examples_dir)
+
+    variants = [
+        ("k_p", {"A.k_p": 2}),
+        ("protein", {"A.protein": 3}),
+        ("bad", {"A.protein": 4, "A.missing": 3}),
+        ("k_p_again", {"A.k_p": 5}),
+    ]
+
+    results = export_variants("ex03_protein_constitutive.one", variants, str(tmpdir), jobs)
+
+    assert results[2].error.startswith("KeyError")
+
+    for result, (_, values) in zip(results, variants):
+        if result.error is not None:
+            continue
+
+        m = load_file("ex03_protein_constitutive.one")
+        m["A"]["k_p"]["value"] = values.get("A.k_p", m["A"]["k_p"]["value"])
+        m["A"]["protein"]["initialConcentration"] = values.get(
+            "A.protein", m["A"]["protein"]["initialConcentration"]
+        )
+
+        with open(result.output) as file:
+            assert file.read() == m.get_SBML_string()
+
+    # The document of the variants is not kept by the module.
+    import onemodel.export
+
+    assert onemodel.export._variant_writer is None
+
+
+def test_module_asts():
+    asts = ModuleASTs(max_entries=2)
+    asts["a"] = 1
+    asts["b"] = 2
+
+    # Reading "a" makes "b" the least recently used.
+    assert asts.get("a") == 1
+    asts["c"] = 3
+
+    assert list(asts) == ["a", "c"]
+    assert asts.get("b") is None
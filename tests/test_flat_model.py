@@ -0,0 +1,100 @@
+from onemodel.flat_model import FlatModel
+from onemodel.onemodel import OneModel
+from onemodel.objects.object import Object
+from onemodel.objects.species import Species
+from onemodel.objects.parameter import Parameter
+from onemodel.objects.reaction import Reaction
+from onemodel.objects.algebraic_rule import AlgebraicRule
+from onemodel.objects.assignment_rule import AssignmentRule
+from onemodel.objects.rate_rule import RateRule
+import onemodel.flat_model as flat_model_module
+
+
+def test_examples(example_model):
+    """The FlatModel exports the same SBML as the OneModel."""
+
+    flat_model = FlatModel.from_onemodel(example_model)
+    expected = example_model.get_SBML_string()
+
+    assert flat_model.get_SBML_string() == expected
+    assert flat_model.get_SBML_string("xml") == expected
+
+
+def create_model():
+    m = OneModel()
+
+    m["A"] = Object()
+    m["A"]["X"] = Species()
+    m["A"]["TF"] = Species()
+    m["A"]["k"] = Parameter()
+    m["A"]["k"]["value"] = 2
+    m["A"]["J1"] = Reaction()
+    m["A"]["J1"]["reactants"] = ["X"]
+    m["A"]["J1"]["products"] = ["Y", None]
+    m["A"]["J1"]["kinetic_law"] = "k*TF*X"
+    m["A"]["Y"] = Species()
+    m["A"]["Y"]["initialConcentration"] = 1.5
+    m["A"]["rule"] = AlgebraicRule()
+    m["A"]["rule"]["variable"] = "Y"
+    m["A"]["rule"]["math"] = "X + k"
+
+    return m
+
+
+def test_from_onemodel():
+    m = create_model()
+    flat_model = FlatModel.from_onemodel(m)
+
+    assert flat_model.species_ids == ["A__X", "A__TF", "A__Y"]
+    assert list(flat_model.initial_concentrations) == [0, 0, 1.5]
+    assert flat_model.parameter_ids == ["A__k"]
+    assert list(flat_model.parameter_values) == [2]
+    assert flat_model.reaction_ids == ["A__J1"]
+    assert flat_model.get_reactants(0) == ["A__X"]
+    assert flat_model.get_products(0) == ["A__Y"]
+    assert list(flat_model.get_modifiers(0)) == [1]
+    assert flat_model.kinetic_laws == ["A__k*A__TF*A__X"]
+    assert flat_model.rule_kinds == ["algebraic"]
+    assert flat_model.rule_variables == ["A__Y"]
+    assert flat_model.rule_formulas == ["A__X+A__k"]
+    assert flat_model.export_kinds == ["species", "species", "parameter", "reaction", "species", "rule"]
+    assert repr(flat_model) == "<flat-model species=3 parameters=1 reactions=1 rules=1>"
+
+    assert flat_model.get_SBML_string() == m.get_SBML_string()
+
+
+def test_participant_not_species():
+    """As in the SBML export, a participant does not need to be a species."""
+
+    m = create_model()
+    m["A"]["J1"]["products"] = ["k"]
+
+    flat_model = FlatModel.from_onemodel(m)
+
+    assert flat_model.get_products(0) == ["A__k"]
+    assert flat_model.get_SBML_string() == m.get_SBML_string()
+
+
+def test_export_from_rows(monkeypatch):
+    """The export writes the rows without resolving names again."""
+
+    m = create_model()
+    m["A"]["assignment"] = AssignmentRule()
+    m["A"]["assignment"]["variable"] = "TF"
+    m["A"]["assignment"]["math"] = "2 * k"
+    m["A"]["rate"] = RateRule()
+    m["A"]["rate"]["variable"] = "X"
+    m["A"]["rate"]["math"] = "-k * X"
+
+    flat_model = FlatModel.from_onemodel(m)
+    expected = m.get_SBML_string()
+
+    def fail(*args):
+        raise AssertionError("names resolved again")
+
+    monkeypatch.setattr(flat_model_module, "get_formula_fullnames", fail)
+    monkeypatch.setattr(flat_model_module, "math_2_fullname", fail)
+    monkeypatch.setattr(Reaction, "add_to_SBML_model", fail)
+
+    assert flat_model.get_SBML_string() == expected
+    assert flat_model.get_SBML_string("xml") == expected
@@ -0,0 +1,108 @@
+import glob
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from onemodel import grammar
+from onemodel.grammar import GeneratedParser
+from onemodel.grammar import clear_parser_cache
+from onemodel.grammar import get_grammar_hash
+from onemodel.grammar import get_parser
+from onemodel.grammar import is_generated_parser_up_to_date
+from onemodel.onemodel_walker import OneModelWalker
+
+
+def test_get_grammar_hash():
+    assert get_grammar_hash("foo") == get_grammar_hash("foo")
+    assert get_grammar_hash("foo") != get_grammar_hash("bar")
+
+def test_get_parser_in_memory(tmpdir, monkeypatch):
+    monkeypatch.setenv("ONEMODEL_CACHE_DIR", str(tmpdir))
+
+    assert get_parser() is get_parser()
+    assert OneModelWalker().parser is OneModelWalker().parser
+
+def test_get_parser_on_disk(tmpdir, monkeypatch):
+    monkeypatch.setenv("ONEMODEL_CACHE_DIR", str(tmpdir))
+    clear_parser_cache()
+
+    parser_1 = get_parser(generated=False)
+    assert len(os.listdir(tmpdir / "grammar")) == 1
+
+    clear_parser_cache()
+    parser_2 = get_parser(generated=False)
+
+    assert parser_1 is not parser_2
+    assert parser_2.parse("parameter foo = 1") is not None
+
+def test_get_parser_corrupted_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv("ONEMODEL_CACHE_DIR", str(tmpdir))
+    clear_parser_cache()
+    get_parser(generated=False)
+
+    filename = os.listdir(tmpdir / "grammar")[0]
+    with open(tmpdir / "grammar" / filename, "w") as file:
+        file.write("not a pickle")
+
+    clear_parser_cache()
+    parser = get_parser(generated=False)
+
+    assert parser.parse("parameter foo = 1") is not None
+
+def test_get_parser_unwritable_cache(tmpdir, monkeypatch):
+    # The cache directory cannot be created inside a file.
+    tmpdir.join("file").write("")
+    monkeypatch.setenv("ONEMODEL_CACHE_DIR", str(tmpdir / "file"))
+    clear_parser_cache()
+
+    parser = get_parser(generated=False)
+
+    assert parser.parse("parameter foo = 1") is not None
+    assert OneModelWalker().parser is not None
+
+def test_get_parser_generated():
+    assert isinstance(get_parser(), GeneratedParser)
+
+def test_get_parser_reads_grammar_once(monkeypatch):
+    get_parser()
+
+    monkeypatch.setattr(grammar, "read_grammar", lambda: pytest.fail("grammar read again"))
+
+    assert OneModelWalker().parser is get_parser()
+
+@pytest.mark.parametrize("generated", [True, False])
+def test_get_parser_threads(generated, as_plain):
+    parser = get_parser(generated)
+    text = "parameter k = 1\nspecies x = 2\nreaction\n  x -> 0 ; k*x\nend\n"
+    expected = as_plain(parser.parse(text))
+
+    def parse(i):
+        return [as_plain(parser.parse(text)) for _ in range(30)]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = [item for items in executor.map(parse, range(8)) for item in items]
+
+    assert results == [expected] * 240
+
+def test_is_generated_parser_up_to_date(monkeypatch):
+    assert is_generated_parser_up_to_date()
+
+    monkeypatch.setattr(grammar.os.path, "getmtime", lambda path: (
+        1 if path.endswith("onemodel_parser.py") else 2
+    ))
+
+    assert is_generated_parser_up_to_date(grammar.get_grammar_hash())
+    assert not is_generated_parser_up_to_date("outdated grammar hash")
+
+examples_dir = os.path.join(os.path.dirname(__file__), "..", "examples")
+examples = sorted(glob.glob(examples_dir + "/**/*.one", recursive=True))
+
+@pytest.mark.parametrize("filename", examples, ids=os.path.basename)
+def test_generated_parser_same_ast(filename, as_plain):
+    with open(filename) as file:
+        text = file.read()
+
+    runtime_ast = get_parser(generated=False).parse(text)
+    generated_ast = get_parser().parse(text)
+
+    assert as_plain(generated_ast) == as_plain(runtime_ast)
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+examples_dir = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+# Dependencies that must not be imported by each piece of code.
+heavy_modules = ["libsbml", "git", "readline", "tabulate", "tatsu"]
+
+cases = {
+    "import onemodel": heavy_modules,
+    "import onemodel.__main__": heavy_modules,
+    "import onemodel.onemodel": heavy_modules,
+    "import onemodel.objects.reaction": heavy_modules,
+    "from onemodel.onemodel_walker import load_file; "
+    "load_file('ex05_protein_induced.one')": ["libsbml", "git", "readline", "tabulate"],
+}
+
+def get_imported_modules(code):
+    """Run code with `-X importtime` and return the names of the imported modules."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code],
+        cwd=examples_dir,
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+
+    modules = set()
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        name = line.split("|")[-1].strip()
+        modules.add(name)
+
+    return modules
+
+def is_imported(name, modules):
+    """Returns True if the package or any of its submodules is in modules."""
+
+    return any(module == name or module.startswith(name + ".") for module in modules)
+
+@pytest.mark.parametrize("code", cases.keys())
+def test_import_time(code):
+    modules = get_imported_modules(code)
+
+    for name in cases[code]:
+        assert not is_imported(name, modules), f"'{code}' imports '{name}'"
+
+def test_export_does_not_import_git_or_readline(tmpdir):
+    code = (
+        "import sys; sys.argv = ['onemodel', 'export', 'ex01_simple_gene_expression.one']; "
+        f"import os; os.chdir({str(tmpdir)!r}); "
+        "sys.argv[2] = os.path.join(" + repr(os.path.abspath(examples_dir)) + ", sys.argv[2]); "
+        "from onemodel.__main__ import main; main()"
+    )
+    modules = get_imported_modules(code)
+
+    assert is_imported("libsbml", modules)
+    assert not is_imported("git", modules)
+    assert not is_imported("readline", modules)
+    assert os.path.isfile(tmpdir / "build" / "ex01_simple_gene_expression.xml")
@@ -0,0 +1,99 @@
+import os
+import sys
+
+import pytest
+
+from onemodel.__main__ import main
+from onemodel.onemodel_walker import load_file
+
+examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+def test_export(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    filename = os.path.join(examples_dir, "ex01_simple_gene_expression.one")
+    monkeypatch.setattr(sys, "argv", ["onemodel", "export", filename])
+
+    main()
+
+    with open(tmpdir / "build" / "ex01_simple_gene_expression.xml") as file:
+        assert file.read() == load_file(filename).get_SBML_string()
+
+def test_export_output(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    filename = os.path.join(examples_dir, "ex01_simple_gene_expression.one")
+    monkeypatch.setattr(
+        sys, "argv", ["onemodel", "export", filename, "--output", "out/model.xml.gz", "--release"]
+    )
+
+    main()
+
+    assert os.path.isfile(tmpdir / "out" / "model.xml.gz")
+    assert not os.path.exists(tmpdir / "build")
+
+def test_export_many(tmpdir, monkeypatch, capsys):
+    monkeypatch.chdir(examples_dir)
+    monkeypatch.setattr(
+        sys, "argv", ["onemodel", "export", "ex0[12]*.one", "-j", "2", "-d", str(tmpdir)]
+    )
+
+    main()
+
+    assert "Exported 2 of 2 files" in capsys.readouterr().out
+    assert os.path.isfile(tmpdir / "ex01_simple_gene_expression.xml")
+    assert os.path.isfile(tmpdir / "ex02_two_genes_expression.xml")
+
+def test_export_many_error(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setattr(sys, "argv", ["onemodel", "export", "a.one", "b.one"])
+
+    with pytest.raises(SystemExit):
+        main()
+
+def test_export_output_dir(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    filename = os.path.join(examples_dir, "ex01_simple_gene_expression.one")
+    monkeypatch.setattr(sys, "argv", ["onemodel", "export", filename, "--output-dir", "out"])
+
+    main()
+
+    assert os.path.isfile(tmpdir / "out" / "ex01_simple_gene_expression.xml")
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ([], "usage: onemodel export"),
+        (["ex01_simple_gene_expression.one", "-o", "a.xml", "-d", "out"], "either"),
+        (["ex0[12]*.one", "-o", "out"], "use --output-dir"),
+        (["ex0[12]*.one", "--snapshot", "model.snapshot"], "--snapshot"),
+        (["ex01_simple_gene_expression.one", "-j", "2", "--snapshot", "s"], "--snapshot"),
+    ],
+)
+def test_export_usage_error(tmpdir, monkeypatch, args, message):
+    monkeypatch.chdir(examples_dir)
+    monkeypatch.setattr(sys, "argv", ["onemodel", "export"] + args)
+
+    with pytest.raises(SystemExit) as e:
+        main()
+
+    assert message in str(e.value.code)
+    assert not os.path.exists(os.path.join(examples_dir, "build"))
+
+def test_variants(tmpdir, monkeypatch, capsys):
+    monkeypatch.chdir(examples_dir)
+
+    table = str(tmpdir / "variants.csv")
+
+    with open(table, "w") as file:
+        file.write("A.k_p\n0.5\n2\n")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["onemodel", "variants", "ex03_protein_constitutive.one", table, "-o", str(tmpdir)],
+    )
+
+    main()
+
+    assert "Exported 2 of 2 files" in capsys.readouterr().out
+    assert os.path.isfile(tmpdir / "ex03_protein_constitutive_0.xml")
+    assert os.path.isfile(tmpdir / "ex03_protein_constitutive_1.xml")
@@ -1,13 +1,20 @@
+import gzip
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from xml.etree import ElementTree
 
 from onemodel.onemodel import OneModel
+from onemodel.onemodel_walker import load_file
 from onemodel.objects.object import Object
 from onemodel.objects.species import Species
 from onemodel.objects.parameter import Parameter
 from onemodel.objects.reaction import Reaction
 from onemodel.objects.assignment_rule import AssignmentRule
 from onemodel.objects.builtin_function import BuiltinFunction
-from onemodel.scope import Scope
 
 def test_init():
 
@@ -531,3 +538,123 @@ def test_ex05_protein_induced():
 
 
     assert ElementTree.tostring(result) == ElementTree.tostring(expected)
+
+def test_export_SBML(tmpdir):
+    m = OneModel()
+    m["A"] = Species()
+
+    expected = m.get_SBML_string()
+
+    m.export_SBML(str(tmpdir / "model.xml"))
+    with open(tmpdir / "model.xml") as file:
+        assert file.read() == expected
+
+    m.export_SBML(tmpdir / "model.xml.gz")
+    with gzip.open(tmpdir / "model.xml.gz", "rt") as file:
+        assert file.read() == expected
+
+    text_file = io.StringIO()
+    m.export_SBML(text_file)
+    assert text_file.getvalue() == expected
+
+    binary_file = io.BytesIO()
+    m.export_SBML(binary_file)
+    assert binary_file.getvalue().decode("utf-8") == expected
+
+def test_get_SBML_string_keeps_scope():
+    m = OneModel()
+    m["k"] = Parameter()
+
+    namespace = Object()
+    m.push(namespace, "inner")
+    namespaces = list(m.namespaces)
+    prefixes = list(m.prefixes)
+
+    result = m.get_SBML_string()
+
+    assert m.namespaces == namespaces
+    assert m.prefixes == prefixes
+    assert m.peek() is namespace
+    assert '<parameter id="k"' in result
+
+def test_get_SBML_string_threads(monkeypatch):
+    examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+    monkeypatch.chdir(examples_dir)
+
+    m = load_file("ex06_antithetic_controller.one")
+    expected = m.get_SBML_string()
+
+    def export(i):
+        backend = ["libsbml", "xml"][i % 2]
+        mode = ["debug", "release"][i // 2 % 2]
+        return m.get_SBML_string(backend=backend, mode=mode)
+
+    # Switch between threads as often as possible.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(export, range(200)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert all(result == expected for result in results)
+    assert len(m.namespaces) == 1
+
+def test_to_SBML_document():
+    import libsbml
+
+    m = OneModel()
+    m["k"] = Parameter()
+
+    result = m.to_SBML_document()
+
+    assert isinstance(result, libsbml.SBMLDocument)
+    assert libsbml.writeSBMLToString(result) == m.get_SBML_string()
+    assert result.getModel().getParameter("k").getValue() == 0
+    assert m.SBML_document is None
+
+    result = m.to_SBML_document(keep=True)
+
+    assert m.SBML_document is result
+    assert m.SBML_index == {"k": "parameter"}
+
+def test_set_SBML_values():
+    import libsbml
+
+    m = OneModel()
+    m["k"] = Parameter()
+    m["circuit"] = Object()
+    m["circuit"]["x"] = Species()
+    m["circuit"]["z1"] = Object()
+    m["circuit"]["z1"]["k"] = Parameter()
+    m["circuit"]["r"] = Reaction()
+    m["circuit"]["r"]["kinetic_law"] = "1"
+
+    with pytest.raises(ValueError):
+        m.set_SBML_values({"k": 1})
+
+    document = m.to_SBML_document(keep=True)
+    m.set_SBML_values({"circuit.z1.k": 2.5, "circuit.x": 3, "k": 4})
+
+    model = document.getModel()
+
+    assert model.getParameter("circuit__z1__k").getValue() == 2.5
+    assert model.getSpecies("circuit__x").getInitialConcentration() == 3
+    assert model.getParameter("k").getValue() == 4
+
+    # The objects of the model do not change.
+    assert m["circuit"]["z1"]["k"]["value"] == 0
+
+    m["circuit"]["z1"]["k"]["value"] = 2.5
+    m["circuit"]["x"]["initialConcentration"] = 3
+    m["k"]["value"] = 4
+
+    assert libsbml.writeSBMLToString(document) == m.get_SBML_string()
+
+    with pytest.raises(KeyError):
+        m.set_SBML_values({"circuit.r": 1})
+
+    with pytest.raises(KeyError):
+        m.set_SBML_values({"missing": 1})
@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+from onemodel.onemodel_walker import OneModelWalker
+from onemodel.prototype import ModelPrototype, clone_from_plan, get_body_names
+from onemodel.prototype import get_clone_plan
+from onemodel.objects.parameter import Parameter
+from onemodel.objects.object import Object
+
+examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+
+def run(code):
+    walker = OneModelWalker()
+    walker.run(code)
+
+    return walker.onemodel
+
+
+def get_body(code):
+    walker = OneModelWalker()
+    result, ast = walker.run(code)
+
+    return walker.onemodel["M"]["body"]
+
+
+@pytest.mark.parametrize("example", ["ex05_protein_induced", "ex06_antithetic_controller"])
+def test_prototype(monkeypatch, example):
+    monkeypatch.chdir(examples_dir)
+
+    with open(example + ".one") as file:
+        code = file.read()
+
+    code += "".join(f"p{i} = {'ProteinInduced' if i % 2 else 'ProteinConstitutive'}()\n" for i in range(5))
+
+    result = run(code)
+
+    assert result["ProteinInduced"].prototype is not None
+
+    # The instances are the same as evaluating the body every time.
+    monkeypatch.setattr(ModelPrototype, "create", lambda *args: None)
+    expected = run(code)
+
+    names = [f"p{i}" for i in range(5)]
+
+    assert [result[name] for name in names] == [expected[name] for name in names]
+    assert result.get_SBML_string() == expected.get_SBML_string()
+    assert result.numberOfUnnamedReactions == expected.numberOfUnnamedReactions
+
+
+def test_prototype_copies():
+    m = run("model M\n  parameter k = 1\nend\na = M()\nb = M()\n")
+
+    m["a"]["k"]["value"] = 2
+
+    assert m["b"]["k"]["value"] == 1
+    assert m["M"].call(m, [])["k"]["value"] == 1
+
+
+def test_prototype_invalidated():
+    m = run(
+        "model A\n  parameter k = 1\nend\n"
+        "model M\n  a = A()\nend\n"
+        "x = M()\n"
+        "model A\n  parameter k = 2\nend\n"
+        "y = M()\n"
+    )
+
+    assert m["x"]["a"]["k"]["value"] == 1
+    assert m["y"]["a"]["k"]["value"] == 2
+
+
+def test_not_clonable():
+    m = run(
+        "function f()\n  parameter k = 1\nend\n"
+        "model M\n  f()\nend\n"
+        "model N\n  x = f()\nend\n"
+        "a = M()\nb = N()\n"
+    )
+
+    assert m["M"].prototype is None
+    assert m["N"].prototype is None
+
+
+@pytest.mark.parametrize(
+    "code, names",
+    [
+        ("model M\n  parameter k = 1, j\nend", ({"k", "j"}, set())),
+        ("model M\n  extends A\n  species x\nend", ({"x"}, {"A"})),
+        ("model M\n  a = A()\n  rule a.x := 1\nend", ({"a"}, {"A"})),
+        ("model M\n  k = 1 + 2\nend", ({"k"}, set())),
+        ("model M\nend", (set(), set())),
+        ("model M\n  rule x.y := 1\nend", None),
+        ("model M\n  parameter x.y\nend", None),
+        ("model M\n  reaction a.x -> 0; 1\nend", None),
+        ("model M\n  k = j\nend", None),
+        ("model M\n  k = A(1)\nend", None),
+        ("model M\n  parameter _J1\nend", None),
+        ("model M\n  import ex01\nend", None),
+    ],
+)
+def test_get_body_names(code, names):
+    assert get_body_names(get_body(code)) == names
+
+
+def test_clone_from_plan():
+    value = Object()
+    value["k"] = Parameter()
+    value["_J0"] = Object()
+    value["_J0"]["reactants"] = ["x"]
+
+    result = clone_from_plan(get_clone_plan(value), 3)
+
+    assert list(result) == ["__doc__", "k", "_J3"]
+    assert type(result["k"]) is Parameter
+    assert result["k"] == value["k"] and result["k"] is not value["k"]
+    assert result["_J3"]["reactants"] == ["x"]
+    assert result["_J3"]["reactants"] is not value["_J0"]["reactants"]
@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+from onemodel.onemodel import OneModel
+from onemodel.onemodel_walker import load_file
+from onemodel.objects.species import Species
+from onemodel.objects.parameter import Parameter
+from onemodel.objects.reaction import Reaction
+from onemodel.sbml_cache import SBMLFragmentCache
+
+examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+
+def create_model():
+    m = OneModel()
+
+    m["x"] = Species()
+    m["y"] = Parameter()
+    m["k"] = Parameter()
+    m["r"] = Reaction()
+    m["r"]["products"] = ["x"]
+    m["r"]["kinetic_law"] = "k * y"
+
+    return m
+
+
+def test_reuse(monkeypatch):
+    monkeypatch.chdir(examples_dir)
+
+    cache = SBMLFragmentCache()
+    m = load_file("ex05_protein_induced.one")
+
+    expected = m.get_SBML_string()
+
+    assert m.get_SBML_string(backend="xml", cache=cache) == expected
+    assert cache.stats()["total"]["hits"] == 0
+
+    cache.reset_stats()
+
+    assert m.get_SBML_string(backend="xml", cache=cache) == expected
+    assert cache.stats()["total"]["misses"] == 0
+    assert cache.stats()["total"]["ratio"] == 1.0
+
+    # Loading the file again reuses the same fragments.
+    cache.reset_stats()
+    m = load_file("ex05_protein_induced.one")
+
+    assert m.get_SBML_string(backend="xml", cache=cache) == expected
+    assert cache.stats()["total"]["misses"] == 0
+
+
+def test_changed_object():
+    cache = SBMLFragmentCache()
+    m = create_model()
+    m.get_SBML_string(backend="xml", cache=cache)
+
+    m["k"]["value"] = 2
+    cache.reset_stats()
+
+    assert m.get_SBML_string(backend="xml", cache=cache) == m.get_SBML_string()
+    assert cache.stats()["Parameter"] == {"hits": 1, "misses": 1, "ratio": 0.5}
+    assert cache.stats()["Species"]["hits"] == 1
+
+
+def test_replace_fragment():
+    """The fragment of a changed object replaces the previous one."""
+
+    cache = SBMLFragmentCache()
+    m = create_model()
+
+    for value in range(5):
+        m["k"]["value"] = value
+        m.get_SBML_string(backend="xml", cache=cache)
+
+    assert len(cache.fragments) == 4
+
+    # The previous value is exported again.
+    m["k"]["value"] = 3
+    cache.reset_stats()
+
+    assert m.get_SBML_string(backend="xml", cache=cache) == m.get_SBML_string()
+    assert cache.stats()["Parameter"]["misses"] == 1
+
+
+def test_changed_index():
+    """A reaction is exported again when its modifiers change."""
+
+    cache = SBMLFragmentCache()
+    m = create_model()
+    m.get_SBML_string(backend="xml", cache=cache)
+
+    # y becomes a modifier of the reaction.
+    m["y"] = Species()
+    cache.reset_stats()
+
+    result = m.get_SBML_string(backend="xml", cache=cache)
+
+    assert result == m.get_SBML_string()
+    assert '<modifierSpeciesReference species="y"/>' in result
+    assert cache.stats()["Reaction"]["misses"] == 1
+
+
+def test_libsbml_backend():
+    with pytest.raises(ValueError):
+        OneModel().get_SBML_string(cache=SBMLFragmentCache())
+
+
+def test_get_summary():
+    cache = SBMLFragmentCache()
+    m = create_model()
+    m.get_SBML_string(backend="xml", cache=cache)
+    m.get_SBML_string(backend="xml", cache=cache)
+
+    summary = cache.get_summary()
+
+    assert "Reuse ratio" in summary
+    assert "50.0%" in summary
+
+    cache.clear()
+
+    assert not cache.fragments
+    assert cache.stats() == {"total": {"hits": 0, "misses": 0, "ratio": 0.0}}
@@ -0,0 +1,71 @@
+import gzip
+import io
+import zipfile
+
+import pytest
+
+from onemodel.onemodel import OneModel
+from onemodel.sbml_xml import XMLDocument, format_value
+
+
+def test_examples(example_model):
+    """The xml backend writes the same SBML as libsbml for every example."""
+
+    expected = example_model.get_SBML_string()
+
+    assert example_model.get_SBML_string(backend="xml") == expected
+
+
+def test_export_SBML(tmp_path):
+    m = OneModel()
+    expected = m.get_SBML_string()
+
+    m.export_SBML(tmp_path / "model.xml", backend="xml")
+    assert (tmp_path / "model.xml").read_text() == expected
+
+    m.export_SBML(str(tmp_path / "model.xml.gz"), backend="xml")
+    with gzip.open(tmp_path / "model.xml.gz", "rt") as file:
+        assert file.read() == expected
+
+    for backend in ["xml", "libsbml"]:
+        m.export_SBML(str(tmp_path / "model.xml.zip"), backend=backend)
+        with zipfile.ZipFile(tmp_path / "model.xml.zip") as archive:
+            assert archive.namelist() == ["model.xml"]
+            assert archive.read("model.xml").decode("utf-8") == expected
+
+    file = io.BytesIO()
+    m.export_SBML(file, backend="xml")
+    assert file.getvalue().decode("utf-8") == expected
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        OneModel().get_SBML_string(backend="foo")
+
+
+def test_XMLDocument():
+    with pytest.raises(ValueError):
+        XMLDocument(3, 1)
+
+    doc = XMLDocument()
+    model = doc.createModel()
+    model.setId("main")
+    parameter = model.createParameter()
+    parameter.setId("k")
+    parameter.setValue(2.0)
+
+    assert model.getElementBySId("k") is parameter
+    assert model.getElementBySId("foo") is None
+    assert '<parameter id="k" value="2"/>' in doc.write_to_string()
+
+
+def test_format_value():
+    assert format_value(True) == "true"
+    assert format_value(False) == "false"
+    assert format_value(3) == "3"
+    assert format_value(0.1) == "0.1"
+    assert format_value(1e-20) == "1e-20"
+    assert format_value(float("nan")) == "NaN"
+    assert format_value(float("inf")) == "INF"
+    assert format_value(float("-inf")) == "-INF"
+    assert format_value('a<"b">&') == "a&lt;&quot;b&quot;&gt;&amp;"
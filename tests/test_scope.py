@@ -1,4 +1,4 @@
-from onemodel.scope import Scope
+from onemodel.scope import Scope, ExportScope
 from onemodel.namespace import Namespace
 
 
@@ -91,3 +91,52 @@ def test_get_fullname():
     assert scope.get_fullname("bar") == "n1__bar"
     assert scope.get_fullname("baz") == "n1__n2__baz"
     assert scope.get_fullname("bar.other") == "n1__bar__other"
+
+def test_get_fullname_memoized():
+    n0 = Namespace()
+    n0["foo"] = 1
+
+    scope = ExportScope(n0)
+    scope.push(Namespace(), "n1")
+
+    assert scope.get_fullname("foo") == "foo"
+    assert scope.fullnames[-1]["foo"] == "foo"
+
+    scope["foo"] = 2
+
+    assert scope.get_fullname("foo") == "n1__foo"
+
+    scope.pop()
+
+    assert scope.get_fullname("foo") == "foo"
+
+def test_get_fullname_direct_write():
+    scope = Scope()
+    n0 = Namespace()
+    n1 = Namespace()
+
+    scope.push(n0, "")
+    scope["foo"] = 1
+    scope.push(n1, "n1")
+
+    assert scope.get_fullname("foo") == "foo"
+
+    # The walker writes into the namespaces without `Scope.set`.
+    n1["foo"] = 2
+
+    assert scope.get_fullname("foo") == "n1__foo"
+
+def test_get_fullname_deep():
+    scope = Scope()
+    scope.push(Namespace(), "")
+
+    for i in range(100):
+        scope.push(Namespace(), f"n{i}")
+
+    scope["foo"] = 1
+
+    expected = "__".join(f"n{i}" for i in range(100)) + "__foo"
+
+    assert scope.prefixes[-1] + "foo" == expected
+    assert scope.get_fullname("foo") == expected
+    assert scope.get_fullname("foo.bar") == expected + "__bar"
@@ -0,0 +1,151 @@
+import os
+import shutil
+
+import pytest
+
+from onemodel.onemodel_walker import OneModelWalker, load_file
+from onemodel.prototype import ModelPrototype
+from onemodel.snapshot import SNAPSHOT_MAGIC, load_snapshot
+
+examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+examples = [
+    "ex01_simple_gene_expression",
+    "ex03_protein_constitutive",
+    "ex05_protein_induced",
+    "ex06_antithetic_controller",
+]
+
+
+@pytest.fixture
+def copy_examples(tmpdir, monkeypatch):
+    for name in os.listdir(examples_dir):
+        if name.endswith(".one"):
+            shutil.copy(os.path.join(examples_dir, name), str(tmpdir))
+
+    monkeypatch.chdir(tmpdir)
+
+    return tmpdir
+
+
+@pytest.mark.parametrize("example", examples)
+def test_snapshot(copy_examples, example):
+    path = str(copy_examples / "model.snapshot")
+
+    onemodel = load_file(example + ".one")
+    onemodel.save_snapshot(path)
+
+    loaded = load_snapshot(path)
+
+    assert loaded is not None
+    assert loaded.get_SBML_string() == onemodel.get_SBML_string()
+
+
+def test_snapshot_evaluate(copy_examples):
+    path = str(copy_examples / "model.snapshot")
+
+    load_file("ex03_protein_constitutive.one").save_snapshot(path)
+    loaded = load_snapshot(path)
+
+    # The models of the snapshot can still be instantiated.
+    walker = OneModelWalker()
+    walker.onemodel = loaded
+    walker.run("C = ProteinConstitutive()")
+
+    assert "C__protein" in loaded.get_SBML_string()
+
+
+def test_snapshot_prototype(copy_examples, monkeypatch):
+    """The models of the snapshot are still instantiated from their prototype."""
+
+    path = str(copy_examples / "model.snapshot")
+
+    # The body of a model with a single statement is the AST of the
+    # statement, which is shared with its prototype.
+    (copy_examples / "single.one").write_text(
+        "model Single\n  species x = 1\nend\n\nA = Single()\n", encoding="utf-8"
+    )
+
+    load_file("single.one").save_snapshot(path)
+    loaded = load_snapshot(path)
+
+    model = loaded.root["Single"]
+    prototype = model.prototype
+
+    assert prototype is not None
+    assert model["body"] is prototype.body
+
+    instances = []
+    instantiate = ModelPrototype.instantiate
+
+    def spy(self, scope):
+        instances.append(self)
+        return instantiate(self, scope)
+
+    monkeypatch.setattr(ModelPrototype, "instantiate", spy)
+
+    walker = OneModelWalker()
+    walker.onemodel = loaded
+    walker.run("B = Single()")
+
+    assert instances == [prototype]
+    assert model.prototype is prototype
+    assert "B__x" in loaded.get_SBML_string()
+
+
+def test_snapshot_changed_source(copy_examples):
+    path = str(copy_examples / "model.snapshot")
+
+    load_file("ex05_protein_induced.one").save_snapshot(path)
+    assert load_snapshot(path) is not None
+
+    with open("ex05_protein_induced.one", "a") as file:
+        file.write("\nparameter z = 1\n")
+
+    assert load_snapshot(path) is None
+
+
+def test_snapshot_changed_import(copy_examples):
+    path = str(copy_examples / "model.snapshot")
+
+    load_file("ex05_protein_induced.one").save_snapshot(path)
+
+    with open("ex03_protein_constitutive.one", "a") as file:
+        file.write("\nparameter z = 1\n")
+
+    assert load_snapshot(path) is None
+
+
+def test_snapshot_invalid(copy_examples):
+    path = str(copy_examples / "model.snapshot")
+
+    assert load_snapshot(path) is None
+
+    with open(path, "wb") as file:
+        file.write(b"not a snapshot")
+
+    assert load_snapshot(path) is None
+
+    with open(path, "wb") as file:
+        file.write(SNAPSHOT_MAGIC + b"garbage")
+
+    assert load_snapshot(path) is None
+
+
+def test_load_file_snapshot(copy_examples, monkeypatch):
+    path = str(copy_examples / "model.snapshot")
+
+    onemodel = load_file("ex05_protein_induced.one", snapshot=path)
+    assert os.path.exists(path)
+
+    # The second load comes from the snapshot.
+    import onemodel.onemodel_walker as onemodel_walker
+
+    monkeypatch.setattr(onemodel_walker, "OneModelWalker", None)
+
+    loaded = load_file("ex05_protein_induced.one", snapshot=path)
+
+    assert loaded.get_SBML_string() == onemodel.get_SBML_string()
+
+    # A snapshot of another file is not used.
+    assert load_snapshot(path, "ex03_protein_constitutive.one") is None
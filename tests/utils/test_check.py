@@ -0,0 +1,102 @@
+import pytest
+
+from onemodel.onemodel import OneModel
+from onemodel.objects.parameter import Parameter
+from onemodel.utils.check import check, deferred_checks
+
+
+def test_check():
+    check(0, "do {}", "nothing")
+    check("an object", "create {}", "nothing")
+
+    with pytest.raises(SystemExit, match="null value trying to create foo"):
+        check(None, "create {}", "foo")
+
+    with pytest.raises(SystemExit, match="trying to set foo.*error code -1"):
+        check(-1, "set {}", "foo")
+
+    # Messages without arguments are not formatted.
+    with pytest.raises(SystemExit, match="set {}"):
+        check(-1, "set {}")
+
+
+def test_deferred_checks():
+    with pytest.raises(SystemExit) as e:
+        with deferred_checks() as failures:
+            check(0, "set {}", "a")
+            check(-1, "set {}", "b")
+            check(-2, "set {}", "c")
+
+            assert len(failures) == 2
+
+    message = str(e.value)
+
+    assert message.startswith("2 errors")
+    assert "set b" in message
+    assert "set c" in message
+
+    # Fail-fast mode is restored after the context.
+    with pytest.raises(SystemExit):
+        check(-1, "set {}", "d")
+
+
+def test_deferred_checks_null_value():
+    """A null value is raised right away, with the errors recorded before."""
+
+    with pytest.raises(SystemExit) as e:
+        with deferred_checks():
+            check(-1, "set {}", "a")
+            check(None, "create {}", "b")
+
+            pytest.fail("check did not raise")
+
+    message = str(e.value)
+
+    assert message.startswith("2 errors")
+    assert "set a" in message
+    assert "create b" in message
+
+
+def test_deferred_checks_exception():
+    with pytest.raises(SystemExit) as e:
+        with deferred_checks():
+            check(-1, "set {}", "a")
+            raise AttributeError("b")
+
+    assert "set a" in str(e.value)
+    assert isinstance(e.value.__cause__, AttributeError)
+
+    # Without failures, the exception is raised as is.
+    with pytest.raises(AttributeError):
+        with deferred_checks():
+            raise AttributeError("c")
+
+
+def test_deferred_checks_no_errors():
+    with deferred_checks() as failures:
+        check(0, "set {}", "a")
+
+    assert failures == []
+
+
+def test_export_modes():
+    m = OneModel()
+    m["k"] = Parameter()
+    m["k"]["units"] = "not a valid unit id"
+    m["p"] = Parameter()
+    m["p"]["units"] = "not valid either"
+
+    with pytest.raises(SystemExit) as e:
+        m.get_SBML_string(mode="debug")
+
+    assert "set parameter k units" in str(e.value)
+    assert "set parameter p units" not in str(e.value)
+
+    with pytest.raises(SystemExit) as e:
+        m.get_SBML_string(mode="release")
+
+    assert "set parameter k units" in str(e.value)
+    assert "set parameter p units" in str(e.value)
+
+    with pytest.raises(ValueError):
+        m.get_SBML_string(mode="fast")
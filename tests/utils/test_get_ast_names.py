@@ -0,0 +1,46 @@
+import sys
+
+from libsbml import parseL3Formula
+
+from onemodel.utils.get_ast_names import get_ast_names
+from onemodel.utils.get_ast_names import get_formula_names
+from onemodel.utils.get_ast_names import get_formula_fullnames
+from onemodel.utils.formula_2_ast import formula_2_ast
+from onemodel.utils.math_2_fullname import math_2_fullname
+from onemodel.onemodel import OneModel
+from onemodel.objects.object import Object
+from onemodel.objects.parameter import Parameter
+from onemodel.objects.species import Species
+from onemodel.scope import ExportScope
+
+def test_get_ast_names():
+    ast = parseL3Formula("k*TF/(TF + h) + pow(TF, 2) - exp(-k)")
+
+    assert get_ast_names(ast) == ["k", "TF", "h"]
+
+def test_get_ast_names_long_formula():
+    n = 2 * sys.getrecursionlimit()
+    formula = "-(" * n + "x" + ")" * n + " + y"
+
+    assert get_ast_names(parseL3Formula(formula)) == ["x", "y"]
+
+def test_get_formula_names():
+    result = get_formula_names("k*a.X + pow(k, 2) + a.b.c * pi")
+
+    assert result == (("k",), ("a", "X"), ("a", "b", "c"), ("pi",))
+    assert get_formula_names("k*a.X + pow(k, 2) + a.b.c * pi") is result
+    assert get_formula_names("1 +") == ()
+
+def test_get_formula_fullnames():
+    m = OneModel()
+    m["a"] = Object()
+    m["a"]["k"] = Parameter()
+    m["a"]["X"] = Species()
+
+    scope = ExportScope(m.root)
+    scope.push(m["a"], "a")
+
+    formula = "k*X + pow(k, 2) + pi*a.X"
+    expected = get_ast_names(formula_2_ast(math_2_fullname(formula, scope)))
+
+    assert get_formula_fullnames(formula, scope) == expected == ["a__k", "a__X", "a__a__X"]
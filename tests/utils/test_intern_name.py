@@ -0,0 +1,40 @@
+from onemodel.onemodel_walker import OneModelWalker
+from onemodel.onemodel import OneModel
+from onemodel.utils.intern_name import intern_name
+
+
+def test_intern_name():
+    name = "".join(["a", ".", "b"])
+
+    assert intern_name(name) is intern_name("a.b")
+    assert intern_name(None) is None
+
+
+def test_walker_names():
+    walker = OneModelWalker()
+    walker.run(
+        "species x, y\nparameter k\n"
+        "reaction J0: x -> y; k * x\n"
+        "reaction J1: x -> y; k * x\n"
+        "rule R0: y := k * x\n"
+        "rule R1: y := k * x\n"
+    )
+
+    m = walker.onemodel
+
+    assert m["J0"]["reactants"][0] is m["J1"]["reactants"][0]
+    assert m["J0"]["kinetic_law"] is m["J1"]["kinetic_law"]
+    assert m["R0"]["variable"] is m["R1"]["variable"]
+    assert m["R0"]["math"] is m["R1"]["math"]
+
+
+def test_fullnames():
+    m = OneModel()
+    m.push({"x": 1}, "a")
+    first = m.get_fullname("x")
+
+    # The inner namespace resolves the same fullname again.
+    m.push({}, "b")
+
+    assert m.get_fullname("x") == "a__x"
+    assert m.get_fullname("x") is first
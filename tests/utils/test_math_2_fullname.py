@@ -0,0 +1,103 @@
+import timeit
+from io import BytesIO
+from tokenize import ENCODING, NAME, tokenize
+
+import pytest
+
+from onemodel.namespace import Namespace
+from onemodel.scope import Scope
+from onemodel.utils.math_2_fullname import math_2_fullname
+from onemodel.utils.math_2_fullname import tokenize_formula
+
+def math_2_fullname_tokenize(math_expr, scope):
+    """The implementation of math_2_fullname based on the tokenize module."""
+    result = ""
+
+    g = tokenize(BytesIO(math_expr.encode("utf-8")).readline)
+
+    last_tokval = None
+
+    for toknum, tokval, _, _, _ in g:
+        if toknum == ENCODING:
+            continue
+
+        if str(last_tokval) == "." and toknum == NAME:
+            result = result[0:-1]
+            result += "__"
+
+        if toknum == NAME:
+            result += scope.get_fullname(str(tokval))
+        else:
+            result += str(tokval)
+
+        last_tokval = tokval
+
+    return str(result)
+
+@pytest.fixture
+def scope():
+    result = Scope()
+    result.push(Namespace(), "")
+    result["A"] = Namespace()
+    result["k_m"] = 1
+    result.push(Namespace(), "B")
+    result["TF"] = 1
+    result["h"] = 1
+    result["k_m_max"] = 1
+    result["protein"] = 1
+    return result
+
+formulas = [
+    "",
+    "k_m",
+    "k_m_max * TF/(TF+h)",
+    "d_m*mRNA     ",
+    "  TF + h",
+    "A.protein",
+    "gamma*z1.protein*z2.protein",
+    "A.B.protein",
+    "A.protein^2 + 1.5e-3*TF - .5",
+    "pow(TF, 2) + exp(-h) + 1e5 + 3.",
+    "k_m*2.h",
+    "TF >= h && h != 0 || h",
+    "x1*y_2 + _z",
+]
+
+@pytest.mark.parametrize("formula", formulas)
+def test_math_2_fullname(scope, formula):
+    result = math_2_fullname(formula, scope)
+    expected = math_2_fullname_tokenize(formula, scope)
+
+    assert result == expected
+
+def test_math_2_fullname_not(scope):
+    # The tokenize module keeps the whitespace before "!" (an error token).
+    assert math_2_fullname("TF || !h", scope) == "B__TF||!B__h"
+
+def test_tokenize_formula():
+    parts, name_indexes, names = tokenize_formula("a.b * a + 2")
+
+    assert parts == ("a", "__", "b", "*", "a", "+", "2")
+    assert name_indexes == (0, 2, 4)
+    assert names == ("a", "b")
+    assert tokenize_formula("a.b * a + 2") is tokenize_formula("a.b * a + 2")
+
+def test_math_2_fullname_benchmark(scope):
+    """Micro-benchmark of math_2_fullname against the tokenize implementation."""
+
+    def run(function):
+        for formula in formulas:
+            function(formula, scope)
+
+    number = 200
+    time_tokenize = min(timeit.repeat(
+        lambda: run(math_2_fullname_tokenize), repeat=3, number=number
+    ))
+    time_lexer = min(timeit.repeat(
+        lambda: run(math_2_fullname), repeat=3, number=number
+    ))
+
+    print(f"tokenize: {time_tokenize / number * 1e6:.1f} us")
+    print(f"lexer:    {time_lexer / number * 1e6:.1f} us")
+
+    assert time_lexer < time_tokenize